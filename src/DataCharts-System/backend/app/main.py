@@ -131,8 +131,13 @@ async def export_chart(chart_id: str):
     return {"message": f"图表导出接口 - ID: {chart_id}", "status": "实现待完成"}
 
 
+# 空闲keep-alive连接的保持时间（秒）：桌面端在用户操作间隙复用会话连接池中的连接，
+# uvicorn默认5秒即关闭空闲连接，会使下一次调用重新建立TCP连接
+KEEP_ALIVE_TIMEOUT = 75
+
+
 # 基础测试
 if __name__ == "__main__":
     import uvicorn
     print("DataCharts System Backend v0.1.0 启动中...")
-    uvicorn.run(app, host="0.0.0.0", port=8000)
\ No newline at end of file
+    uvicorn.run(app, host="0.0.0.0", port=8000, timeout_keep_alive=KEEP_ALIVE_TIMEOUT)
\ No newline at end of file
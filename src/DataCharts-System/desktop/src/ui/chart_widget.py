@@ -6,19 +6,61 @@
 
 import sys
 import os
+import json
+import queue
+import hashlib
+import logging
+import numbers
+import time
+import weakref
+from array import array
+from collections import deque
 from typing import Optional, Dict, Any, List
+import numpy as np
+import pandas as pd
 from PyQt6.QtWidgets import (
-    QWidget, QVBoxLayout, QHBoxLayout, QLabel, QPushButton,
+    QApplication, QWidget, QVBoxLayout, QHBoxLayout, QLabel, QPushButton,
     QGroupBox, QComboBox, QTabWidget, QScrollArea, QSpinBox,
-    QCheckBox, QSlider, QMessageBox, QSplitter, QLineEdit
+    QCheckBox, QSlider, QMessageBox, QSplitter, QLineEdit, QGraphicsItem
 )
-from PyQt6.QtCore import Qt, QThread, pyqtSignal
+from PyQt6.QtCore import Qt, QThread, pyqtSignal, QPointF
 from PyQt6.QtGui import QFont, QPainter
 from PyQt6.QtCharts import (
     QChart, QChartView, QLineSeries, QScatterSeries, QBarSeries,
     QBarSet, QPieSeries, QAreaSeries, QValueAxis, QCategoryAxis
 )
 
+try:
+    from PyQt6.QtOpenGLWidgets import QOpenGLWidget
+    OPENGL_AVAILABLE = True
+except ImportError:
+    OPENGL_AVAILABLE = False
+
+from utils.fonts import get_font
+
+logger = logging.getLogger("datacharts.desktop.ui.chart")
+
+# 图表结果缓存中保持强引用的最近条目数，其余条目在无外部引用时自动回收
+CHART_CACHE_STRONG_REFS = 4
+
+# 饼图扇区数与柱状图柱数上限，超出时按区间聚合
+PIE_MAX_SLICES = 10
+BAR_MAX_BARS = 50
+
+# 数据点超过该数量时自动禁用动画，逐点插值开销随点数线性增长
+ANIMATION_MAX_POINTS = 500
+
+# 坐标轴下拉框中的默认选项
+AUTO_INDEX_AXIS = "自动索引"
+ALL_DATA_AXIS = "全部数据"
+
+# 进度信号节流：进度变化不小于该百分比且距上次发送超过该间隔（秒）时才发送
+PROGRESS_MIN_STEP = 5
+PROGRESS_MIN_INTERVAL = 0.033
+
+# 后端可用状态的缓存有效期（秒）
+BACKEND_PROBE_TTL = 5.0
+
 # 添加共享模块路径
 shared_path = os.path.abspath(os.path.join(os.path.dirname(__file__), '..', '..', '..', 'shared'))
 if shared_path not in sys.path:
@@ -30,7 +72,7 @@ try:
     from data_types import DataSource
 except ImportError as e:
     # 创建占位符
-    print(f"警告: 共享模块未找到，使用占位符实现 (错误: {e})")
+    logger.warning("共享模块未找到，使用占位符实现: %s", e)
     class ChartFactory:
         def create_chart(self, chart_type: str, data: Any, config: dict) -> dict:
             return {"status": "placeholder", "chart": None}
@@ -43,60 +85,416 @@ except ImportError as e:
             return ["line", "scatter", "bar", "pie", "area"]
 
 
+class CachedChartView(QChartView):
+    """
+    启用图形项缓存的图表视图
+
+    图表中的图形项使用设备坐标缓存，内容未变化的项重绘时直接复用光栅化结果；
+    视图本身照常绘制场景，橡皮筋缩放等交互反馈不受影响
+    """
+    
+    # 是否为图表内的图形项启用设备坐标缓存（以内存换取重绘速度）
+    ITEM_DEVICE_CACHE = True
+    
+    def __init__(self, chart: Optional[QChart] = None, parent=None):
+        super().__init__(parent)
+        if chart is not None:
+            self.setChart(chart)
+    
+    def setChart(self, chart: QChart):
+        """设置图表并为其图形项启用缓存"""
+        super().setChart(chart)
+        if self.ITEM_DEVICE_CACHE:
+            self.enable_item_cache()
+    
+    def set_opengl(self, enabled: bool):
+        """切换OpenGL视口，OpenGL不可用时始终使用普通视口；切换后按新视口重新设置图形项缓存"""
+        self.setViewport(QOpenGLWidget() if enabled and OPENGL_AVAILABLE else QWidget())
+        if self.ITEM_DEVICE_CACHE:
+            self.enable_item_cache()
+    
+    def enable_item_cache(self):
+        """
+        为场景中的图形项启用设备坐标缓存，内容未变化时直接复用光栅化结果
+
+        OpenGL视口下不使用缓存：图形项由GPU直接绘制，软件光栅化的缓存图像反而要逐帧上传为纹理
+        """
+        opengl = OPENGL_AVAILABLE and isinstance(self.viewport(), QOpenGLWidget)
+        mode = QGraphicsItem.CacheMode.NoCache if opengl else QGraphicsItem.CacheMode.DeviceCoordinateCache
+        for item in self.scene().items():
+            item.setCacheMode(mode)
+
+
+def numeric_matrix(data: Dict[str, Any]) -> Optional[np.ndarray]:
+    """
+    将导入数据转换为float64数组，供绘图时按视图切片
+
+    简单数值列表返回一维数组；多列数据返回前两列组成的二维数组（图表最多使用两列）
+
+    Args:
+        data: 导入结果字典，优先使用其中的列式数据columns
+
+    Returns:
+        Optional[np.ndarray]: 转换结果，数据非纯数值时返回None
+    """
+    dataset = data.get("data", [])
+    if not isinstance(dataset, (list, pd.DataFrame)) or len(dataset) == 0:
+        return None
+    is_list = isinstance(dataset, list)
+    
+    try:
+        if is_list and isinstance(dataset[0], numbers.Real):
+            # 整体转换成功即说明是同质的一维数值数据（含NumPy标量），否则回退到逐行处理
+            arr = np.asarray(dataset, dtype=np.float64)
+            return arr if arr.ndim == 1 else None
+        
+        columns = data.get("columns")
+        if columns:
+            selected = list(columns.values())[:2]
+            return np.column_stack([np.asarray(col, dtype=np.float64) for col in selected])
+        
+        if is_list and isinstance(dataset[0], (list, tuple)):
+            arr = np.asarray(dataset, dtype=np.float64)
+            return arr[:, :2] if arr.ndim == 2 else None
+    except (TypeError, ValueError):
+        pass
+    return None
+
+
+def _bucket_edges(length: int, n_buckets: int) -> np.ndarray:
+    """将长度为length的序列均匀划分为n_buckets个区间，返回区间边界"""
+    return np.linspace(0, length, n_buckets + 1, dtype=int)
+
+
+def _aggregate_1d(values: np.ndarray, n_buckets: int, average: bool = True) -> np.ndarray:
+    """
+    将一维数据聚合到不超过n_buckets个区间
+
+    Args:
+        values: 一维数值数组
+        n_buckets: 区间数
+        average: True时取区间均值，False时取区间和
+
+    Returns:
+        np.ndarray: 聚合结果，数据量不超过区间数时原样返回
+    """
+    values = np.asarray(values, dtype=np.float64)
+    if len(values) <= n_buckets:
+        return values
+    
+    if len(values) % n_buckets == 0:
+        grouped = values.reshape(n_buckets, -1)
+        return grouped.mean(axis=1) if average else grouped.sum(axis=1)
+    
+    edges = _bucket_edges(len(values), n_buckets)
+    sums = np.add.reduceat(values, edges[:-1])
+    return sums / np.diff(edges) if average else sums
+
+
+def _pie_labels(prefix: str, length: int) -> List[str]:
+    """生成饼图扇区标签，聚合时标注每个扇区覆盖的数据项范围"""
+    if length <= PIE_MAX_SLICES:
+        return [f"{prefix}{i+1}" for i in range(length)]
+    edges = _bucket_edges(length, PIE_MAX_SLICES)
+    return [f"{prefix}{lo+1}-{hi}" for lo, hi in zip(edges[:-1], edges[1:])]
+
+
+def _value_range(values: Any) -> Optional[tuple]:
+    """
+    计算坐标轴范围，忽略NaN/Inf
+
+    Args:
+        values: 一维数值缓冲区（ndarray、array('d')或列表）
+
+    Returns:
+        Optional[tuple]: (最小值, 最大值)，没有有效数值时返回None
+    """
+    arr = np.asarray(values, dtype=np.float64)
+    if arr.size == 0:
+        return None
+    lo, hi = arr.min(), arr.max()
+    if not (np.isfinite(lo) and np.isfinite(hi)):
+        arr = arr[np.isfinite(arr)]
+        if arr.size == 0:
+            return None
+        lo, hi = arr.min(), arr.max()
+    if lo == hi:
+        # 所有值相同时扩展范围，避免坐标轴退化
+        lo, hi = lo - 0.5, hi + 0.5
+    return float(lo), float(hi)
+
+
+def _resolve_axis_key(first: Any, name: str) -> Any:
+    """将坐标轴下拉框中的列名解析为数据行中的键或下标，无法解析时返回None"""
+    if isinstance(first, dict):
+        return name if name in first else None
+    if isinstance(first, (list, tuple)) and name.startswith("列"):
+        try:
+            index = int(name[1:]) - 1
+        except ValueError:
+            return None
+        return index if 0 <= index < len(first) else None
+    return None
+
+
+def _xy_by_row(rows: List[Any], k0: Any, k1: Any, index_x: bool) -> tuple:
+    """
+    逐行取出x/y数值，跳过缺少取值位置的行（如比首行短的行或缺少所选键的记录）
+
+    Args:
+        rows: 数据行
+        k0: X值的键或下标
+        k1: Y值的键或下标
+        index_x: True时X值使用行号
+
+    Returns:
+        tuple: (xs, ys) 两个array('d')缓冲区
+    """
+    xs, ys = array('d'), array('d')
+    for i, item in enumerate(rows):
+        try:
+            x = float(i) if index_x else float(item[k0])
+            y = float(item[k1])
+        except (IndexError, KeyError):
+            continue
+        xs.append(x)
+        ys.append(y)
+    return xs, ys
+
+
+def prepare_series_data(chart_type: str, dataset: Any, start_idx: int, end_idx: int,
+                        array_data: Optional[np.ndarray] = None,
+                        axes: Optional[tuple] = None) -> Dict[str, Any]:
+    """
+    准备本地Qt图表的序列数据
+
+    只做纯Python/数值处理，不创建任何Qt对象，可在工作线程中调用
+
+    Args:
+        chart_type: 图表类型
+        dataset: 原始数据行（记录列表或DataFrame）
+        start_idx: 起始索引
+        end_idx: 结束索引
+        array_data: numeric_matrix转换得到的数值数组，提供时折线/散点/柱状图直接按视图切片
+        axes: 用户选择的(X轴, Y轴)列名，均为默认选项时按前两列绘制
+
+    Returns:
+        dict: 包含chart_type、count以及x/y或labels/values数值缓冲区
+    """
+    custom_axes = axes is not None and tuple(axes) != (AUTO_INDEX_AXIS, ALL_DATA_AXIS)
+    if array_data is not None and not custom_axes and chart_type in ("line", "scatter", "bar"):
+        sub = array_data[start_idx:end_idx]  # 视图切片，不复制数据
+        series_data = {"chart_type": chart_type, "count": len(sub)}
+        if chart_type == "bar":
+            column = sub if sub.ndim == 1 else sub[:, 0]
+            series_data["values"] = _aggregate_1d(column, BAR_MAX_BARS).tolist()
+        elif sub.ndim == 1:
+            series_data["x"] = np.arange(len(sub), dtype=np.float64).tolist()
+            series_data["y"] = sub.tolist()
+            series_data["x_range"] = _value_range((0, len(sub) - 1)) if len(sub) else None
+            series_data["y_range"] = _value_range(sub)
+        elif sub.shape[1] >= 2:
+            series_data["x"] = sub[:, 0].tolist()
+            series_data["y"] = sub[:, 1].tolist()
+            series_data["x_range"] = _value_range(sub[:, 0])
+            series_data["y_range"] = _value_range(sub[:, 1])
+        return series_data
+    
+    end_idx = min(end_idx, len(dataset))
+    if isinstance(dataset, pd.DataFrame):
+        # DataFrame只将所选范围内的行展开为记录
+        display_data = dataset.iloc[start_idx:end_idx].to_dict('records')
+    else:
+        display_data = dataset[start_idx:end_idx]
+    series_data = {"chart_type": chart_type, "count": len(display_data)}
+    if not display_data:
+        return series_data
+
+    # 按首行确定数据格式与取值位置，循环内不再逐项判断类型或创建临时列表
+    first = display_data[0]
+    if isinstance(first, numbers.Real):
+        kind = "scalar"
+    elif isinstance(first, (list, tuple)) and len(first) >= 1:
+        kind = "sequence"
+        k0, k1 = 0, 1
+    elif isinstance(first, dict) and len(first) >= 1:
+        kind = "dict"
+        keys = list(first)[:2]
+        k0, k1 = keys[0], keys[-1]
+    else:
+        return series_data
+
+    # 按用户选择的坐标轴列取值；只选Y轴时X轴使用自动索引
+    index_x = False
+    value_key = None
+    if custom_axes and kind != "scalar":
+        x_key = _resolve_axis_key(first, axes[0])
+        y_key = _resolve_axis_key(first, axes[1])
+        if x_key is not None:
+            k0 = x_key
+        if y_key is not None:
+            k1 = value_key = y_key
+            index_x = x_key is None
+    if value_key is None and kind != "scalar":
+        value_key = k0
+
+    if chart_type in ("line", "scatter"):
+        try:
+            if kind == "scalar":
+                xs = array('d', range(len(display_data)))
+                ys = array('d', [float(item) for item in display_data])
+            elif index_x:
+                xs = array('d', range(len(display_data)))
+                ys = array('d', [float(item[k1]) for item in display_data])
+            elif len(first) >= 2:
+                xs = array('d', [float(item[k0]) for item in display_data])
+                ys = array('d', [float(item[k1]) for item in display_data])
+            else:
+                xs, ys = array('d'), array('d')
+        except (IndexError, KeyError):
+            # 格式只按首行判断，后续行缺少取值位置时回退到逐行处理
+            xs, ys = _xy_by_row(display_data, k0, k1, index_x)
+        series_data["x"] = xs
+        series_data["y"] = ys
+        # array('d')支持缓冲区协议，np.asarray不复制数据
+        series_data["x_range"] = _value_range(xs)
+        series_data["y_range"] = _value_range(ys)
+
+    elif chart_type in ("bar", "pie"):
+        if kind == "scalar":
+            values = np.fromiter((float(item) for item in display_data), dtype=np.float64, count=len(display_data))
+        else:
+            try:
+                values = np.fromiter((float(item[value_key]) for item in display_data), dtype=np.float64, count=len(display_data))
+            except (IndexError, KeyError):
+                values = np.asarray(_xy_by_row(display_data, value_key, value_key, True)[1])
+        
+        if chart_type == "bar":
+            series_data["values"] = _aggregate_1d(values, BAR_MAX_BARS).tolist()
+        else:
+            # 饼图按区间求和，保证各扇区占比与原始数据一致
+            prefix = f"{value_key} " if kind == "dict" else "项目"
+            series_data["labels"] = _pie_labels(prefix, len(values))
+            series_data["values"] = _aggregate_1d(values, PIE_MAX_SLICES, average=False).tolist()
+
+    return series_data
+
+
+class ChartResult:
+    """图表结果包装，使结果字典可以被弱引用缓存"""
+    
+    __slots__ = ("data", "__weakref__")
+    
+    def __init__(self, data: Dict[str, Any]):
+        self.data = data
+
+
+def build_points(series_data: Dict[str, Any]) -> List[QPointF]:
+    """将x/y缓冲区转换为QPointF列表，map直接在C层逐对构造，无需Python循环体"""
+    return list(map(QPointF, series_data.get("x", ()), series_data.get("y", ())))
+
+
 class ChartGeneratorWorker(QThread):
-    """图表生成工作线程"""
+    """
+    图表生成工作线程
+
+    常驻线程，通过任务队列依次处理图表生成请求，避免每次生成都创建新线程
+    """
     
     progress = pyqtSignal(int)
     finished = pyqtSignal(object)
     error = pyqtSignal(str)
     
-    def __init__(self, chart_type: str, data: Any, config: Dict, use_backend: bool = False, api_manager=None):
+    def __init__(self, api_manager=None):
         super().__init__()
-        self.chart_type = chart_type
-        self.data = data
-        self.config = config
-        self.use_backend = use_backend
         self.api_manager = api_manager
         self.factory = ChartFactory()
+        self._queue: "queue.Queue[Optional[tuple]]" = queue.Queue()
+        self._last_emit_ts = 0.0
+        self._last_emit_val = -100
+    
+    def submit(self, chart_type: str, data: Any, config: Dict, use_backend: bool = False,
+               array_data: Optional[np.ndarray] = None):
+        """提交图表生成任务，线程未运行时自动启动"""
+        self._queue.put((chart_type, data, config, use_backend, array_data))
+        if not self.isRunning():
+            self.start()
+    
+    def stop(self):
+        """结束线程并等待退出"""
+        if self.isRunning():
+            self._queue.put(None)
+            self.wait()
     
     def run(self):
+        """循环处理任务队列，收到None时退出"""
+        while True:
+            job = self._queue.get()
+            if job is None:
+                return
+            self.generate(*job)
+    
+    def _report_progress(self, value: int):
+        """节流发送进度信号，避免跨线程信号过于频繁；100%总是发送"""
+        now = time.monotonic()
+        if value >= 100 or (value - self._last_emit_val >= PROGRESS_MIN_STEP and
+                            now - self._last_emit_ts >= PROGRESS_MIN_INTERVAL):
+            self.progress.emit(value)
+            self._last_emit_val = value
+            self._last_emit_ts = now
+    
+    def generate(self, chart_type: str, data: Any, config: Dict, use_backend: bool,
+                 array_data: Optional[np.ndarray]):
         """执行图表生成"""
+        self._last_emit_ts = 0.0
+        self._last_emit_val = -100
         try:
-            self.progress.emit(30)
+            self._report_progress(30)
             
             # 如果启用后端且后端可用，尝试使用后端生成图表
-            if (self.use_backend and 
-                self.api_manager and 
-                self.api_manager.is_backend_available()):
+            if use_backend and self.api_manager:
                 
                 try:
                     chart_config = {
-                        "type": self.chart_type,
-                        "data": self.data,
-                        "config": self.config
+                        "type": chart_type,
+                        "data": data,
+                        "config": config
                     }
                     
                     result = self.api_manager.get_client().create_chart(chart_config)
                     
                     if result.get("status") == "success":
-                        self.progress.emit(100)
+                        self._report_progress(100)
                         chart_result = result.get("data", {})
                         chart_result["backend_used"] = True
                         self.finished.emit(chart_result)
                         return
                     else:
-                        print(f"后端图表生成失败，降级到本地生成: {result.get('message')}")
+                        logger.warning("后端图表生成失败，降级到本地生成: %s", result.get('message'))
                         
                 except Exception as e:
-                    print(f"后端API调用异常，降级到本地生成: {str(e)}")
+                    logger.warning("后端API调用异常，降级到本地生成: %s", e)
             
             # 本地生成图表
-            self.progress.emit(50)
-            result = self.factory.create_chart(self.chart_type, self.data, self.config)
-            self.progress.emit(80)
+            self._report_progress(50)
+            result = self.factory.create_chart(chart_type, data, config)
+            self._report_progress(80)
             
             if result.get("status") == "success":
-                self.progress.emit(100)
+                # 在工作线程中准备序列数据，主线程只负责批量写入
+                dataset = data.get("data", []) if isinstance(data, dict) else []
+                result["series_data"] = prepare_series_data(
+                    chart_type, dataset,
+                    config.get("start_index", 0),
+                    config.get("end_index", len(dataset)),
+                    array_data,
+                    (config.get("x_axis", AUTO_INDEX_AXIS), config.get("y_axis", ALL_DATA_AXIS))
+                )
+                # QPointF为值类型，可在工作线程中预先构建，主线程只需一次replace
+                series_data = result["series_data"]
+                if "x" in series_data:
+                    series_data["points"] = build_points(series_data)
+                self._report_progress(100)
                 result["backend_used"] = False
                 self.finished.emit(result)
             else:
@@ -118,8 +516,34 @@ class ChartWidget(QWidget):
         self.current_data = None
         self.current_chart = None
         self.chart_manager = ChartManager()
+        # 按配置摘要缓存图表结果，相同配置重复生成时直接复用
+        self._chart_cache: "weakref.WeakValueDictionary[str, ChartResult]" = weakref.WeakValueDictionary()
+        self._recent_charts: deque = deque(maxlen=CHART_CACHE_STRONG_REFS)
+        self._data_version = 0
+        self._pending_chart_key = None
+        self._np_data = None
+        self._sample_chart = None
+        # 当前显示的可复用折线/散点图表
+        self._live_chart = None
+        self._live_chart_type = None
+        self._live_series = None
+        self._x_axis = None
+        self._y_axis = None
+        # 后端可用状态缓存，None表示尚未探测
+        self._backend_probe_ts = 0.0
+        self._backend_probe_val = None
         self.init_ui()
         self.create_sample_chart()
+        
+        # 常驻图表生成线程，信号只连接一次
+        self.worker = ChartGeneratorWorker(self.api_manager)
+        self.worker.progress.connect(self.progress_bar.setValue)
+        self.worker.finished.connect(self.on_chart_finished)
+        self.worker.error.connect(self.on_chart_error)
+        app = QApplication.instance()
+        if app is not None:
+            # 子控件不会收到closeEvent，退出应用时也需要结束线程
+            app.aboutToQuit.connect(self.worker.stop)
     
     def init_ui(self):
         """初始化用户界面"""
@@ -142,7 +566,7 @@ class ChartWidget(QWidget):
         backend_layout.addWidget(self.use_backend_check)
         
         self.backend_status_label = QLabel("")
-        self.backend_status_label.setFont(QFont("Arial", 9))
+        self.backend_status_label.setFont(get_font("Arial", 9))
         backend_layout.addWidget(self.backend_status_label)
         
         config_layout.addWidget(backend_group)
@@ -234,6 +658,12 @@ class ChartWidget(QWidget):
         self.animation_check.setChecked(True)
         style_layout.addWidget(self.animation_check)
         
+        # 显卡驱动异常时可关闭OpenGL加速
+        self.opengl_check = QCheckBox("OpenGL加速")
+        self.opengl_check.setChecked(OPENGL_AVAILABLE)
+        self.opengl_check.setEnabled(OPENGL_AVAILABLE)
+        style_layout.addWidget(self.opengl_check)
+        
         config_layout.addWidget(style_group)
         
         # 操作按钮
@@ -272,20 +702,20 @@ class ChartWidget(QWidget):
         # 图表信息
         info_layout = QHBoxLayout()
         self.chart_info = QLabel("暂无图表")
-        self.chart_info.setFont(QFont("Arial", 12))
+        self.chart_info.setFont(get_font("Arial", 12))
         self.chart_info.setAlignment(Qt.AlignmentFlag.AlignCenter)
         info_layout.addWidget(self.chart_info)
         
         # 图表生成状态
         self.generation_status_label = QLabel("")
-        self.generation_status_label.setFont(QFont("Arial", 9))
+        self.generation_status_label.setFont(get_font("Arial", 9))
         info_layout.addWidget(self.generation_status_label)
         info_layout.addStretch()
         
         chart_layout.addLayout(info_layout)
         
         # 图表视图
-        self.chart_view = QChartView()
+        self.chart_view = CachedChartView()
         self.chart_view.setRenderHint(QPainter.RenderHint.Antialiasing)
         self.chart_view.setStyleSheet("""
             QChartView {
@@ -294,6 +724,8 @@ class ChartWidget(QWidget):
                 background-color: white;
             }
         """)
+        self.chart_view.set_opengl(self.opengl_check.isChecked())
+        self.opengl_check.toggled.connect(self.chart_view.set_opengl)
         chart_layout.addWidget(self.chart_view)
         
         # 添加到分割器
@@ -325,62 +757,92 @@ class ChartWidget(QWidget):
             self.x_axis_combo.setEnabled(True)
             self.y_axis_combo.setEnabled(True)
     
-    def update_backend_status(self):
-        """更新后端状态显示"""
-        if self.api_manager and self.api_manager.is_backend_available():
+    def update_backend_status(self) -> bool:
+        """
+        更新后端状态显示
+
+        探测结果在BACKEND_PROBE_TTL秒内直接复用，状态未变化时不重新设置样式
+
+        Returns:
+            bool: 后端是否可用
+        """
+        now = time.monotonic()
+        if self._backend_probe_val is not None and now - self._backend_probe_ts <= BACKEND_PROBE_TTL:
+            return self._backend_probe_val
+        
+        available = bool(self.api_manager and self.api_manager.is_backend_available())
+        self._backend_probe_ts = now
+        if available == self._backend_probe_val:
+            return available
+        self._backend_probe_val = available
+        
+        if available:
             self.backend_status_label.setText("77 后端可用")
             self.backend_status_label.setStyleSheet("color: green; font-weight: bold;")
         else:
             self.backend_status_label.setText("72 后端不可用")
             self.backend_status_label.setStyleSheet("color: orange; font-weight: bold;")
+        return available
     
     def create_sample_chart(self):
-        """创建示例图表"""
-        # 创建简单的折线图示例
-        chart = QChart()
-        chart.setTitle("示例图表 - 请导入数据并生成图表")
-        chart.setAnimationOptions(QChart.AnimationOption.SeriesAnimations)
-        
-        # 创建示例数据
-        series = QLineSeries()
-        for i in range(10):
-            series.append(i, i * i)
-        
-        chart.addSeries(series)
-        chart.createDefaultAxes()
-        chart.legend().setVisible(False)
-        
-        self.chart_view.setChart(chart)
+        """创建示例图表（仅首次构建，之后复用同一实例）"""
+        if self._sample_chart is None:
+            # 创建简单的折线图示例
+            chart = QChart()
+            chart.setTitle("示例图表 - 请导入数据并生成图表")
+            chart.setAnimationOptions(QChart.AnimationOption.SeriesAnimations)
+            
+            # 创建示例数据
+            series = QLineSeries()
+            series.replace([QPointF(i, i * i) for i in range(10)])
+            
+            chart.addSeries(series)
+            chart.createDefaultAxes()
+            chart.legend().setVisible(False)
+            
+            # 保持强引用，切换到其他图表时示例图表不会被释放
+            self._sample_chart = chart
+        
+        self.chart_view.setChart(self._sample_chart)
         self.chart_info.setText("示例图表 - 请导入数据并生成图表")
     
     def set_data(self, data):
         """设置当前数据"""
         self.current_data = data
+        self._data_version += 1
+        self._chart_cache.clear()
+        self._recent_charts.clear()
+        
+        self._np_data = None
         
         if data and data.get("status") == "success":
             dataset = data.get("data", [])
+            # 纯数值数据预先转换为数组，生成图表时按视图切片
+            self._np_data = numeric_matrix(data)
             
             # 更新数据选择选项
-            self.x_axis_combo.clear()
-            self.y_axis_combo.clear()
-            
-            self.x_axis_combo.addItem("自动索引")
-            self.y_axis_combo.addItem("全部数据")
-            
-            if dataset and isinstance(dataset, list) and len(dataset) > 0:
+            column_names = []
+            has_rows = isinstance(dataset, (list, pd.DataFrame)) and len(dataset) > 0
+            if isinstance(dataset, pd.DataFrame):
+                column_names = [str(col) for col in dataset.columns]
+            elif has_rows:
                 if isinstance(dataset[0], dict):
                     # 字典格式数据
-                    keys = list(dataset[0].keys())
-                    for key in keys:
-                        self.x_axis_combo.addItem(key)
-                        self.y_axis_combo.addItem(key)
+                    column_names = [str(key) for key in dataset[0].keys()]
                 elif isinstance(dataset[0], (list, tuple)):
                     # 列表格式数据
-                    for i in range(len(dataset[0])):
-                        column_name = f"列{i+1}"
-                        self.x_axis_combo.addItem(column_name)
-                        self.y_axis_combo.addItem(column_name)
-                
+                    column_names = [f"列{i+1}" for i in range(len(dataset[0]))]
+            
+            # 批量填充下拉框，填充期间屏蔽信号和重绘
+            for combo, default in ((self.x_axis_combo, AUTO_INDEX_AXIS), (self.y_axis_combo, ALL_DATA_AXIS)):
+                combo.blockSignals(True)
+                combo.setUpdatesEnabled(False)
+                combo.clear()
+                combo.addItems([default] + column_names)
+                combo.setUpdatesEnabled(True)
+                combo.blockSignals(False)
+            
+            if has_rows:
                 # 更新数据范围
                 self.end_spin.setMaximum(len(dataset))
                 self.end_spin.setValue(min(100, len(dataset)))
@@ -397,7 +859,7 @@ class ChartWidget(QWidget):
             QMessageBox.warning(self, "警告", "请先导入数据")
             return
         
-        self.update_backend_status()
+        backend_available = self.update_backend_status()
         
         # 获取配置
         chart_type = self.chart_type_combo.currentData()
@@ -412,24 +874,55 @@ class ChartWidget(QWidget):
             "end_index": self.end_spin.value()
         }
         
+        # 工作线程直接使用此处的探测结果，不再重复检查后端状态
+        use_backend = self.use_backend_check.isChecked() and backend_available
+        
+        # 相同数据与配置已生成过时直接复用结果
+        key = self._chart_cache_key(chart_type, config, use_backend)
+        cached = self._chart_cache.get(key)
+        if cached is not None:
+            self._remember_chart(cached)
+            self._pending_chart_key = None
+            self.on_chart_finished(cached.data)
+            return
+        self._pending_chart_key = key
+        
         # 显示进度条
         self.progress_bar.setVisible(True)
         self.progress_bar.setValue(0)
         self.generate_button.setEnabled(False)
         
-        # 创建并启动工作线程
-        use_backend = self.use_backend_check.isChecked()
-        self.worker = ChartGeneratorWorker(chart_type, self.current_data, config, use_backend, self.api_manager)
-        self.worker.progress.connect(self.progress_bar.setValue)
-        self.worker.finished.connect(self.on_chart_finished)
-        self.worker.error.connect(self.on_chart_error)
-        self.worker.start()
+        # 提交到常驻工作线程
+        self.worker.submit(chart_type, self.current_data, config, use_backend, self._np_data)
+    
+    def _chart_cache_key(self, chart_type: str, config: Dict, use_backend: bool) -> str:
+        """根据图表类型、配置和数据版本计算缓存键"""
+        state = {
+            "t": chart_type,
+            "c": config,
+            "b": use_backend,
+            "d_id": id(self.current_data),
+            "d_ver": self._data_version
+        }
+        payload = json.dumps(state, sort_keys=True, ensure_ascii=False).encode("utf-8")
+        return hashlib.blake2b(payload, digest_size=16).hexdigest()
+    
+    def _remember_chart(self, entry: ChartResult):
+        """将结果移到强引用队列末尾，保证最近使用的结果不被回收"""
+        if entry in self._recent_charts:
+            self._recent_charts.remove(entry)
+        self._recent_charts.append(entry)
     
     def on_chart_finished(self, result):
         """图表生成完成处理"""
         self.progress_bar.setVisible(False)
         self.generate_button.setEnabled(True)
         
+        if self._pending_chart_key is not None:
+            entry = ChartResult(result)
+            self._chart_cache[self._pending_chart_key] = entry
+            self._remember_chart(entry)
+        
         # 如果是后端生成的图表，显示占位符
         if result.get("backend_used"):
             self.generation_status_label.setText("77 后端生成")
@@ -445,7 +938,7 @@ class ChartWidget(QWidget):
             self.generation_status_label.setStyleSheet("color: #666; font-weight: normal;")
             
             # 本地生成Qt图表
-            self.generate_qt_chart_local()
+            self.generate_qt_chart_local(result.get("series_data"))
         
         self.current_chart = result
         self.export_button.setEnabled(True)
@@ -463,65 +956,71 @@ class ChartWidget(QWidget):
         
         QMessageBox.critical(self, "错误", f"图表生成失败：\n{error_msg}")
     
-    def generate_qt_chart_local(self):
-        """生成本地Qt图表"""
+    def generate_qt_chart_local(self, series_data: Optional[Dict[str, Any]] = None):
+        """
+        生成本地Qt图表
+
+        Args:
+            series_data: 工作线程准备好的序列数据，为空时在主线程中准备
+        """
         try:
             dataset = self.current_data.get("data", [])
-            if not dataset:
+            if dataset is None or len(dataset) == 0:
                 return
             
-            chart_type = self.chart_type_combo.currentData()
+            if series_data is None:
+                series_data = prepare_series_data(
+                    self.chart_type_combo.currentData(), dataset,
+                    self.start_spin.value(), self.end_spin.value(),
+                    self._np_data,
+                    (self.x_axis_combo.currentText(), self.y_axis_combo.currentText())
+                )
+            chart_type = series_data["chart_type"]
             
-            chart = QChart()
+            # 折线/散点图类型未变且当前正在显示时复用已有图表，只替换数据点和坐标轴范围
+            reuse = (chart_type in ("line", "scatter") and
+                     self._live_chart is not None and
+                     self._live_chart_type == chart_type and
+                     self.chart_view.chart() is self._live_chart)
+            
+            chart = self._live_chart if reuse else QChart()
             chart.setTitle(self.title_edit.text())
             
-            if self.animation_check.isChecked():
+            point_count = len(series_data.get("x", series_data.get("values", ())))
+            if self.animation_check.isChecked() and point_count <= ANIMATION_MAX_POINTS:
                 chart.setAnimationOptions(QChart.AnimationOption.SeriesAnimations)
+            else:
+                chart.setAnimationOptions(QChart.AnimationOption.NoAnimation)
+                if self.animation_check.isChecked():
+                    logger.info("数据点数 %d 超过 %d，已禁用图表动画", point_count, ANIMATION_MAX_POINTS)
+                    self.generation_status_label.setText("大数据集：动画已禁用")
             
-            # 准备数据
-            start_idx = self.start_spin.value()
-            end_idx = min(self.end_spin.value(), len(dataset))
-            display_data = dataset[start_idx:end_idx]
-            
-            if chart_type == "line":
-                series = QLineSeries()
-                for i, item in enumerate(display_data):
-                    if isinstance(item, (int, float)):
-                        series.append(i, float(item))
-                    elif isinstance(item, (list, tuple)) and len(item) >= 2:
-                        series.append(float(item[0]), float(item[1]))
-                    elif isinstance(item, dict) and len(item) >= 2:
-                        values = list(item.values())
-                        series.append(float(values[0]), float(values[1]))
+            if chart_type in ("line", "scatter"):
+                if reuse:
+                    series = self._live_series
+                elif chart_type == "line":
+                    series = QLineSeries()
+                else:
+                    series = QScatterSeries()
+                    series.setMarkerSize(10)
                 
-                chart.addSeries(series)
+                # 折线/散点序列支持OpenGL绘制，绕过图形场景直接渲染
+                series.setUseOpenGL(self.opengl_check.isChecked())
                 
-            elif chart_type == "scatter":
-                series = QScatterSeries()
-                series.setMarkerSize(10)
-                for i, item in enumerate(display_data):
-                    if isinstance(item, (int, float)):
-                        series.append(i, float(item))
-                    elif isinstance(item, (list, tuple)) and len(item) >= 2:
-                        series.append(float(item[0]), float(item[1]))
-                    elif isinstance(item, dict) and len(item) >= 2:
-                        values = list(item.values())
-                        series.append(float(values[0]), float(values[1]))
-                
-                chart.addSeries(series)
+                # 一次性替换全部数据点，避免逐点append触发大量信号
+                points = series_data.get("points")
+                if points is None:
+                    points = build_points(series_data)
+                series.replace(points)
+                if not reuse:
+                    chart.addSeries(series)
                 
             elif chart_type == "bar":
                 series = QBarSeries()
                 bar_set = QBarSet("数据")
                 
-                for item in display_data:
-                    if isinstance(item, (int, float)):
-                        bar_set.append(float(item))
-                    elif isinstance(item, (list, tuple)) and len(item) >= 1:
-                        bar_set.append(float(item[0]))
-                    elif isinstance(item, dict) and len(item) >= 1:
-                        value = list(item.values())[0]
-                        bar_set.append(float(value))
+                # 使用列表重载一次性写入全部数值
+                bar_set.append(list(series_data.get("values", ())))
                 
                 series.append(bar_set)
                 chart.addSeries(series)
@@ -529,20 +1028,22 @@ class ChartWidget(QWidget):
             elif chart_type == "pie":
                 series = QPieSeries()
                 
-                for i, item in enumerate(display_data[:10]):  # 限制饼图片数
-                    if isinstance(item, (int, float)):
-                        series.append(f"项目{i+1}", float(item))
-                    elif isinstance(item, (list, tuple)) and len(item) >= 1:
-                        series.append(f"项目{i+1}", float(item[0]))
-                    elif isinstance(item, dict):
-                        for key, value in item.items():
-                            series.append(str(key), float(value))
-                            break
+                for label, value in zip(series_data.get("labels", ()), series_data.get("values", ())):
+                    series.append(label, value)
                 
                 chart.addSeries(series)
             
-            # 创建默认坐标轴
-            if chart_type != "pie":
+            # 折线/散点图使用工作线程预先计算的范围设置坐标轴，无需Qt再遍历数据点
+            if chart_type in ("line", "scatter"):
+                if not reuse:
+                    self._x_axis = QValueAxis()
+                    self._y_axis = QValueAxis()
+                    chart.addAxis(self._x_axis, Qt.AlignmentFlag.AlignBottom)
+                    chart.addAxis(self._y_axis, Qt.AlignmentFlag.AlignLeft)
+                    series.attachAxis(self._x_axis)
+                    series.attachAxis(self._y_axis)
+                self._update_axis_ranges(series_data)
+            elif chart_type != "pie":
                 chart.createDefaultAxes()
             
             # 设置图例
@@ -552,15 +1053,40 @@ class ChartWidget(QWidget):
             else:
                 chart.legend().setVisible(False)
             
-            # 设置图表
-            self.chart_view.setChart(chart)
+            # 记录可复用的图表
+            if chart_type in ("line", "scatter"):
+                self._live_chart = chart
+                self._live_chart_type = chart_type
+                self._live_series = series
+            else:
+                self._live_chart = None
+            
+            # 设置图表；复用时替换数据点和坐标轴范围可能新建图形项（如刻度标签），重新启用缓存
+            if not reuse:
+                self.chart_view.setChart(chart)
+            elif self.chart_view.ITEM_DEVICE_CACHE:
+                self.chart_view.enable_item_cache()
             
             # 更新信息
-            self.chart_info.setText(f"{self.chart_type_combo.currentText()} - 数据点: {len(display_data)}")
+            self.chart_info.setText(f"{self.chart_type_combo.currentText()} - 数据点: {series_data['count']}")
             
         except Exception as e:
             QMessageBox.critical(self, "错误", f"本地图表生成失败：\n{str(e)}")
     
+    def _update_axis_ranges(self, series_data: Dict[str, Any]):
+        """按序列数据中的预计算范围设置坐标轴，缺少时在主线程中计算"""
+        x_range = series_data.get("x_range") if "x_range" in series_data else _value_range(series_data.get("x", ()))
+        y_range = series_data.get("y_range") if "y_range" in series_data else _value_range(series_data.get("y", ()))
+        if x_range is not None:
+            self._x_axis.setRange(*x_range)
+        if y_range is not None:
+            self._y_axis.setRange(*y_range)
+    
+    def closeEvent(self, event):
+        """关闭时结束图表生成线程"""
+        self.worker.stop()
+        super().closeEvent(event)
+    
     def export_chart(self):
         """导出图表"""
         if not self.current_chart:
@@ -7,83 +7,392 @@
 import sys
 import os
 import json
-from typing import Optional, List
+import mmap
+import importlib
+import logging
+from typing import Optional, List, Dict, Any
+import numpy as np
+import pandas as pd
 from PyQt6.QtWidgets import (
     QWidget, QVBoxLayout, QHBoxLayout, QLabel, QPushButton,
-    QFileDialog, QTableWidget, QTableWidgetItem, QTextEdit,
-    QGroupBox, QComboBox, QProgressBar, QMessageBox, QCheckBox
+    QFileDialog, QTableView, QTextEdit,
+    QGroupBox, QComboBox, QProgressBar, QMessageBox, QCheckBox, QHeaderView
 )
-from PyQt6.QtCore import Qt, QThread, pyqtSignal
+from PyQt6.QtCore import Qt, QThread, QTimer, pyqtSignal, QAbstractTableModel, QModelIndex
 from PyQt6.QtGui import QFont
 
+from utils.fonts import get_font
+from utils.text_parser import parse_float_lines
+from utils.encoding import detect_encoding
+
+logger = logging.getLogger("datacharts.desktop.ui.data_import")
+
+# 设置环境变量 DATACHARTS_FAST_IO=1 时使用pyarrow解析CSV（需安装pyarrow），默认使用pandas
+FAST_IO_ENABLED = os.environ.get("DATACHARTS_FAST_IO", "").lower() in ("1", "true", "yes")
+
+# 预览表格显示的最大行数，同时也是CSV/Excel快速预览时读取的行数
+PREVIEW_ROWS = 100
+
+# 导入完成等非模态提示的显示时长（毫秒）
+NOTICE_TIMEOUT_MS = 3000
+
+# 统计CSV行数时每次读取的字节数
+CSV_COUNT_BLOCK_SIZE = 1 << 20
+
+# 文件扩展名到格式下拉框选项的映射
+_EXT_TO_LABEL = {'.csv': 'CSV', '.xlsx': 'Excel', '.xls': 'Excel', '.json': 'JSON', '.txt': 'TXT'}
+
+# 界面创建后在后台线程中预先导入的按需依赖，首次导入Excel时不再承担其导入耗时
+PREWARM_MODULES = ('openpyxl', 'xlrd', 'python_calamine')
+
+# 启用后端时直接上传原始文件的格式，无需将本地解析出的DataFrame重新序列化为JSON
+RAW_UPLOAD_EXTENSIONS = ('.csv', '.xlsx', '.xls')
+
+# 预览表格的默认列宽（像素），避免按内容计算列宽时遍历所有单元格
+PREVIEW_COLUMN_WIDTH = 120
+
 # 添加共享模块路径
 shared_path = os.path.abspath(os.path.join(os.path.dirname(__file__), '..', '..', '..', 'shared'))
 if shared_path not in sys.path:
     sys.path.insert(0, shared_path)
 
+def dataframe_columns(df) -> Dict[str, np.ndarray]:
+    """按列提取DataFrame中的数据，数值列直接引用底层数组而不复制"""
+    return {str(col): df[col].to_numpy() for col in df.columns}
+
+
+def build_columns(dataset: Any) -> Dict[str, np.ndarray]:
+    """
+    将记录格式的数据转换为列式存储（列名到NumPy数组的映射）
+    
+    列名与预览表格保持一致：字典使用键名，列表/元组使用"列N"，简单数据使用"数据"
+    
+    Args:
+        dataset: 记录列表或DataFrame
+        
+    Returns:
+        Dict[str, np.ndarray]: 列名到数组的映射，无法转换时返回空字典
+    """
+    if isinstance(dataset, pd.DataFrame):
+        return dataframe_columns(dataset)
+    if not isinstance(dataset, list) or not dataset:
+        return {}
+    
+    first = dataset[0]
+    if isinstance(first, dict):
+        return {
+            str(key): np.asarray([row.get(key) if isinstance(row, dict) else None for row in dataset])
+            for key in first.keys()
+        }
+    if isinstance(first, (list, tuple)):
+        width = len(first)
+        return {
+            f"列{i+1}": np.asarray([row[i] if len(row) > i else None for row in dataset])
+            for i in range(width)
+        }
+    return {"数据": np.asarray(dataset)}
+
+
+def preview_frame(dataset: List[Any], columns: List[str], display_rows: int) -> pd.DataFrame:
+    """
+    将记录列表的预览范围转换为字符串DataFrame，单元格内容与原始记录的str()结果一致
+    
+    Args:
+        dataset: 记录列表（字典、列表/元组或简单值）
+        columns: 列名列表
+        display_rows: 预览行数
+        
+    Returns:
+        pd.DataFrame: 预览数据，缺失的单元格为空字符串
+    """
+    col_count = len(columns)
+    rows = []
+    # 构建行的同时完成字符串转换，只遍历一次
+    for item in dataset[:display_rows]:
+        if isinstance(item, dict):
+            rows.append([str(item.get(key, "")) for key in columns])
+        elif isinstance(item, (list, tuple)):
+            row = [str(value) for value in item[:col_count]]
+            rows.append(row + [""] * (col_count - len(row)))
+        else:
+            rows.append([str(item)] + [""] * (col_count - 1))
+    return pd.DataFrame(rows, columns=columns, dtype=object)
+
+
+def build_preview(dataset: Any, max_rows: int = PREVIEW_ROWS) -> Dict[str, Any]:
+    """
+    生成预览表格所需的全部内容，由导入工作线程调用，界面线程只负责显示
+    
+    Args:
+        dataset: 导入的数据（DataFrame或记录列表）
+        max_rows: 预览的最大行数
+        
+    Returns:
+        Dict[str, Any]: 包含总行数row_count、列数col_count和预览数据frame，
+            frame中的单元格已整体转换为字符串
+    """
+    if isinstance(dataset, pd.DataFrame):
+        # DataFrame数据，预览切片一次性向量化转换为字符串
+        row_count, col_count = dataset.shape
+        return {"row_count": row_count, "col_count": col_count,
+                "frame": dataset.iloc[:max_rows].astype(str)}
+    if not isinstance(dataset, list) or not dataset:
+        return {"row_count": 0, "col_count": 0, "frame": None}
+    
+    first = dataset[0]
+    if isinstance(first, dict):
+        # 字典格式数据
+        columns = list(first.keys())
+    elif isinstance(first, (list, tuple)):
+        # 列表/元组格式数据
+        columns = [f"列{i+1}" for i in range(len(first))]
+    else:
+        # 简单数据
+        columns = ["数据"]
+    return {
+        "row_count": len(dataset),
+        "col_count": len(columns),
+        "frame": preview_frame(dataset, columns, min(len(dataset), max_rows))
+    }
+
+
+class DataFrameModel(QAbstractTableModel):
+    """
+    基于DataFrame的只读表格模型
+    
+    视图只对可见单元格调用data()，不再为每个单元格创建QTableWidgetItem；
+    单元格值缓存为二维数组，按位置直接索引，避免逐个单元格经过DataFrame.iat
+    """
+    
+    def __init__(self, df: Optional[pd.DataFrame] = None, parent=None):
+        super().__init__(parent)
+        self._set_frame(df)
+    
+    def _set_frame(self, df: Optional[pd.DataFrame]):
+        self._df = df if df is not None else pd.DataFrame()
+        self._cells = self._df.to_numpy(dtype=object)
+    
+    def set_dataframe(self, df: Optional[pd.DataFrame]):
+        """替换模型数据"""
+        self.beginResetModel()
+        self._set_frame(df)
+        self.endResetModel()
+    
+    def rowCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else self._df.shape[0]
+    
+    def columnCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else self._df.shape[1]
+    
+    def data(self, index, role=Qt.ItemDataRole.DisplayRole):
+        if role != Qt.ItemDataRole.DisplayRole or not index.isValid():
+            return None
+        return str(self._cells[index.row(), index.column()])
+    
+    def headerData(self, section, orientation, role=Qt.ItemDataRole.DisplayRole):
+        if role != Qt.ItemDataRole.DisplayRole:
+            return None
+        if orientation == Qt.Orientation.Horizontal:
+            return str(self._df.columns[section])
+        return str(section + 1)
+
+
 try:
     from data_processing.data_importer import DataImporter
     from data_types import DataSource
     SHARED_MODULES_AVAILABLE = True
 except ImportError as e:
     # 创建本地文件处理器
-    print("警告: 共享模块未找到，使用本地文件处理器")
-    import pandas as pd
-    import numpy as np
+    logger.warning("共享模块未找到，使用本地文件处理器: %s", e)
+    
+    try:
+        import pyarrow.csv as pacsv
+        PYARROW_AVAILABLE = True
+    except ImportError:
+        PYARROW_AVAILABLE = False
+    
+    try:
+        import orjson
+        ORJSON_AVAILABLE = True
+    except ImportError:
+        ORJSON_AVAILABLE = False
+    
+    try:
+        import python_calamine  # noqa: F401
+        # pandas 2.2起内置基于Rust的calamine引擎，读取速度远快于openpyxl
+        CALAMINE_AVAILABLE = tuple(int(part) for part in pd.__version__.split('.')[:2]) >= (2, 2)
+    except ImportError:
+        CALAMINE_AVAILABLE = False
+    
+    def _loads_json(raw: bytes, encoding: str = 'utf-8') -> Any:
+        """解析JSON字节内容，orjson可用时优先使用；NaN等非标准内容由标准库兜底"""
+        # orjson只接受UTF-8字节，其他编码先解码为字符串
+        content = raw if encoding == 'utf-8' else raw.decode(encoding)
+        if ORJSON_AVAILABLE:
+            try:
+                return orjson.loads(content)
+            except orjson.JSONDecodeError:
+                pass
+        return json.loads(content)
     
     class FileHandler:
-        def read_file(self, file_path: str) -> dict:
-            """读取文件"""
+        def __init__(self, use_fast_io: bool = FAST_IO_ENABLED):
+            self.use_fast_io = use_fast_io and PYARROW_AVAILABLE
+        
+        def _read_csv(self, file_path: str, nrows: Optional[int] = None) -> "pd.DataFrame":
+            """读取CSV，启用快速IO时由pyarrow多线程解析后零拷贝转换为DataFrame；指定nrows时只解析前若干行"""
+            encoding = detect_encoding(file_path)
+            if nrows is not None:
+                return pd.read_csv(file_path, encoding=encoding, nrows=nrows)
+            if self.use_fast_io:
+                read_options = pacsv.ReadOptions(encoding=encoding)
+                return pacsv.read_csv(file_path, read_options=read_options).to_pandas()
+            return pd.read_csv(file_path, encoding=encoding)
+        
+        def _excel_row_count(self, file_path: str, default: int) -> int:
+            """以只读模式获取xlsx活动工作表的数据行数（不含表头），不加载单元格内容"""
             try:
-                ext = os.path.splitext(file_path)[1].lower()
-                
-                if ext == '.csv':
-                    df = pd.read_csv(file_path, encoding='utf-8')
-                    return {
-                        "status": "success",
-                        "data": df.to_dict('records'),
-                        "file_info": {"type": "csv", "rows": len(df), "columns": len(df.columns)}
-                    }
-                elif ext in ['.xlsx', '.xls']:
-                    df = pd.read_excel(file_path)
-                    return {
-                        "status": "success",
-                        "data": df.to_dict('records'),
-                        "file_info": {"type": "excel", "rows": len(df), "columns": len(df.columns)}
-                    }
-                elif ext == '.json':
-                    with open(file_path, 'r', encoding='utf-8') as f:
-                        data = json.load(f)
-                    return {
-                        "status": "success",
-                        "data": data if isinstance(data, list) else [data],
-                        "file_info": {"type": "json", "size": len(str(data))}
-                    }
-                elif ext == '.txt':
-                    with open(file_path, 'r', encoding='utf-8') as f:
-                        lines = [line.strip() for line in f.readlines() if line.strip()]
-                    # 尝试转换为数字
-                    try:
-                        data = [float(line) for line in lines]
-                    except ValueError:
-                        data = lines
+                import openpyxl
+                workbook = openpyxl.load_workbook(file_path, read_only=True)
+                try:
+                    max_row = workbook.active.max_row
+                finally:
+                    workbook.close()
+                return max(max_row - 1, default) if max_row else default
+            except Exception:
+                return default
+        
+        def _csv_row_count(self, file_path: str, default: int) -> int:
+            """按块统计换行符估算CSV的数据行数（不含表头），不解析字段内容"""
+            lines = 0
+            last = b'\n'
+            with open(file_path, 'rb') as f:
+                for block in iter(lambda: f.read(CSV_COUNT_BLOCK_SIZE), b''):
+                    lines += block.count(b'\n')
+                    last = block[-1:]
+            if last != b'\n':
+                # 最后一行没有换行符
+                lines += 1
+            return max(lines - 1, default)
+        
+        def _read_csv_file(self, file_path: str, preview_rows: Optional[int] = None) -> dict:
+            df = self._read_csv(file_path, nrows=preview_rows)
+            total_rows = len(df) if preview_rows is None else self._csv_row_count(file_path, len(df))
+            # 直接传递DataFrame，不再逐行展开为字典列表
+            return {
+                "status": "success",
+                "data": df,
+                "columns": dataframe_columns(df),
+                "count": len(df),
+                "file_info": {
+                    "type": "csv", "rows": total_rows, "columns": len(df.columns),
+                    "truncated": len(df) < total_rows
+                }
+            }
+        
+        def _read_excel_file(self, file_path: str, preview_rows: Optional[int] = None) -> dict:
+            engine = 'calamine' if CALAMINE_AVAILABLE else None
+            if preview_rows is not None and file_path.lower().endswith('.xlsx'):
+                # 只读取预览所需的行，总行数从工作表元数据中获取
+                df = pd.read_excel(file_path, nrows=preview_rows, engine=engine or 'openpyxl')
+                total_rows = self._excel_row_count(file_path, len(df))
+            else:
+                df = pd.read_excel(file_path, engine=engine)
+                total_rows = len(df)
+            return {
+                "status": "success",
+                "data": df,
+                "columns": dataframe_columns(df),
+                "count": len(df),
+                "file_info": {
+                    "type": "excel", "rows": total_rows, "columns": len(df.columns),
+                    "truncated": len(df) < total_rows
+                }
+            }
+        
+        def _read_json_file(self, file_path: str, preview_rows: Optional[int] = None) -> dict:
+            with open(file_path, 'rb') as f:
+                data = _loads_json(f.read(), detect_encoding(file_path))
+            return {
+                "status": "success",
+                "data": data if isinstance(data, list) else [data],
+                "file_info": {"type": "json", "size": os.path.getsize(file_path)}
+            }
+        
+        def _read_txt_file(self, file_path: str, preview_rows: Optional[int] = None) -> dict:
+            with open(file_path, 'rb') as f:
+                if os.fstat(f.fileno()).st_size == 0:
+                    # 空文件无法建立内存映射
                     return {
                         "status": "success",
-                        "data": data,
-                        "file_info": {"type": "txt", "lines": len(lines)}
+                        "data": [],
+                        "file_info": {"type": "txt", "lines": 0}
                     }
-                else:
+                with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+                    # 纯数值文件由JIT解析器直接从映射内存生成数组，失败时回退到逐行转换
+                    values = parse_float_lines(mm)
+                    raw = None if values is not None else mm[:]
+            if values is not None:
+                return {
+                    "status": "success",
+                    "data": values.tolist(),
+                    "columns": {"数据": values},
+                    "count": len(values),
+                    "file_info": {"type": "txt", "lines": len(values)}
+                }
+            
+            # 按检测到的编码整体解码一次，每行只去除空白一次
+            text = raw.decode(detect_encoding(file_path))
+            lines = [line for line in (line.strip() for line in text.splitlines()) if line]
+            # 尝试转换为数字，由NumPy在C层完成字符串到浮点数的转换
+            try:
+                values = np.array(lines, dtype=np.float64)
+            except ValueError:
+                return {
+                    "status": "success",
+                    "data": lines,
+                    "file_info": {"type": "txt", "lines": len(lines)}
+                }
+            return {
+                "status": "success",
+                "data": values.tolist(),
+                "columns": {"数据": values},
+                "count": len(values),
+                "file_info": {"type": "txt", "lines": len(lines)}
+            }
+        
+        def read_file(self, file_path: str, preview_rows: Optional[int] = None) -> dict:
+            """
+            读取文件
+            
+            Args:
+                file_path: 文件路径
+                preview_rows: 仅读取CSV/xlsx文件的前若干行，为None时读取全部数据
+            """
+            try:
+                ext = os.path.splitext(file_path)[1].lower()
+                reader = _EXT_TO_READER.get(ext)
+                if reader is None:
                     return {"status": "error", "error": f"不支持的文件格式: {ext}"}
-                    
+                return reader(self, file_path, preview_rows)
             except Exception as e:
                 return {"status": "error", "error": str(e)}
     
+    # 扩展名到读取方法的映射，新增文件格式时在此注册即可
+    _EXT_TO_READER = {
+        '.csv': FileHandler._read_csv_file,
+        '.xlsx': FileHandler._read_excel_file,
+        '.xls': FileHandler._read_excel_file,
+        '.json': FileHandler._read_json_file,
+        '.txt': FileHandler._read_txt_file,
+    }
+    
     class DataImporter:
         def __init__(self):
             self.file_handler = FileHandler()
         
-        def import_data(self, file_path: str) -> dict:
-            return self.file_handler.read_file(file_path)
+        def import_data(self, file_path: str, preview_rows: Optional[int] = None) -> dict:
+            return self.file_handler.read_file(file_path, preview_rows)
 
 
 class DataImportWorker(QThread):
@@ -93,12 +402,22 @@ class DataImportWorker(QThread):
     finished = pyqtSignal(object)
     error = pyqtSignal(str)
     
-    def __init__(self, file_path: str, use_backend: bool = False, api_manager=None):
+    def __init__(self, file_path: str, use_backend: bool = False, api_manager=None,
+                 preview_rows: Optional[int] = None):
         super().__init__()
         self.file_path = file_path
+        self.preview_rows = preview_rows
         self.use_backend = use_backend
         self.api_manager = api_manager
-        self.importer = DataImporter()
+        self._importer = None
+        self._upload_progress = 50
+    
+    @property
+    def importer(self):
+        """本地导入器，首次使用时才创建"""
+        if self._importer is None:
+            self._importer = DataImporter()
+        return self._importer
     
     def run(self):
         """执行数据导入"""
@@ -106,26 +425,38 @@ class DataImportWorker(QThread):
             self.progress.emit(10)
             
             # 本地导入数据
-            result = self.importer.import_data(self.file_path)
+            if self.preview_rows is not None:
+                result = self.importer.import_data(self.file_path, preview_rows=self.preview_rows)
+            else:
+                result = self.importer.import_data(self.file_path)
             self.progress.emit(50)
             
             if result.get("status") == "success":
-                # 如果启用后端且后端可用，尝试上传到后端
-                if (self.use_backend and 
-                    self.api_manager and 
-                    self.api_manager.is_backend_available()):
+                # 在工作线程中预先构建列式数据，供函数处理等组件直接使用
+                if "columns" not in result:
+                    dataset = result.get("data")
+                    result["columns"] = build_columns(dataset)
+                    result["count"] = 0 if dataset is None else len(dataset)
+                result["preview"] = build_preview(result.get("data"))
+                
+                # use_backend已由界面线程在启动前确认后端可用，此处不再重复探测
+                if self.use_backend and self.api_manager:
                     
                     try:
-                        file_info = {
-                            "filename": os.path.basename(self.file_path),
-                            "path": self.file_path,
-                            **result.get("file_info", {})
-                        }
-                        
-                        # 上传到后端
-                        upload_result = self.api_manager.get_client().upload_data(
-                            result.get("data"), file_info
-                        )
+                        # 上传到后端，表格文件直接发送原始字节，由后端解析
+                        client = self.api_manager.get_client()
+                        if os.path.splitext(self.file_path)[1].lower() in RAW_UPLOAD_EXTENSIONS:
+                            upload_result = client.upload_file(self.file_path)
+                        else:
+                            file_info = {
+                                "filename": os.path.basename(self.file_path),
+                                "path": self.file_path,
+                                **result.get("file_info", {})
+                            }
+                            upload_result = client.upload_data(
+                                result.get("data"), file_info,
+                                progress_callback=self._report_upload_progress
+                            )
                         
                         self.progress.emit(80)
                         
@@ -147,6 +478,28 @@ class DataImportWorker(QThread):
                 
         except Exception as e:
             self.error.emit(f"导入过程中发生错误: {str(e)}")
+    
+    def _report_upload_progress(self, sent: int, total: int):
+        """将流式上传进度映射到50%~80%区间，仅在百分比变化时发出信号"""
+        value = 50 + 30 * sent // max(total, 1)
+        if value != self._upload_progress:
+            self._upload_progress = value
+            self.progress.emit(value)
+
+
+class ModuleWarmupWorker(QThread):
+    """在后台线程中预先导入按需加载的依赖模块"""
+    
+    def __init__(self, module_names=PREWARM_MODULES):
+        super().__init__()
+        self.module_names = module_names
+    
+    def run(self):
+        for name in self.module_names:
+            try:
+                importlib.import_module(name)
+            except ImportError:
+                pass
 
 
 class DataImportWidget(QWidget):
@@ -160,6 +513,10 @@ class DataImportWidget(QWidget):
         self.api_manager = api_manager
         self.current_data = None
         self.init_ui()
+        
+        # 事件循环启动后再预热依赖，不阻塞窗口显示
+        self.warmup_worker = ModuleWarmupWorker()
+        QTimer.singleShot(0, self.warmup_worker.start)
     
     def init_ui(self):
         """初始化用户界面"""
@@ -201,6 +558,11 @@ class DataImportWidget(QWidget):
         self.use_backend_check.setChecked(True)
         format_layout.addWidget(self.use_backend_check)
         
+        # CSV/Excel快速预览：只读取前若干行，需要时再加载全部
+        self.preview_only_check = QCheckBox(f"CSV/Excel仅读取前{PREVIEW_ROWS}行")
+        self.preview_only_check.setChecked(False)
+        format_layout.addWidget(self.preview_only_check)
+        
         format_layout.addStretch()
         options_layout.addLayout(format_layout)
         
@@ -214,8 +576,13 @@ class DataImportWidget(QWidget):
         self.clear_button.clicked.connect(self.clear_data)
         self.clear_button.setEnabled(False)
         
+        self.load_all_button = QPushButton("加载全部")
+        self.load_all_button.clicked.connect(self.load_full_data)
+        self.load_all_button.setEnabled(False)
+        
         button_layout.addWidget(self.import_button)
         button_layout.addWidget(self.clear_button)
+        button_layout.addWidget(self.load_all_button)
         button_layout.addStretch()
         
         options_layout.addLayout(button_layout)
@@ -234,33 +601,38 @@ class DataImportWidget(QWidget):
         # 数据信息
         info_layout = QHBoxLayout()
         self.info_label = QLabel("暂无数据")
-        self.info_label.setFont(QFont("Arial", 10))
+        self.info_label.setFont(get_font("Arial", 10))
         info_layout.addWidget(self.info_label)
         
         # 后端状态指示
         self.backend_status_label = QLabel("")
-        self.backend_status_label.setFont(QFont("Arial", 9))
+        self.backend_status_label.setFont(get_font("Arial", 9))
         info_layout.addWidget(self.backend_status_label)
         info_layout.addStretch()
         
         preview_layout.addLayout(info_layout)
         
         # 数据表格
-        self.data_table = QTableWidget()
+        self.table_model = DataFrameModel()
+        self.data_table = QTableView()
+        self.data_table.setModel(self.table_model)
         self.data_table.setAlternatingRowColors(True)
         self.data_table.setStyleSheet("""
-            QTableWidget {
+            QTableView {
                 gridline-color: #ddd;
                 background-color: white;
             }
-            QTableWidget::item {
+            QTableView::item {
                 padding: 4px;
             }
-            QTableWidget::item:selected {
+            QTableView::item:selected {
                 background-color: #3498db;
                 color: white;
             }
         """)
+        header = self.data_table.horizontalHeader()
+        header.setSectionResizeMode(QHeaderView.ResizeMode.Interactive)
+        header.setDefaultSectionSize(PREVIEW_COLUMN_WIDTH)
         preview_layout.addWidget(self.data_table)
         
         layout.addWidget(preview_group)
@@ -285,17 +657,17 @@ class DataImportWidget(QWidget):
             self.import_button.setEnabled(True)
             
             # 自动检测文件格式
-            if file_path.lower().endswith('.csv'):
-                self.format_combo.setCurrentText("CSV")
-            elif file_path.lower().endswith(('.xlsx', '.xls')):
-                self.format_combo.setCurrentText("Excel")
-            elif file_path.lower().endswith('.json'):
-                self.format_combo.setCurrentText("JSON")
-            elif file_path.lower().endswith('.txt'):
-                self.format_combo.setCurrentText("TXT")
-    
-    def import_data(self):
-        """导入数据"""
+            label = _EXT_TO_LABEL.get(os.path.splitext(file_path)[1].lower())
+            if label:
+                self.format_combo.setCurrentText(label)
+    
+    def import_data(self, full: bool = False):
+        """
+        导入数据
+        
+        Args:
+            full: 为True时忽略快速预览选项，读取全部数据
+        """
         file_path = self.file_path_label.text()
         if not file_path or file_path == "未选择文件":
             QMessageBox.warning(self, "警告", "请先选择要导入的文件")
@@ -327,17 +699,23 @@ class DataImportWidget(QWidget):
             use_backend = False
         
         # 创建并启动工作线程
-        self.worker = DataImportWorker(file_path, use_backend, self.api_manager)
+        preview_rows = PREVIEW_ROWS if self.preview_only_check.isChecked() and not full else None
+        self.worker = DataImportWorker(file_path, use_backend, self.api_manager, preview_rows)
         self.worker.progress.connect(self.progress_bar.setValue)
         self.worker.finished.connect(self.on_import_finished)
         self.worker.error.connect(self.on_import_error)
         self.worker.start()
     
+    def load_full_data(self):
+        """快速预览后读取文件的全部数据"""
+        self.import_data(full=True)
+    
     def on_import_finished(self, result):
         """数据导入完成处理"""
         self.progress_bar.setVisible(False)
         self.import_button.setEnabled(True)
         self.clear_button.setEnabled(True)
+        self.load_all_button.setEnabled(bool(result.get("file_info", {}).get("truncated")))
         
         # 保存数据
         self.current_data = result
@@ -351,14 +729,14 @@ class DataImportWidget(QWidget):
         # 发送信号
         self.data_imported.emit(result)
         
-        # 显示成功消息
+        # 显示成功消息，使用非模态提示，不阻塞预览的显示
         backend_msg = ""
         if result.get("backend_status") == "uploaded":
-            backend_msg = "\n数据已同步到后端服务"
+            backend_msg = " · 数据已同步到后端服务"
         elif result.get("backend_status") == "failed":
-            backend_msg = f"\n后端同步失败: {result.get('backend_error', '未知错误')}"
+            backend_msg = f" · 后端同步失败: {result.get('backend_error', '未知错误')}"
         
-        QMessageBox.information(self, "成功", f"数据导入成功！{backend_msg}")
+        self.show_notice(f"数据导入成功！{backend_msg}")
     
     def on_import_error(self, error_msg):
         """数据导入错误处理"""
@@ -390,33 +768,14 @@ class DataImportWidget(QWidget):
             return
         
         dataset = data.get("data", [])
-        if not dataset:
+        if dataset is None or len(dataset) == 0:
             self.info_label.setText("暂无数据")
-            self.data_table.setRowCount(0)
-            self.data_table.setColumnCount(0)
+            self.table_model.set_dataframe(None)
             return
         
-        # 更新信息标签
-        if isinstance(dataset, list) and len(dataset) > 0:
-            if isinstance(dataset[0], dict):
-                # 字典格式数据
-                row_count = len(dataset)
-                col_count = len(dataset[0].keys()) if dataset[0] else 0
-                columns = list(dataset[0].keys()) if dataset[0] else []
-            elif isinstance(dataset[0], (list, tuple)):
-                # 列表/元组格式数据
-                row_count = len(dataset)
-                col_count = len(dataset[0]) if dataset[0] else 0
-                columns = [f"列{i+1}" for i in range(col_count)]
-            else:
-                # 简单数据
-                row_count = len(dataset)
-                col_count = 1
-                columns = ["数据"]
-        else:
-            row_count = 0
-            col_count = 0
-            columns = []
+        # 预览内容通常已由工作线程生成
+        preview = data.get("preview") or build_preview(dataset)
+        row_count, col_count = preview["row_count"], preview["col_count"]
         
         # 显示文件信息
         file_info = data.get("file_info", {})
@@ -425,46 +784,47 @@ class DataImportWidget(QWidget):
         self.info_label.setText(f"数据类型: {file_type} | 维度: {row_count} 行 × {col_count} 列")
         
         # 更新表格（只显示前100行）
-        display_rows = min(row_count, 100)
-        self.data_table.setRowCount(display_rows)
-        self.data_table.setColumnCount(col_count)
-        
-        if columns:
-            self.data_table.setHorizontalHeaderLabels(columns)
-        
-        # 填充数据
-        for i in range(display_rows):
-            if isinstance(dataset[i], dict):
-                for j, key in enumerate(columns):
-                    value = dataset[i].get(key, "")
-                    item = QTableWidgetItem(str(value))
-                    self.data_table.setItem(i, j, item)
-            elif isinstance(dataset[i], (list, tuple)):
-                for j in range(min(len(dataset[i]), col_count)):
-                    item = QTableWidgetItem(str(dataset[i][j]))
-                    self.data_table.setItem(i, j, item)
-            else:
-                item = QTableWidgetItem(str(dataset[i]))
-                self.data_table.setItem(i, 0, item)
-        
-        # 自动调整列宽
-        self.data_table.resizeColumnsToContents()
+        self.table_model.set_dataframe(preview["frame"])
         
         if row_count > 100:
             self.info_label.setText(
                 f"数据类型: {file_type} | 维度: {row_count} 行 × {col_count} 列 (显示前100行)"
             )
+        elif file_info.get("truncated"):
+            self.info_label.setText(
+                f"数据类型: {file_type} | 维度: {file_info.get('rows')} 行 × {col_count} 列 "
+                f"(已读取前{row_count}行，点击“加载全部”读取完整数据)"
+            )
     
     def clear_data(self):
         """清除数据"""
         self.current_data = None
-        self.data_table.setRowCount(0)
-        self.data_table.setColumnCount(0)
+        self.table_model.set_dataframe(None)
         self.info_label.setText("暂无数据")
         self.backend_status_label.setText("")
         self.clear_button.setEnabled(False)
+        self.load_all_button.setEnabled(False)
         
-        QMessageBox.information(self, "完成", "数据已清除")
+        self.show_notice("数据已清除")
+    
+    def show_notice(self, text: str, timeout_ms: int = NOTICE_TIMEOUT_MS):
+        """
+        在信息标签中临时显示提示，超时后恢复原有内容
+        
+        Args:
+            text: 提示文本
+            timeout_ms: 显示时长（毫秒）
+        """
+        previous = self.info_label.text()
+        notice = f"✓ {text}"
+        self.info_label.setText(notice)
+        
+        def restore():
+            # 期间标签内容已被其他操作更新时不再覆盖
+            if self.info_label.text() == notice:
+                self.info_label.setText(previous)
+        
+        QTimer.singleShot(timeout_ms, restore)
     
     def get_current_data(self):
         """获取当前导入的数据"""
@@ -6,15 +6,25 @@
 
 import sys
 import os
+import logging
+import queue
+import re
+import time
 from typing import Optional, Dict, Any
+import numpy as np
+import pandas as pd
 from PyQt6.QtWidgets import (
     QWidget, QVBoxLayout, QHBoxLayout, QLabel, QPushButton,
-    QTextEdit, QGroupBox, QComboBox, QListWidget, QListWidgetItem,
-    QSplitter, QMessageBox, QLineEdit, QProgressBar, QCheckBox
+    QTextEdit, QPlainTextEdit, QGroupBox, QComboBox, QListWidget, QListWidgetItem,
+    QSplitter, QMessageBox, QLineEdit, QProgressBar, QCheckBox, QApplication
 )
-from PyQt6.QtCore import Qt, QThread, pyqtSignal
+from PyQt6.QtCore import Qt, QThread, QTimer, pyqtSignal
 from PyQt6.QtGui import QFont, QTextCursor
 
+from utils.fonts import get_font
+
+logger = logging.getLogger("datacharts.desktop.ui.function")
+
 # 添加共享模块路径
 shared_path = os.path.abspath(os.path.join(os.path.dirname(__file__), '..', '..', '..', 'shared'))
 if shared_path not in sys.path:
@@ -22,19 +32,27 @@ if shared_path not in sys.path:
 
 try:
     from algorithms.function_parser import ExpressionParser
-    from algorithms.safe_executor import SafeExecutionEnvironment
+    from algorithms.safe_executor import SafeExecutionEnvironment, compile_expression
     from data_types import DataSource
+    SHARED_MODULES_AVAILABLE = True
 except ImportError as e:
     # 创建本地函数处理器
-    print(f"警告: 共享模块未找到，使用本地函数处理器 (错误: {e})")
+    logger.warning("共享模块未找到，使用本地函数处理器: %s", e)
+    SHARED_MODULES_AVAILABLE = False
     import numpy as np
     import pandas as pd
     import re
     
+    def compile_expression(expression: str):
+        """编译表达式，接口与共享模块的compile_expression一致（本地处理器不缓存）"""
+        return compile(expression, '<expr>', 'eval')
+    
     class DataSource:
         def __init__(self, content):
             self.content = content
     
+    _WORD_PATTERN = re.compile(r'\b[a-zA-Z_][a-zA-Z0-9_]*\b')
+    
     class ExpressionParser:
         def parse_expression(self, expression: str) -> dict:
             """简化的表达式解析器"""
@@ -44,7 +62,7 @@ except ImportError as e:
                     return {"status": "error", "message": "表达式包含不安全的操作"}
                 
                 # 提取变量（简单实现）
-                variables = list(set(re.findall(r'\b[a-zA-Z_][a-zA-Z0-9_]*\b', expression)))
+                variables = list(set(_WORD_PATTERN.findall(expression)))
                 # 过滤掉函数名
                 functions = ['sin', 'cos', 'tan', 'log', 'exp', 'sqrt', 'abs', 'mean', 'std', 'min', 'max', 'sum']
                 variables = [v for v in variables if v not in functions and v not in ['np', 'x', 'pi', 'e']]
@@ -63,31 +81,45 @@ except ImportError as e:
             """简化的函数执行器"""
             try:
                 data = data_source.content
+                columns = None
                 if isinstance(data, dict) and data.get("status") == "success":
                     dataset = data.get("data", [])
+                    columns = data.get("columns")
                 else:
                     dataset = data
                 
-                if not isinstance(dataset, (list, pd.DataFrame)):
-                    return {"status": "error", "message": "数据格式不支持"}
-                
-                # 转换为numpy数组进行计算
-                if isinstance(dataset, list):
-                    if len(dataset) > 0 and isinstance(dataset[0], dict):
-                        # 字典列表转DataFrame
-                        df = pd.DataFrame(dataset)
-                        if len(df.columns) == 1:
-                            x = df.iloc[:, 0].values
-                        else:
-                            x = df.values
-                    else:
-                        # 简单数组
-                        x = np.array(dataset, dtype=float)
-                elif isinstance(dataset, pd.DataFrame):
-                    if len(dataset.columns) == 1:
-                        x = dataset.iloc[:, 0].values
+                if columns:
+                    # 列式数据：各列已是连续数组，无需经过DataFrame转换
+                    arrays = [np.asarray(col) for col in columns.values()]
+                    if len(arrays) == 1:
+                        x = arrays[0]
+                    elif 'x' in _WORD_PATTERN.findall(expression):
+                        # 仅在表达式引用x时才拼接二维数组
+                        x = np.column_stack(arrays)
                     else:
-                        x = dataset.values
+                        x = None
+                else:
+                    if not isinstance(dataset, (list, pd.DataFrame)):
+                        return {"status": "error", "message": "数据格式不支持"}
+                    
+                    # 转换为numpy数组进行计算
+                    if isinstance(dataset, list):
+                        if len(dataset) > 0 and isinstance(dataset[0], dict):
+                            # 字典列表转DataFrame
+                            df = pd.DataFrame(dataset)
+                            if len(df.columns) == 1:
+                                x = df.iloc[:, 0].values
+                            else:
+                                x = df.values
+                        else:
+                            # 简单数组
+                            x = np.array(dataset, dtype=float)
+                    elif isinstance(dataset, pd.DataFrame):
+                        if len(dataset.columns) == 1:
+                            x = dataset.iloc[:, 0].values
+                        else:
+                            x = dataset.values
+                    arrays = [x[:, i] for i in range(x.shape[1])] if x.ndim > 1 else [x]
                 
                 # 创建安全的命名空间
                 namespace = {
@@ -110,99 +142,332 @@ except ImportError as e:
                 }
                 
                 # 替换数据变量
-                if hasattr(x, 'shape') and len(x.shape) > 1:
+                if len(arrays) > 1:
                     # 多列数据
                     for i, var in enumerate(variables):
-                        if i < x.shape[1]:
-                            namespace[var] = x[:, i]
-                else:
-                    # 单列数据
-                    namespace['x'] = x
+                        if i < len(arrays):
+                            namespace[var] = arrays[i]
                 
                 # 执行表达式
-                result = eval(expression, {"__builtins__": {}}, namespace)
+                result = eval(compile_expression(expression), {"__builtins__": {}}, namespace)
                 
-                return {
-                    "status": "success", 
-                    "result": result.tolist() if hasattr(result, 'tolist') else result
-                }
+                # 数组结果直接保留ndarray，仅标量结果转换为Python对象
+                if not (isinstance(result, np.ndarray) and result.ndim > 0) and hasattr(result, 'tolist'):
+                    result = result.tolist()
+                return {"status": "success", "result": result}
                 
             except Exception as e:
                 return {"status": "error", "message": f"计算失败: {str(e)}"}
 
+# 表达式中被调用的函数名（含np.前缀的调用只取函数名）
+_CALL_NAME_PATTERN = re.compile(r'([a-zA-Z_][a-zA-Z0-9_]*)\s*\(')
+
+try:
+    from algorithms.numeric_kernels import match_template_kernel
+except ImportError:
+    def match_template_kernel(expression: str):
+        return None
+
+
+def single_column_vector(data: Any) -> Optional[np.ndarray]:
+    """取出单列数据的一维数组，多列或格式不支持时返回None"""
+    if isinstance(data, dict) and data.get("status") == "success":
+        columns = data.get("columns")
+        if columns and len(columns) == 1:
+            return np.asarray(next(iter(columns.values())))
+        data = data.get("data")
+    if isinstance(data, pd.DataFrame) and len(data.columns) == 1:
+        return data.iloc[:, 0].to_numpy()
+    return None
+
+
+def data_frame_of(data: Any) -> Optional[pd.DataFrame]:
+    """将导入结果（列式数据或记录列表）、记录列表或DataFrame转换为DataFrame，格式不支持时返回None"""
+    if isinstance(data, dict) and data.get("status") == "success":
+        columns = data.get("columns")
+        if columns:
+            return pd.DataFrame(columns)
+        data = data.get("data", [])
+    if isinstance(data, pd.DataFrame):
+        return data
+    if isinstance(data, list):
+        if data and isinstance(data[0], dict):
+            return pd.DataFrame(data)
+        return pd.DataFrame({'x': np.asarray(data, dtype=float)})
+    return None
+
+
+def _float_column(values) -> np.ndarray:
+    """转换为C连续的float64数组，无法转换（如字符串列）时保持原样"""
+    arr = np.asarray(values)
+    if arr.dtype == np.float64 and arr.flags.c_contiguous:
+        return arr
+    try:
+        return np.ascontiguousarray(arr, dtype=np.float64)
+    except (TypeError, ValueError):
+        return arr
+
+
+def prepare_function_data(data: Any) -> Any:
+    """
+    设置数据时预先将列式数据转换为连续的float64数组，每次应用函数时无需再转换
+
+    返回浅拷贝，不修改其他组件共享的导入结果；没有列式数据时原样返回
+
+    Args:
+        data: 导入结果字典
+
+    Returns:
+        Any: 列已转换的导入结果
+    """
+    if not (isinstance(data, dict) and data.get("status") == "success" and data.get("columns")):
+        return data
+    prepared = dict(data)
+    prepared["columns"] = {name: _float_column(col) for name, col in data["columns"].items()}
+    return prepared
+
+
+# 后端可用状态的缓存有效期（秒）
+BACKEND_PROBE_TTL = 5.0
+
+# 进度信号节流：进度变化不小于该百分比且距上次发送超过该间隔（秒）时才发送
+PROGRESS_MIN_STEP = 5
+PROGRESS_MIN_INTERVAL = 0.033
+
+# 函数模板：(名称, 表达式, 说明)
+FUNCTION_TEMPLATES = (
+    ("线性函数", "a * x + b", "y = ax + b 的线性函数"),
+    ("二次函数", "a * x**2 + b * x + c", "二次多项式函数"),
+    ("指数函数", "a * np.exp(b * x)", "指数增长/衰减"),
+    ("对数函数", "a * np.log(x) + b", "对数函数"),
+    ("正弦函数", "a * np.sin(b * x + c)", "正弦波函数"),
+    ("余弦函数", "a * np.cos(b * x + c)", "余弦波函数"),
+    ("幂函数", "a * x**b", "幂次函数"),
+    ("平方根", "np.sqrt(x)", "平方根函数"),
+    ("绝对值", "np.abs(x)", "绝对值函数"),
+    ("数据归一化", "(x - np.mean(x)) / np.std(x)", "标准化为均值0方差1"),
+    ("数据标准化", "(x - np.min(x)) / (np.max(x) - np.min(x))", "缩放到0-1范围"),
+    ("移动平均", "np.convolve(x, np.ones(5)/5, mode='same')", "5点移动平均"),
+    ("差分", "np.diff(x)", "计算差分"),
+    ("累积和", "np.cumsum(x)", "累积求和"),
+    ("平滑处理", "np.convolve(x, np.ones(3)/3, mode='same')", "3点平滑")
+)
+
+# 结果区最多显示的结果个数
+RESULT_PREVIEW_COUNT = 100
+
+# 数组结果的repr超过该元素数时只显示首尾各RESULT_REPR_EDGEITEMS个
+RESULT_REPR_THRESHOLD = 200
+RESULT_REPR_EDGEITEMS = 3
+
+
+def format_result_preview(values) -> str:
+    """
+    将结果格式化为每行一个的文本，数值结果整体交给NumPy格式化，避免逐元素调用str()
+
+    Args:
+        values: 待显示的结果序列
+
+    Returns:
+        str: 格式化后的文本
+    """
+    arr = np.asarray(values)
+    if arr.ndim == 1 and arr.dtype.kind in 'iuf':
+        return "\n".join(np.char.mod('%.15g', arr))
+    with np.printoptions(threshold=RESULT_REPR_THRESHOLD, edgeitems=RESULT_REPR_EDGEITEMS):
+        return "\n".join(str(value) for value in values)
+
+
+def format_result_text(value) -> str:
+    """
+    格式化非序列结果，DataFrame/Series只取前若干行，数组按截断的repr显示，避免为大结果生成完整文本
+
+    Args:
+        value: 计算结果
+
+    Returns:
+        str: 格式化后的文本
+    """
+    if isinstance(value, (pd.DataFrame, pd.Series)):
+        return value.head(RESULT_PREVIEW_COUNT).to_string()
+    with np.printoptions(threshold=RESULT_REPR_THRESHOLD, edgeitems=RESULT_REPR_EDGEITEMS):
+        return str(value)
+
 
 class FunctionExecutorWorker(QThread):
-    """函数执行工作线程"""
+    """
+    函数执行工作线程
+
+    常驻线程，通过任务队列依次处理函数应用请求
+    """
     
     progress = pyqtSignal(int)
     finished = pyqtSignal(object)
     error = pyqtSignal(str)
     
-    def __init__(self, expression: str, data: Any, use_backend: bool = False, api_manager=None):
+    # 解析器和执行器在所有实例间共享，界面线程的本地解析也复用同一解析器
+    parser = ExpressionParser()
+    executor = SafeExecutionEnvironment()
+    
+    def __init__(self, api_manager=None):
         super().__init__()
-        self.expression = expression
-        self.data = data
-        self.use_backend = use_backend
         self.api_manager = api_manager
-        self.parser = ExpressionParser()
-        self.executor = SafeExecutionEnvironment()
+        self._last_emit_ts = 0.0
+        self._last_emit_val = 0
+        self._queue: "queue.Queue[Optional[tuple]]" = queue.Queue()
+    
+    def submit(self, expression: str, data: Any, use_backend: bool = False):
+        """提交函数应用任务，线程未运行时自动启动"""
+        self._queue.put((expression, data, use_backend))
+        if not self.isRunning():
+            self.start()
+    
+    def stop(self):
+        """结束线程并等待退出"""
+        if self.isRunning():
+            self._queue.put(None)
+            self.wait()
     
     def run(self):
+        """预热模板缓存后循环处理任务队列，收到None时退出"""
+        self.prewarm_templates()
+        while True:
+            job = self._queue.get()
+            if job is None:
+                return
+            self.execute(*job)
+    
+    def prewarm_templates(self):
+        """预先解析、编译函数模板并匹配加速内核，填充各级缓存，使点击模板后的首次应用无需再解析"""
+        for _, expression, _ in FUNCTION_TEMPLATES:
+            try:
+                compile_expression(expression)
+                self.parser.parse_expression(expression)
+                match_template_kernel(expression)
+            except Exception as e:
+                logger.debug("函数模板预热失败 %s: %s", expression, e)
+    
+    def parse_locally(self, expression: str) -> Dict[str, Any]:
+        """
+        本地解析表达式，结果统一为 {"status", "variables", "functions"} 字典
+
+        共享解析器返回FunctionExpression、失败时抛出FunctionParseError，本地简化解析器直接返回字典
+        """
+        try:
+            parsed = self.parser.parse_expression(expression)
+        except Exception as e:
+            return {"status": "error", "message": str(e)}
+        if isinstance(parsed, dict):
+            return parsed
+        return {
+            "status": "success",
+            "type": "numeric",
+            "variables": list(parsed.variables),
+            "functions": sorted(set(_CALL_NAME_PATTERN.findall(expression)))
+        }
+    
+    def execute_locally(self, expression: str, data: Any, variables: list) -> Dict[str, Any]:
+        """
+        本地执行表达式，结果统一为 {"status", "result"} 或 {"status", "message"} 字典
+
+        共享执行器要求DataSource的内容为DataFrame并返回ProcessingResult；
+        单列数据的列名改为x，与本地简化执行器中x即数据列的约定一致
+        """
+        if not SHARED_MODULES_AVAILABLE:
+            return self.executor.apply_function_to_data(DataSource(data), expression, variables)
+        
+        frame = data_frame_of(data)
+        if frame is None:
+            return {"status": "error", "message": "数据格式不支持"}
+        if len(frame.columns) == 1 and 'x' not in frame.columns:
+            frame = frame.set_axis(['x'], axis=1)
+        
+        source = DataSource(id="local", format="dataframe", content=frame, metadata={})
+        processed = self.executor.apply_function_to_data(source, expression, variables)
+        if processed.status != "success":
+            return {"status": "error", "message": processed.error_message}
+        result = processed.data
+        if isinstance(result, pd.Series):
+            result = result.to_numpy()
+        return {"status": "success", "result": result}
+    
+    def _report_progress(self, value: int):
+        """节流发送进度信号，避免跨线程信号过于频繁；100%总是发送"""
+        now = time.monotonic()
+        if value >= 100 or (value - self._last_emit_val >= PROGRESS_MIN_STEP and
+                            now - self._last_emit_ts >= PROGRESS_MIN_INTERVAL):
+            self.progress.emit(value)
+            self._last_emit_val = value
+            self._last_emit_ts = now
+    
+    def execute(self, expression: str, data: Any, use_backend: bool):
         """执行函数处理"""
+        # 界面在提交任务时已将进度置0，快速完成的任务只发送最终的100%
+        self._last_emit_ts = time.monotonic()
+        self._last_emit_val = 0
         try:
-            self.progress.emit(20)
+            self._report_progress(20)
             
-            # 如果启用后端且后端可用，优先使用后端
-            if (self.use_backend and 
-                self.api_manager and 
-                self.api_manager.is_backend_available()):
+            # 如果启用后端且后端可用，优先使用后端（可用状态已由界面线程检查）
+            if use_backend and self.api_manager:
                 
                 try:
                     # 使用后端API解析函数
-                    parse_result = self.api_manager.get_client().parse_function(self.expression)
+                    parse_result = self.api_manager.get_client().parse_function(expression)
                     
                     if parse_result.get("status") == "success":
-                        self.progress.emit(60)
+                        self._report_progress(60)
                         
                         # 使用后端API应用函数
                         apply_result = self.api_manager.get_client().apply_function(
-                            self.expression, self.data, []
+                            expression, data, []
                         )
                         
                         if apply_result.get("status") == "success":
-                            self.progress.emit(100)
+                            self._report_progress(100)
                             result = apply_result.get("data", {})
                             result["backend_used"] = True
                             self.finished.emit(result)
                             return
                         else:
                             # 后端失败，降级到本地处理
-                            print(f"后端函数应用失败，降级到本地处理: {apply_result.get('message')}")
+                            logger.warning("后端函数应用失败，降级到本地处理: %s", apply_result.get('message'))
                     else:
                         # 后端解析失败，降级到本地处理
-                        print(f"后端函数解析失败，降级到本地处理: {parse_result.get('message')}")
+                        logger.warning("后端函数解析失败，降级到本地处理: %s", parse_result.get('message'))
                         
                 except Exception as e:
-                    print(f"后端API调用异常，降级到本地处理: {str(e)}")
+                    logger.warning("后端API调用异常，降级到本地处理: %s", e)
             
             # 本地处理
-            self.progress.emit(40)
+            self._report_progress(40)
+            
+            # 单列数据上的常用模板直接交给并行内核，跳过解析和求值
+            kernel = match_template_kernel(expression)
+            if kernel is not None:
+                x = single_column_vector(data)
+                if x is not None:
+                    result = kernel(x)
+                    self._report_progress(100)
+                    self.finished.emit({
+                        "status": "success",
+                        "result": result,
+                        "backend_used": False
+                    })
+                    return
             
             # 解析表达式
-            parsed_result = self.parser.parse_expression(self.expression)
+            parsed_result = self.parse_locally(expression)
             if parsed_result.get("status") != "success":
                 self.error.emit(f"表达式解析失败: {parsed_result.get('message', '未知错误')}")
                 return
             
-            self.progress.emit(70)
-            
-            # 创建数据源
-            data_source = DataSource(self.data)
-            variables = parsed_result.get("variables", [])
+            self._report_progress(70)
             
             # 执行函数
-            exec_result = self.executor.apply_function_to_data(data_source, self.expression, variables)
-            self.progress.emit(100)
+            variables = parsed_result.get("variables", [])
+            exec_result = self.execute_locally(expression, data, variables)
+            self._report_progress(100)
             
             if exec_result.get("status") == "success":
                 exec_result["backend_used"] = False
@@ -224,9 +489,28 @@ class FunctionWidget(QWidget):
         super().__init__()
         self.api_manager = api_manager
         self.current_data = None
+        # 预先转换列数据后的当前数据，提交给执行线程
+        self._prepared_data = None
+        # 最近一次解析是否成功，避免从解析结果文本中判断
+        self._parse_succeeded = False
         self.result_data = None
+        # 后端可用状态缓存，None表示尚未探测
+        self._backend_probe_ts = 0.0
+        self._backend_probe_val = None
         self.init_ui()
         self.setup_function_templates()
+        
+        # 常驻函数执行线程，信号只连接一次
+        self.worker = FunctionExecutorWorker(self.api_manager)
+        self.worker.progress.connect(self.progress_bar.setValue)
+        self.worker.finished.connect(self.on_function_finished)
+        self.worker.error.connect(self.on_function_error)
+        app = QApplication.instance()
+        if app is not None:
+            # 子控件不会收到closeEvent，退出应用时也需要结束线程
+            app.aboutToQuit.connect(self.worker.stop)
+        # 界面显示后启动线程，空闲时预热函数模板
+        QTimer.singleShot(0, self.worker.start)
     
     def init_ui(self):
         """初始化用户界面"""
@@ -273,7 +557,7 @@ class FunctionWidget(QWidget):
         backend_layout.addWidget(self.use_backend_check)
         
         self.backend_status_label = QLabel("")
-        self.backend_status_label.setFont(QFont("Arial", 9))
+        self.backend_status_label.setFont(get_font("Arial", 9))
         backend_layout.addWidget(self.backend_status_label)
         backend_layout.addStretch()
         
@@ -283,7 +567,7 @@ class FunctionWidget(QWidget):
         self.expression_edit = QTextEdit()
         self.expression_edit.setMaximumHeight(120)
         self.expression_edit.setPlaceholderText("输入数学表达式，例如: x**2 + np.sin(x)")
-        self.expression_edit.setFont(QFont("Consolas", 11))
+        self.expression_edit.setFont(get_font("Consolas", 11))
         self.expression_edit.setStyleSheet("""
             QTextEdit {
                 border: 2px solid #bdc3c7;
@@ -346,12 +630,12 @@ class FunctionWidget(QWidget):
         parse_group = QGroupBox("解析结果")
         parse_layout = QVBoxLayout(parse_group)
         
-        self.parse_result = QTextEdit()
+        self.parse_result = QPlainTextEdit()
         self.parse_result.setMaximumHeight(100)
         self.parse_result.setReadOnly(True)
-        self.parse_result.setFont(QFont("Consolas", 10))
+        self.parse_result.setFont(get_font("Consolas", 10))
         self.parse_result.setStyleSheet("""
-            QTextEdit {
+            QPlainTextEdit {
                 background-color: #f8f9fa;
                 border: 1px solid #ddd;
                 border-radius: 4px;
@@ -368,23 +652,23 @@ class FunctionWidget(QWidget):
         # 结果信息
         result_info_layout = QHBoxLayout()
         self.result_info = QLabel("暂无结果")
-        self.result_info.setFont(QFont("Arial", 10))
+        self.result_info.setFont(get_font("Arial", 10))
         result_info_layout.addWidget(self.result_info)
         
         # 后端使用状态
         self.execution_status_label = QLabel("")
-        self.execution_status_label.setFont(QFont("Arial", 9))
+        self.execution_status_label.setFont(get_font("Arial", 9))
         result_info_layout.addWidget(self.execution_status_label)
         result_info_layout.addStretch()
         
         result_layout.addLayout(result_info_layout)
         
         # 结果显示
-        self.result_display = QTextEdit()
+        self.result_display = QPlainTextEdit()
         self.result_display.setReadOnly(True)
-        self.result_display.setFont(QFont("Consolas", 10))
+        self.result_display.setFont(get_font("Consolas", 10))
         self.result_display.setStyleSheet("""
-            QTextEdit {
+            QPlainTextEdit {
                 background-color: #f8f9fa;
                 border: 1px solid #ddd;
                 border-radius: 4px;
@@ -407,25 +691,7 @@ class FunctionWidget(QWidget):
     
     def setup_function_templates(self):
         """设置函数模板"""
-        templates = [
-            ("线性函数", "a * x + b", "y = ax + b 的线性函数"),
-            ("二次函数", "a * x**2 + b * x + c", "二次多项式函数"),
-            ("指数函数", "a * np.exp(b * x)", "指数增长/衰减"),
-            ("对数函数", "a * np.log(x) + b", "对数函数"),
-            ("正弦函数", "a * np.sin(b * x + c)", "正弦波函数"),
-            ("余弦函数", "a * np.cos(b * x + c)", "余弦波函数"),
-            ("幂函数", "a * x**b", "幂次函数"),
-            ("平方根", "np.sqrt(x)", "平方根函数"),
-            ("绝对值", "np.abs(x)", "绝对值函数"),
-            ("数据归一化", "(x - np.mean(x)) / np.std(x)", "标准化为均值0方差1"),
-            ("数据标准化", "(x - np.min(x)) / (np.max(x) - np.min(x))", "缩放到0-1范围"),
-            ("移动平均", "np.convolve(x, np.ones(5)/5, mode='same')", "5点移动平均"),
-            ("差分", "np.diff(x)", "计算差分"),
-            ("累积和", "np.cumsum(x)", "累积求和"),
-            ("平滑处理", "np.convolve(x, np.ones(3)/3, mode='same')", "3点平滑")
-        ]
-        
-        for name, expression, description in templates:
+        for name, expression, description in FUNCTION_TEMPLATES:
             item = QListWidgetItem(f"{name}: {expression}")
             item.setToolTip(description)
             item.setData(Qt.ItemDataRole.UserRole, expression)
@@ -451,14 +717,32 @@ class FunctionWidget(QWidget):
             
             self.quick_input.clear()
     
-    def update_backend_status(self):
-        """更新后端状态显示"""
-        if self.api_manager and self.api_manager.is_backend_available():
+    def update_backend_status(self) -> bool:
+        """
+        更新后端状态显示
+
+        探测结果在BACKEND_PROBE_TTL秒内直接复用，状态未变化时不重新设置样式
+
+        Returns:
+            bool: 后端是否可用
+        """
+        now = time.monotonic()
+        if self._backend_probe_val is not None and now - self._backend_probe_ts <= BACKEND_PROBE_TTL:
+            return self._backend_probe_val
+        
+        available = bool(self.api_manager and self.api_manager.is_backend_available())
+        self._backend_probe_ts = now
+        if available == self._backend_probe_val:
+            return available
+        self._backend_probe_val = available
+        
+        if available:
             self.backend_status_label.setText("77 后端可用")
             self.backend_status_label.setStyleSheet("color: green; font-weight: bold;")
         else:
             self.backend_status_label.setText("72 后端不可用")
             self.backend_status_label.setStyleSheet("color: orange; font-weight: bold;")
+        return available
     
     def parse_expression(self):
         """解析数学表达式"""
@@ -467,13 +751,12 @@ class FunctionWidget(QWidget):
             QMessageBox.warning(self, "警告", "请输入数学表达式")
             return
         
-        self.update_backend_status()
+        backend_available = self.update_backend_status()
+        self._parse_succeeded = False
         
         try:
             # 如果后端可用，尝试使用后端解析
-            if (self.api_manager and 
-                self.api_manager.is_backend_available() and 
-                self.use_backend_check.isChecked()):
+            if backend_available and self.use_backend_check.isChecked():
                 
                 result = self.api_manager.get_client().parse_function(expression)
                 if result.get("status") == "success":
@@ -484,12 +767,12 @@ class FunctionWidget(QWidget):
                         f"变量: {', '.join(data.get('variables', []))}\n"
                         f"函数: {', '.join(data.get('functions', []))}"
                     )
+                    self._parse_succeeded = True
                     self.apply_button.setEnabled(self.current_data is not None)
                     return
             
             # 本地解析
-            parser = ExpressionParser()
-            result = parser.parse_expression(expression)
+            result = self.worker.parse_locally(expression)
             
             if result.get("status") == "success":
                 self.parse_result.setPlainText(
@@ -498,6 +781,7 @@ class FunctionWidget(QWidget):
                     f"变量: {', '.join(result.get('variables', []))}\n"
                     f"函数: {', '.join(result.get('functions', []))}"
                 )
+                self._parse_succeeded = True
                 self.apply_button.setEnabled(self.current_data is not None)
             else:
                 self.parse_result.setPlainText(
@@ -525,13 +809,9 @@ class FunctionWidget(QWidget):
         self.progress_bar.setValue(0)
         self.apply_button.setEnabled(False)
         
-        # 创建并启动工作线程
-        use_backend = self.use_backend_check.isChecked()
-        self.worker = FunctionExecutorWorker(expression, self.current_data, use_backend, self.api_manager)
-        self.worker.progress.connect(self.progress_bar.setValue)
-        self.worker.finished.connect(self.on_function_finished)
-        self.worker.error.connect(self.on_function_error)
-        self.worker.start()
+        # 提交到常驻工作线程
+        use_backend = self.use_backend_check.isChecked() and self.update_backend_status()
+        self.worker.submit(expression, self._prepared_data, use_backend)
     
     def on_function_finished(self, result):
         """函数应用完成处理"""
@@ -572,28 +852,28 @@ class FunctionWidget(QWidget):
         
         result_data = result.get("result", [])
         
-        # 更新结果信息
-        if isinstance(result_data, list):
+        # 更新结果信息：本地计算结果为ndarray，后端结果为列表
+        if isinstance(result_data, (list, np.ndarray)):
             count = len(result_data)
             self.result_info.setText(f"计算完成，共 {count} 个结果")
             
             # 显示部分结果（前100个）
-            display_count = min(count, 100)
-            display_text = "\n".join(str(result_data[i]) for i in range(display_count))
+            display_text = format_result_preview(result_data[:RESULT_PREVIEW_COUNT])
             
-            if count > 100:
-                display_text += f"\n... (共 {count} 个结果，显示前100个)"
+            if count > RESULT_PREVIEW_COUNT:
+                display_text += f"\n... (共 {count} 个结果，显示前{RESULT_PREVIEW_COUNT}个)"
             
             self.result_display.setPlainText(display_text)
         else:
             self.result_info.setText("计算完成")
-            self.result_display.setPlainText(str(result_data))
+            self.result_display.setPlainText(format_result_text(result_data))
     
     def clear_expression(self):
         """清除表达式和结果"""
         self.expression_edit.clear()
         self.quick_input.clear()
         self.parse_result.clear()
+        self._parse_succeeded = False
         self.result_display.clear()
         self.result_info.setText("暂无结果")
         self.execution_status_label.setText("")
@@ -603,10 +883,16 @@ class FunctionWidget(QWidget):
     def set_data(self, data):
         """设置当前数据"""
         self.current_data = data
+        self._prepared_data = prepare_function_data(data)
         # 如果已经解析了表达式，启用应用按钮
-        if self.parse_result.toPlainText() and "解析成功" in self.parse_result.toPlainText():
+        if self._parse_succeeded:
             self.apply_button.setEnabled(True)
     
+    def closeEvent(self, event):
+        """关闭时结束函数执行线程"""
+        self.worker.stop()
+        super().closeEvent(event)
+    
     def get_result_data(self):
         """获取计算结果数据"""
         return self.result_data
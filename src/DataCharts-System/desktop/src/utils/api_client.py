@@ -4,15 +4,229 @@ API客户端模块
 提供与后端服务通信的功能
 """
 
+import os
+import sys
+import hashlib
+import threading
 import requests
+import requests.adapters
 import json
-from typing import Optional, Dict, Any, List
-from PyQt6.QtCore import QObject, pyqtSignal, QThread
+from collections import OrderedDict
+from datetime import datetime
+from itertools import islice
+from typing import Optional, Dict, Any, List, Callable, Iterator
+from PyQt6.QtCore import QCoreApplication, QObject, QRunnable, QThreadPool, pyqtSignal
+
+# 添加共享模块路径
+shared_path = os.path.abspath(os.path.join(os.path.dirname(__file__), '..', '..', '..', 'shared'))
+if shared_path not in sys.path:
+    sys.path.insert(0, shared_path)
+
+try:
+    from reliability.retry import call_with_retry
+    from reliability.circuit import CircuitBreaker, CircuitOpenError, OPEN
+    RELIABILITY_AVAILABLE = True
+except ImportError:
+    RELIABILITY_AVAILABLE = False
+    OPEN = "open"
+
+    class CircuitOpenError(Exception):
+        pass
+
+    def call_with_retry(fn, **kwargs):
+        """共享模块不可用时不重试"""
+        return fn()
+
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
+
+# 导入结果中仅供本地使用的字段（列式数组、预览表格），发送到后端前去除
+_LOCAL_ONLY_KEYS = ("columns", "preview")
+
+
+def _without_columns(data: Any) -> Any:
+    """去除导入结果中仅供本地使用的字段，后端只需要记录数据"""
+    if isinstance(data, dict) and any(key in data for key in _LOCAL_ONLY_KEYS):
+        return {key: value for key, value in data.items() if key not in _LOCAL_ONLY_KEYS}
+    return data
+
+
+def _is_dataframe(value: Any) -> bool:
+    """判断是否为DataFrame，避免为此导入pandas"""
+    return hasattr(value, "to_dict") and hasattr(value, "columns")
+
+
+def _json_default(value: Any) -> Any:
+    """序列化时按需转换非JSON原生类型，DataFrame仅在发送请求时才展开为记录列表"""
+    if _is_dataframe(value):
+        return value.to_dict('records')
+    if hasattr(value, "tolist"):
+        return value.tolist()
+    if hasattr(value, "isoformat"):
+        return value.isoformat()
+    raise TypeError(f"无法序列化类型: {type(value).__name__}")
+
+
+def _dumps(payload: Any) -> bytes:
+    """序列化请求体，orjson可用时优先使用（速度更快且原生支持NumPy数组）"""
+    if ORJSON_AVAILABLE:
+        return orjson.dumps(payload, default=_json_default,
+                            option=orjson.OPT_SERIALIZE_NUMPY | orjson.OPT_NON_STR_KEYS)
+    return json.dumps(payload, default=_json_default).encode('utf-8')
+
+
+# 流式上传时每个数据块包含的记录数
+UPLOAD_CHUNK_ROWS = 5000
+
+
+def _iter_record_chunks(data: Any) -> Iterator[Any]:
+    """按UPLOAD_CHUNK_ROWS条记录切分数据，支持列表、DataFrame和任意记录迭代器"""
+    if _is_dataframe(data):
+        for start in range(0, len(data), UPLOAD_CHUNK_ROWS):
+            yield data.iloc[start:start + UPLOAD_CHUNK_ROWS]
+    elif isinstance(data, (list, tuple)):
+        for start in range(0, len(data), UPLOAD_CHUNK_ROWS):
+            yield data[start:start + UPLOAD_CHUNK_ROWS]
+    else:
+        records = iter(data)
+        while True:
+            chunk = list(islice(records, UPLOAD_CHUNK_ROWS))
+            if not chunk:
+                break
+            yield chunk
+
+
+def _iter_upload_body(data: Any, meta: Dict[str, Any],
+                      progress_callback: Optional[Callable[[int, int], None]] = None) -> Iterator[bytes]:
+    """
+    按块生成上传请求体，生成的字节流拼接后与一次性序列化 {"data": ..., **meta} 的JSON等价
+    
+    Args:
+        data: 记录列表、DataFrame或记录迭代器
+        meta: 除data以外的请求字段
+        progress_callback: 每发送一个数据块后以 (已发送记录数, 总记录数) 调用，
+            迭代器无法预知总数，不回调
+    """
+    total = len(data) if hasattr(data, "__len__") else None
+    sent = 0
+    yield b'{"data":['
+    for chunk in _iter_record_chunks(data):
+        # 去掉数组两端的方括号，各块之间以逗号连接
+        body = _dumps(chunk)[1:-1]
+        yield body if sent == 0 else b',' + body
+        sent += len(chunk)
+        if progress_callback and total is not None:
+            progress_callback(sent, total)
+    yield b'],' + _dumps(meta)[1:]
+
+
+# 连接池大小：同一后端保持的keep-alive连接数，导入、函数、图表等线程并发调用时复用连接
+HTTP_POOL_SIZE = 20
+
+# 各线程池同时执行的API调用数：快速接口与耗时接口分开限流，
+# 上传、数据处理等长耗时调用不会占满线程而阻塞解析、连接测试等快速调用
+API_POOL_SIZES = {"fast": 4, "slow": 2}
+
+# API方法所属的线程池，未列出的方法使用slow
+API_METHOD_POOLS = {
+    "test_connection": "fast",
+    "get_api_info": "fast",
+    "parse_function": "fast",
+    "upload_data": "slow",
+    "upload_file": "slow",
+    "process_data": "slow",
+    "apply_function": "slow",
+    "create_chart": "slow",
+    "export_chart": "slow",
+}
+
+# 请求的最大尝试次数（含首次请求），健康检查只重试一次
+REQUEST_MAX_ATTEMPTS = 5
+PROBE_MAX_ATTEMPTS = 2
+
+# 幂等请求遇到这些异常时重试
+_RETRYABLE_ERRORS = (requests.exceptions.ConnectionError, requests.exceptions.Timeout)
+# 上传等非幂等请求只在连接尚未建立时重试，避免后端重复保存数据
+_RETRYABLE_UPLOAD_ERRORS = (requests.exceptions.ConnectTimeout,)
+# 非幂等请求只在服务端明确未处理（限流、暂不可用）时按响应重试
+_RETRYABLE_UPLOAD_STATUS = (429, 503)
+
+
+# 客户端缓存的函数解析结果数量
+PARSE_RESULT_CACHE_SIZE = 256
+
+# 客户端缓存的函数应用结果数量与总字节数上限（按响应体大小计），避免长期持有大数据集的计算结果
+APPLY_RESULT_CACHE_SIZE = 64
+APPLY_RESULT_CACHE_BYTES = 64 * 1024 * 1024
+
+
+class _ResultCache:
+    """线程安全的LRU结果缓存，按条目数和总字节数淘汰最久未使用的结果"""
+    
+    def __init__(self, max_entries: int, max_bytes: Optional[int] = None):
+        self.max_entries = max_entries
+        self.max_bytes = max_bytes
+        self._entries: "OrderedDict[Any, tuple]" = OrderedDict()
+        self._bytes = 0
+        self._lock = threading.Lock()
+    
+    def get(self, key: Any) -> Optional[Dict[str, Any]]:
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return None
+            self._entries.move_to_end(key)
+            # 返回浅拷贝，调用方增删字段不影响缓存
+            return dict(entry[0])
+    
+    def put(self, key: Any, result: Dict[str, Any], size: int = 0):
+        if self.max_bytes is not None and size > self.max_bytes:
+            return
+        with self._lock:
+            old = self._entries.pop(key, None)
+            if old is not None:
+                self._bytes -= old[1]
+            self._entries[key] = (dict(result), size)
+            self._bytes += size
+            while len(self._entries) > self.max_entries or (
+                    self.max_bytes is not None and self._bytes > self.max_bytes):
+                _, (_, evicted) = self._entries.popitem(last=False)
+                self._bytes -= evicted
+    
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+            self._bytes = 0
+
+
+def _should_retry(response: requests.Response) -> bool:
+    """5xx和429响应需要重试，其余4xx（参数、认证错误等）重试也不会成功"""
+    return response.status_code >= 500 or response.status_code == 429
+
+
+def _should_retry_upload(response: requests.Response) -> bool:
+    return response.status_code in _RETRYABLE_UPLOAD_STATUS
+
+
+def _retry_after(response: requests.Response) -> Optional[float]:
+    """读取Retry-After响应头中的等待秒数，缺失或为HTTP日期格式时返回None"""
+    value = response.headers.get("Retry-After")
+    try:
+        return max(0.0, float(value)) if value is not None else None
+    except ValueError:
+        return None
 
 
 class APIClient(QObject):
     """API客户端类"""
     
+    # 熔断器状态变化（closed/open/half_open），可能在API调用线程中发出
+    circuit_state_changed = pyqtSignal(str)
+    
     def __init__(self, base_url: str = "http://localhost:8000"):
         super().__init__()
         self.base_url = base_url.rstrip('/')
@@ -21,11 +235,83 @@ class APIClient(QObject):
             'Content-Type': 'application/json',
             'Accept': 'application/json'
         })
+        adapter = requests.adapters.HTTPAdapter(
+            pool_connections=HTTP_POOL_SIZE, pool_maxsize=HTTP_POOL_SIZE, max_retries=0
+        )
+        self.session.mount('http://', adapter)
+        self.session.mount('https://', adapter)
+        
+        # 解析与函数应用的结果只取决于请求内容，相同请求直接返回缓存结果
+        self._parse_cache = _ResultCache(PARSE_RESULT_CACHE_SIZE)
+        self._apply_cache = _ResultCache(APPLY_RESULT_CACHE_SIZE, APPLY_RESULT_CACHE_BYTES)
+        
+        # 后端连续不可用时熔断，后续调用立即返回错误而不是等待超时
+        self.breaker = CircuitBreaker() if RELIABILITY_AVAILABLE else None
+        if self.breaker is not None:
+            self.breaker.add_listener(self.circuit_state_changed.emit)
+    
+    def close(self):
+        """关闭会话并释放连接池中的连接，清空结果缓存"""
+        self.session.close()
+        self._parse_cache.clear()
+        self._apply_cache.clear()
+    
+    def _request(self, method: str, path: str, max_attempts: int = REQUEST_MAX_ATTEMPTS,
+                 idempotent: bool = True, body_factory: Optional[Callable[[], Any]] = None,
+                 **kwargs) -> requests.Response:
+        """
+        发送请求，连接失败、超时或5xx/429响应时按全抖动指数退避重试；
+        重试用尽后仍失败计入熔断器，熔断期间直接抛出CircuitOpenError
+        
+        Args:
+            method: HTTP方法
+            path: 以/开头的接口路径
+            max_attempts: 最大尝试次数
+            idempotent: 是否为幂等请求；非幂等请求只在连接未建立或服务端返回429/503时重试
+            body_factory: 每次尝试时重新生成请求体（流式生成器只能发送一次）
+            **kwargs: 传给requests的其他参数
+        
+        Returns:
+            requests.Response: 最后一次请求的响应；重试用尽后抛出最后一次的异常
+        
+        Raises:
+            CircuitOpenError: 熔断期间请求被拒绝
+        """
+        if self.breaker is not None and not self.breaker.allow_request():
+            raise CircuitOpenError()
+        url = f"{self.base_url}{path}"
+        
+        def send():
+            if body_factory is not None:
+                kwargs["data"] = body_factory()
+            return self.session.request(method, url, **kwargs)
+        
+        try:
+            response = call_with_retry(
+                send,
+                max_attempts=max_attempts,
+                retry_on=_RETRYABLE_ERRORS if idempotent else _RETRYABLE_UPLOAD_ERRORS,
+                retry_if=_should_retry if idempotent else _should_retry_upload,
+                delay_hint=_retry_after
+            )
+        except Exception:
+            # 任何异常都要回报给熔断器，否则HALF_OPEN探测得不到结果
+            if self.breaker is not None:
+                self.breaker.record_failure()
+            raise
+        
+        if self.breaker is not None:
+            # 4xx说明后端在正常处理请求，只有5xx计为失败
+            if response.status_code >= 500:
+                self.breaker.record_failure()
+            else:
+                self.breaker.record_success()
+        return response
     
     def test_connection(self) -> Dict[str, Any]:
         """测试与后端的连接"""
         try:
-            response = self.session.get(f"{self.base_url}/health", timeout=5)
+            response = self._request("GET", "/health", max_attempts=PROBE_MAX_ATTEMPTS, timeout=5)
             if response.status_code == 200:
                 return {
                     "status": "success",
@@ -37,6 +323,11 @@ class APIClient(QObject):
                     "status": "error",
                     "message": f"服务器响应错误: {response.status_code}"
                 }
+        except CircuitOpenError as e:
+            return {
+                "status": "error",
+                "message": str(e)
+            }
         except requests.exceptions.ConnectionError:
             return {
                 "status": "error",
@@ -56,7 +347,7 @@ class APIClient(QObject):
     def get_api_info(self) -> Dict[str, Any]:
         """获取API信息"""
         try:
-            response = self.session.get(f"{self.base_url}/api/info", timeout=5)
+            response = self._request("GET", "/api/info", timeout=5)
             if response.status_code == 200:
                 return {
                     "status": "success",
@@ -73,20 +364,38 @@ class APIClient(QObject):
                 "message": f"获取API信息失败: {str(e)}"
             }
     
-    def upload_data(self, data: Any, file_info: Dict = None) -> Dict[str, Any]:
-        """上传数据到后端"""
+    def upload_data(self, data: Any, file_info: Dict = None,
+                    progress_callback: Optional[Callable[[int, int], None]] = None) -> Dict[str, Any]:
+        """
+        上传数据到后端
+        
+        记录列表、DataFrame和记录迭代器以分块传输编码流式发送，边序列化边上传，
+        不在内存中构建完整的JSON字符串
+        
+        Args:
+            data: 要上传的数据，可为逐条产生记录的迭代器/生成器
+            file_info: 文件信息
+            progress_callback: 流式上传时每发送一个数据块后以 (已发送记录数, 总记录数) 调用
+        """
         try:
-            payload = {
-                "data": data,
+            meta = {
                 "file_info": file_info or {},
-                "timestamp": str(self.get_current_timestamp())
+                "timestamp": self.get_current_timestamp()
             }
             
-            response = self.session.post(
-                f"{self.base_url}/api/data/upload",
-                json=payload,
-                timeout=30
-            )
+            if isinstance(data, Iterator):
+                # 迭代器只能消费一次，无法重新生成请求体，不重试
+                body = _iter_upload_body(data, meta, progress_callback)
+                response = self._request("POST", "/api/data/upload", max_attempts=1,
+                                         data=body, timeout=30)
+            else:
+                if isinstance(data, (list, tuple)) or _is_dataframe(data):
+                    body_factory = lambda: _iter_upload_body(data, meta, progress_callback)
+                else:
+                    payload = _dumps({"data": data, **meta})
+                    body_factory = lambda: payload
+                response = self._request("POST", "/api/data/upload", idempotent=False,
+                                         body_factory=body_factory, timeout=30)
             
             if response.status_code == 200:
                 return {
@@ -104,6 +413,46 @@ class APIClient(QObject):
                 "message": f"数据上传失败: {str(e)}"
             }
     
+    def upload_file(self, file_path: str) -> Dict[str, Any]:
+        """
+        以multipart形式上传原始文件，由后端自行解析，避免将本地解析结果重新序列化为JSON
+        
+        Args:
+            file_path: 文件路径
+        """
+        try:
+            with open(file_path, 'rb') as f:
+                def rewind():
+                    # 重试时从文件头重新发送
+                    f.seek(0)
+                    return None
+                
+                response = self._request(
+                    "POST", "/api/data/upload",
+                    idempotent=False,
+                    body_factory=rewind,
+                    files={"file": (os.path.basename(file_path), f)},
+                    # 移除会话默认的JSON Content-Type，由requests生成multipart边界
+                    headers={"Content-Type": None},
+                    timeout=60
+                )
+            
+            if response.status_code == 200:
+                return {
+                    "status": "success",
+                    "data": response.json()
+                }
+            else:
+                return {
+                    "status": "error",
+                    "message": f"文件上传失败: {response.status_code}"
+                }
+        except Exception as e:
+            return {
+                "status": "error",
+                "message": f"文件上传失败: {str(e)}"
+            }
+    
     def process_data(self, data: Any, processing_config: Dict) -> Dict[str, Any]:
         """处理数据"""
         try:
@@ -112,11 +461,7 @@ class APIClient(QObject):
                 "config": processing_config
             }
             
-            response = self.session.post(
-                f"{self.base_url}/api/data/process",
-                json=payload,
-                timeout=60
-            )
+            response = self._request("POST", "/api/data/process", data=_dumps(payload), timeout=60)
             
             if response.status_code == 200:
                 return {
@@ -135,23 +480,24 @@ class APIClient(QObject):
             }
     
     def parse_function(self, expression: str) -> Dict[str, Any]:
-        """解析函数表达式"""
+        """解析函数表达式，成功的结果按表达式缓存"""
+        cached = self._parse_cache.get(expression)
+        if cached is not None:
+            return cached
         try:
             payload = {
                 "expression": expression
             }
             
-            response = self.session.post(
-                f"{self.base_url}/api/function/parse",
-                json=payload,
-                timeout=10
-            )
+            response = self._request("POST", "/api/function/parse", data=_dumps(payload), timeout=10)
             
             if response.status_code == 200:
-                return {
+                result = {
                     "status": "success",
                     "data": response.json()
                 }
+                self._parse_cache.put(expression, result)
+                return result
             else:
                 return {
                     "status": "error",
@@ -164,25 +510,33 @@ class APIClient(QObject):
             }
     
     def apply_function(self, expression: str, data: Any, variables: List = None) -> Dict[str, Any]:
-        """应用函数到数据"""
+        """
+        应用函数到数据
+        
+        成功的结果以请求体摘要为键缓存：请求体本来就要序列化，摘要同时覆盖表达式、数据和变量，
+        无需单独对数据求哈希
+        """
         try:
             payload = {
                 "expression": expression,
-                "data": data,
+                "data": _without_columns(data),
                 "variables": variables or []
             }
+            body = _dumps(payload)
+            key = hashlib.blake2b(body, digest_size=16).digest()
+            cached = self._apply_cache.get(key)
+            if cached is not None:
+                return cached
             
-            response = self.session.post(
-                f"{self.base_url}/api/function/apply",
-                json=payload,
-                timeout=60
-            )
+            response = self._request("POST", "/api/function/apply", data=body, timeout=60)
             
             if response.status_code == 200:
-                return {
+                result = {
                     "status": "success",
                     "data": response.json()
                 }
+                self._apply_cache.put(key, result, len(response.content))
+                return result
             else:
                 return {
                     "status": "error",
@@ -197,11 +551,10 @@ class APIClient(QObject):
     def create_chart(self, chart_config: Dict) -> Dict[str, Any]:
         """创建图表"""
         try:
-            response = self.session.post(
-                f"{self.base_url}/api/chart/create",
-                json=chart_config,
-                timeout=30
-            )
+            if "data" in chart_config:
+                chart_config = {**chart_config, "data": _without_columns(chart_config["data"])}
+            
+            response = self._request("POST", "/api/chart/create", data=_dumps(chart_config), timeout=30)
             
             if response.status_code == 200:
                 return {
@@ -222,8 +575,8 @@ class APIClient(QObject):
     def export_chart(self, chart_id: str, export_format: str = "png") -> Dict[str, Any]:
         """导出图表"""
         try:
-            response = self.session.get(
-                f"{self.base_url}/api/chart/{chart_id}/export",
+            response = self._request(
+                "GET", f"/api/chart/{chart_id}/export",
                 params={"format": export_format},
                 timeout=30
             )
@@ -244,68 +597,142 @@ class APIClient(QObject):
                 "message": f"图表导出失败: {str(e)}"
             }
     
-    def get_current_timestamp(self):
-        """获取当前时间戳"""
-        from datetime import datetime
+    def get_current_timestamp(self) -> str:
+        """获取当前时间戳（ISO 8601字符串）"""
         return datetime.now().isoformat()
 
 
-class APIWorker(QThread):
-    """API调用工作线程"""
+class APIWorkerSignals(QObject):
+    """API调用任务的信号，QRunnable不是QObject，不能直接定义信号"""
     
     finished = pyqtSignal(object)
     error = pyqtSignal(str)
     progress = pyqtSignal(int)
+    # 任务结束（无论成功失败），在finished/error之后发出
+    done = pyqtSignal()
+
+
+class APIWorker(QRunnable):
+    """
+    API调用任务
+
+    提交到APIManager的线程池中执行，线程在多次调用间复用；
+    连接信号后再调用APIManager.start，避免任务在连接前完成
+    """
     
-    def __init__(self, api_client: APIClient, method: str, *args, **kwargs):
+    def __init__(self, api_method: Callable[..., Dict[str, Any]], *args, **kwargs):
+        """
+        Args:
+            api_method: APIClient的绑定方法，如 api_client.test_connection
+            *args, **kwargs: 调用参数
+        """
         super().__init__()
-        self.api_client = api_client
-        self.method = method
+        self.api_method = api_method
         self.args = args
         self.kwargs = kwargs
+        self.signals = APIWorkerSignals()
     
     def run(self):
         """执行API调用"""
         try:
-            self.progress.emit(10)
-            
-            # 获取API客户端方法
-            api_method = getattr(self.api_client, self.method)
-            if not api_method:
-                self.error.emit(f"未找到API方法: {self.method}")
-                return
-            
-            self.progress.emit(50)
+            self.call()
+        finally:
+            self.signals.done.emit()
+    
+    def call(self):
+        """执行API调用"""
+        try:
+            self.signals.progress.emit(10)
             
             # 调用API方法
-            result = api_method(*self.args, **self.kwargs)
-            self.progress.emit(100)
+            result = self.api_method(*self.args, **self.kwargs)
+            self.signals.progress.emit(100)
             
             if result.get("status") == "success":
-                self.finished.emit(result)
+                self.signals.finished.emit(result)
             else:
-                self.error.emit(result.get("message", "API调用失败"))
+                self.signals.error.emit(result.get("message", "API调用失败"))
                 
         except Exception as e:
-            self.error.emit(f"API调用异常: {str(e)}")
+            self.signals.error.emit(f"API调用异常: {str(e)}")
+
+
+_shared_clients: Dict[str, APIClient] = {}
+
+
+def shared_client(base_url: str = "http://localhost:8000") -> APIClient:
+    """
+    获取指定后端地址共享的API客户端，同一地址的所有调用方复用同一会话和连接池
+
+    Args:
+        base_url: 后端服务地址
+
+    Returns:
+        APIClient: 共享的API客户端
+    """
+    key = base_url.rstrip('/')
+    client = _shared_clients.get(key)
+    if client is None:
+        client = _shared_clients[key] = APIClient(key)
+    return client
 
 
 class APIManager(QObject):
     """API管理器"""
     
     connection_tested = pyqtSignal(object)
+    # 已提交但尚未结束（执行中或在线程池中排队）的API调用数
+    queued_count = pyqtSignal(int)
+    # 后端熔断状态变化，界面据此禁用或恢复依赖后端的按钮
+    circuit_state_changed = pyqtSignal(str)
     
-    def __init__(self, base_url: str = "http://localhost:8000"):
+    def __init__(self, base_url: str = "http://localhost:8000", api_client: Optional[APIClient] = None):
         super().__init__()
-        self.api_client = APIClient(base_url)
+        self.api_client = api_client or shared_client(base_url)
         self.is_connected = False
+        
+        # 按接口耗时划分的有界线程池，线程池满时新任务在池内排队
+        self._pools: Dict[str, QThreadPool] = {}
+        for name, size in API_POOL_SIZES.items():
+            pool = QThreadPool(self)
+            pool.setMaxThreadCount(size)
+            self._pools[name] = pool
+        # 持有未结束的任务，保证信号对象在结果送达前不被回收
+        self._pending = set()
+        self.api_client.circuit_state_changed.connect(self._on_circuit_state_changed)
+        app = QCoreApplication.instance()
+        if app is not None:
+            app.aboutToQuit.connect(self.close)
+    
+    def create_worker(self, api_method: Callable[..., Dict[str, Any]], *args, **kwargs) -> APIWorker:
+        """创建API调用任务，连接信号后通过start提交；api_method为APIClient的绑定方法"""
+        return APIWorker(api_method, *args, **kwargs)
+    
+    def start(self, worker: APIWorker):
+        """将API调用任务提交到所属线程池"""
+        self._pending.add(worker)
+        worker.signals.done.connect(lambda: self._on_worker_done(worker))
+        self.queued_count.emit(len(self._pending))
+        self._pools[API_METHOD_POOLS.get(worker.api_method.__name__, "slow")].start(worker)
     
     def test_connection_async(self):
         """异步测试连接"""
-        self.worker = APIWorker(self.api_client, "test_connection")
-        self.worker.finished.connect(self._on_connection_tested)
-        self.worker.error.connect(self._on_connection_error)
-        self.worker.start()
+        worker = self.create_worker(self.api_client.test_connection)
+        worker.signals.finished.connect(self._on_connection_tested)
+        worker.signals.error.connect(self._on_connection_error)
+        self.start(worker)
+    
+    def close(self):
+        """丢弃排队中的任务，等待执行中的调用结束并关闭客户端会话"""
+        for pool in self._pools.values():
+            pool.clear()
+            pool.waitForDone()
+        self.api_client.close()
+    
+    def _on_worker_done(self, worker: APIWorker):
+        """API调用任务结束"""
+        self._pending.discard(worker)
+        self.queued_count.emit(len(self._pending))
     
     def _on_connection_tested(self, result):
         """连接测试完成"""
@@ -320,6 +747,12 @@ class APIManager(QObject):
             "message": error_msg
         })
     
+    def _on_circuit_state_changed(self, state: str):
+        """熔断状态变化"""
+        if state == OPEN:
+            self.is_connected = False
+        self.circuit_state_changed.emit(state)
+    
     def get_client(self) -> APIClient:
         """获取API客户端"""
         return self.api_client
@@ -0,0 +1,95 @@
+"""
+文件编码检测模块
+
+读取文本类数据文件前检测一次编码，避免非UTF-8文件解码失败后用户只能重新导入
+"""
+
+import codecs
+import os
+from functools import lru_cache
+
+try:
+    import chardet
+    CHARDET_AVAILABLE = True
+except ImportError:
+    CHARDET_AVAILABLE = False
+
+try:
+    import charset_normalizer
+    CHARSET_NORMALIZER_AVAILABLE = True
+except ImportError:
+    CHARSET_NORMALIZER_AVAILABLE = False
+
+
+# 用于检测编码的文件头部字节数
+ENCODING_SAMPLE_SIZE = 65536
+
+# 无法检测时使用的编码，兼容GBK/GB2312编码的中文文件
+FALLBACK_ENCODING = 'gb18030'
+
+# 按长度从长到短排列，避免UTF-32 LE的BOM被误判为UTF-16 LE
+_BOMS = (
+    (codecs.BOM_UTF32_LE, 'utf-32'),
+    (codecs.BOM_UTF32_BE, 'utf-32'),
+    (codecs.BOM_UTF8, 'utf-8-sig'),
+    (codecs.BOM_UTF16_LE, 'utf-16'),
+    (codecs.BOM_UTF16_BE, 'utf-16'),
+)
+
+
+def _is_utf8(raw: bytes) -> bool:
+    """判断字节内容是否为合法UTF-8，允许采样末尾截断的多字节字符"""
+    try:
+        codecs.getincrementaldecoder('utf-8')().decode(raw, final=False)
+        return True
+    except UnicodeDecodeError:
+        return False
+
+
+def sniff_encoding(raw: bytes) -> str:
+    """
+    根据文件头部字节推断编码
+
+    依次检查BOM、UTF-8合法性，再交给chardet/charset_normalizer判断
+
+    Args:
+        raw: 文件头部的字节内容
+
+    Returns:
+        str: 可直接用于open()/decode()的编码名称
+    """
+    for bom, encoding in _BOMS:
+        if raw.startswith(bom):
+            return encoding
+    if _is_utf8(raw):
+        return 'utf-8'
+
+    if CHARDET_AVAILABLE:
+        encoding = chardet.detect(raw).get('encoding')
+        if encoding:
+            return encoding
+    elif CHARSET_NORMALIZER_AVAILABLE:
+        best = charset_normalizer.from_bytes(raw).best()
+        if best is not None:
+            return best.encoding
+    return FALLBACK_ENCODING
+
+
+@lru_cache(maxsize=64)
+def _detect_cached(file_path: str, mtime_ns: int, size: int) -> str:
+    with open(file_path, 'rb') as f:
+        return sniff_encoding(f.read(ENCODING_SAMPLE_SIZE))
+
+
+def detect_encoding(file_path: str) -> str:
+    """
+    检测文件编码，结果按 (路径, 修改时间, 大小) 缓存，重复导入同一文件时不再读取
+
+    Args:
+        file_path: 文件路径
+
+    Returns:
+        str: 编码名称
+    """
+    stat = os.stat(file_path)
+    return _detect_cached(file_path, stat.st_mtime_ns, stat.st_size)
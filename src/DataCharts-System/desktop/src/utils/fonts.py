@@ -0,0 +1,26 @@
+"""
+字体缓存模块
+
+按参数缓存QFont对象，避免每次创建组件时重复进行字体匹配查找
+"""
+
+from functools import lru_cache
+from PyQt6.QtGui import QFont
+
+
+@lru_cache(maxsize=None)
+def get_font(family: str, size: int, weight: QFont.Weight = QFont.Weight.Normal) -> QFont:
+    """
+    获取缓存的字体对象
+
+    需在QApplication创建之后调用；返回的对象为共享实例，调用方不应修改
+
+    Args:
+        family: 字体族
+        size: 字号
+        weight: 字重
+
+    Returns:
+        QFont: 字体对象
+    """
+    return QFont(family, size, weight)
@@ -0,0 +1,29 @@
+"""
+占位符组件模块
+
+UI组件导入失败时使用的占位符，仅在主程序的导入降级分支中加载
+"""
+
+from PyQt6.QtWidgets import QLabel
+
+
+def make_placeholder(name: str, text: str) -> type:
+    """
+    创建占位符组件类
+
+    Args:
+        name: 类名
+        text: 占位符显示文本
+
+    Returns:
+        type: 与真实组件构造签名一致的QLabel子类
+    """
+    def __init__(self, api_manager=None):
+        QLabel.__init__(self, text)
+
+    return type(name, (QLabel,), {'__init__': __init__})
+
+
+DataImportWidget = make_placeholder('DataImportWidget', "数据导入组件占位符")
+FunctionWidget = make_placeholder('FunctionWidget', "函数处理组件占位符")
+ChartWidget = make_placeholder('ChartWidget', "图表显示组件占位符")
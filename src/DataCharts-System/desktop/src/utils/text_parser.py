@@ -0,0 +1,124 @@
+"""
+文本数值解析模块
+
+为每行一个数值的文本文件提供Numba JIT解析，Numba不可用或遇到无法精确解析的内容时返回None，
+由调用方回退到逐行float()转换
+"""
+
+from typing import Optional
+
+import numpy as np
+
+try:
+    import numba
+    NUMBA_AVAILABLE = True
+except ImportError:
+    NUMBA_AVAILABLE = False
+
+
+# 10的0~22次幂均可由float64精确表示，尾数不超过2^53时一次乘除即可得到正确舍入的结果
+_POW10 = np.array([10.0 ** k for k in range(23)])
+_MAX_MANTISSA = 2 ** 53
+
+
+if NUMBA_AVAILABLE:
+
+    @numba.njit(cache=True)
+    def _is_space(c):
+        # 空格、\t、\v、\f、\r，不含换行符
+        return c == 32 or (9 <= c <= 13 and c != 10)
+
+    @numba.njit(cache=True)
+    def _parse_float_lines_kernel(buf, out):
+        n = buf.shape[0]
+        count = 0
+        i = 0
+        while i < n:
+            while i < n and _is_space(buf[i]):
+                i += 1
+            if i >= n:
+                break
+            if buf[i] == 10:
+                # 空行
+                i += 1
+                continue
+
+            negative = False
+            if buf[i] == 45 or buf[i] == 43:
+                negative = buf[i] == 45
+                i += 1
+
+            mantissa = 0
+            exp10 = 0
+            has_digit = False
+            while i < n and 48 <= buf[i] <= 57:
+                mantissa = mantissa * 10 + (buf[i] - 48)
+                has_digit = True
+                i += 1
+                if mantissa >= _MAX_MANTISSA:
+                    return -1
+            if i < n and buf[i] == 46:
+                i += 1
+                while i < n and 48 <= buf[i] <= 57:
+                    mantissa = mantissa * 10 + (buf[i] - 48)
+                    exp10 -= 1
+                    has_digit = True
+                    i += 1
+                    if mantissa >= _MAX_MANTISSA:
+                        return -1
+            if not has_digit:
+                return -1
+
+            if i < n and (buf[i] == 101 or buf[i] == 69):
+                i += 1
+                exp_negative = False
+                if i < n and (buf[i] == 45 or buf[i] == 43):
+                    exp_negative = buf[i] == 45
+                    i += 1
+                exponent = 0
+                exp_digits = 0
+                while i < n and 48 <= buf[i] <= 57:
+                    exponent = exponent * 10 + (buf[i] - 48)
+                    exp_digits += 1
+                    i += 1
+                    if exponent > 400:
+                        return -1
+                if exp_digits == 0:
+                    return -1
+                exp10 += -exponent if exp_negative else exponent
+
+            # 数值之后只允许空白直到行尾
+            while i < n and buf[i] != 10:
+                if not _is_space(buf[i]):
+                    return -1
+                i += 1
+
+            if exp10 < -22 or exp10 > 22:
+                return -1
+            value = float(mantissa)
+            if exp10 >= 0:
+                value = value * _POW10[exp10]
+            else:
+                value = value / _POW10[-exp10]
+            out[count] = -value if negative else value
+            count += 1
+        return count
+
+
+def parse_float_lines(raw) -> Optional[np.ndarray]:
+    """
+    解析每行一个数值的文本内容，忽略空行和行首尾空白
+
+    Args:
+        raw: 文件的原始字节内容，可为bytes或mmap等支持缓冲区协议的对象
+
+    Returns:
+        Optional[np.ndarray]: float64数组；Numba不可用或内容中存在无法精确解析的行时返回None
+    """
+    if not NUMBA_AVAILABLE:
+        return None
+
+    buf = np.frombuffer(raw, dtype=np.uint8)
+    out = np.empty(int(np.count_nonzero(buf == 10)) + 1, dtype=np.float64)
+    count = _parse_float_lines_kernel(buf, out)
+    return out[:count] if count >= 0 else None
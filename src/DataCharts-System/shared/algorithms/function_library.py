@@ -5,9 +5,11 @@
 """
 
 import numpy as np
-import pandas as pd
 import scipy.ndimage
-from typing import Dict, List, Any, Callable
+from types import MappingProxyType
+from typing import Dict, List, Any, Callable, FrozenSet, Mapping
+
+from . import numeric_kernels
 
 
 class FunctionLibrary:
@@ -44,8 +46,8 @@ class FunctionLibrary:
     
     # 数据变换函数
     TRANSFORM_FUNCTIONS = {
-        'normalize': lambda x: (x - np.min(x)) / (np.max(x) - np.min(x)) if np.max(x) != np.min(x) else x,
-        'standardize': lambda x: (x - np.mean(x)) / np.std(x) if np.std(x) != 0 else x,
+        'normalize': numeric_kernels.normalize,
+        'standardize': numeric_kernels.standardize,
         'scale': lambda x, factor=1: x * factor,
         'log_transform': lambda x: np.log(np.where(x > 0, x, 1)),
         'power_transform': lambda x, power=2: np.power(x, power)
@@ -53,26 +55,29 @@ class FunctionLibrary:
     
     # 滤波函数
     FILTER_FUNCTIONS = {
-        'moving_average': lambda x, window=5: pd.Series(x).rolling(window=window, center=True).mean().fillna(method='bfill').fillna(method='ffill'),
+        'moving_average': numeric_kernels.moving_average,
         'gaussian_filter': lambda x, sigma=1: scipy.ndimage.gaussian_filter1d(x, sigma),
         'median_filter': lambda x, size=3: scipy.ndimage.median_filter(x, size=size),
-        'rolling_sum': lambda x, window=5: pd.Series(x).rolling(window=window).sum().fillna(0)
+        'rolling_sum': numeric_kernels.rolling_sum,
+        'box_filter': numeric_kernels.box_filter
     }
     
+    # 合并后的函数表与函数名集合，在类定义后构建一次
+    _ALL_FUNCTIONS: Mapping[str, Callable] = MappingProxyType({})
+    _ALL_NAMES: FrozenSet[str] = frozenset()
+    # 分类名到函数名列表、函数名到分类名的映射
+    _CATEGORIES: Dict[str, List[str]] = {}
+    _NAME_TO_CATEGORY: Dict[str, str] = {}
+    
     @classmethod
-    def get_all_functions(cls) -> Dict[str, Callable]:
+    def get_all_functions(cls) -> Mapping[str, Callable]:
         """
         获取所有可用函数
         
         Returns:
-            Dict[str, Callable]: 函数名到函数对象的映射
+            Mapping[str, Callable]: 函数名到函数对象的只读映射
         """
-        all_functions = {}
-        all_functions.update(cls.MATH_FUNCTIONS)
-        all_functions.update(cls.STATISTICAL_FUNCTIONS)
-        all_functions.update(cls.TRANSFORM_FUNCTIONS)
-        all_functions.update(cls.FILTER_FUNCTIONS)
-        return all_functions
+        return cls._ALL_FUNCTIONS
     
     @classmethod
     def get_function_categories(cls) -> Dict[str, List[str]]:
@@ -80,14 +85,9 @@ class FunctionLibrary:
         获取函数分类信息
         
         Returns:
-            Dict[str, List[str]]: 分类名到函数列表的映射
+            Dict[str, List[str]]: 分类名到函数列表的映射（共享对象，调用方不应修改）
         """
-        return {
-            '数学函数': list(cls.MATH_FUNCTIONS.keys()),
-            '统计函数': list(cls.STATISTICAL_FUNCTIONS.keys()),
-            '数据变换': list(cls.TRANSFORM_FUNCTIONS.keys()),
-            '滤波函数': list(cls.FILTER_FUNCTIONS.keys())
-        }
+        return cls._CATEGORIES
     
     @classmethod
     def get_supported_function_names(cls) -> List[str]:
@@ -97,7 +97,7 @@ class FunctionLibrary:
         Returns:
             List[str]: 支持的函数名列表
         """
-        return list(cls.get_all_functions().keys())
+        return list(cls._ALL_FUNCTIONS)
     
     @classmethod
     def is_function_supported(cls, func_name: str) -> bool:
@@ -110,7 +110,7 @@ class FunctionLibrary:
         Returns:
             bool: 是否支持该函数
         """
-        return func_name in cls.get_supported_function_names()
+        return func_name in cls._ALL_NAMES
     
     @classmethod
     def get_function(cls, func_name: str) -> Callable:
@@ -126,10 +126,9 @@ class FunctionLibrary:
         Raises:
             KeyError: 函数不存在时抛出
         """
-        all_functions = cls.get_all_functions()
-        if func_name not in all_functions:
+        if func_name not in cls._ALL_NAMES:
             raise KeyError(f"不支持的函数: {func_name}")
-        return all_functions[func_name]
+        return cls._ALL_FUNCTIONS[func_name]
     
     @classmethod
     def get_function_info(cls, func_name: str) -> Dict[str, Any]:
@@ -143,11 +142,7 @@ class FunctionLibrary:
             Dict[str, Any]: 函数信息
         """
         # 确定函数类别
-        category = None
-        for cat_name, func_list in cls.get_function_categories().items():
-            if func_name in func_list:
-                category = cat_name
-                break
+        category = cls._NAME_TO_CATEGORY.get(func_name)
         
         # 获取函数文档
         func = cls.get_function(func_name)
@@ -177,7 +172,7 @@ class FunctionLibrary:
                 return False
             
             # 基础参数检查
-            if func_name in ['moving_average', 'gaussian_filter', 'median_filter', 'rolling_sum']:
+            if func_name in ['moving_average', 'gaussian_filter', 'median_filter', 'rolling_sum', 'box_filter']:
                 # 这些函数需要至少一个参数
                 return len(args) >= 1
             elif func_name in ['scale', 'power_transform', 'quantile']:
@@ -189,3 +184,23 @@ class FunctionLibrary:
                 
         except Exception:
             return False
+
+
+FunctionLibrary._ALL_FUNCTIONS = MappingProxyType({
+    **FunctionLibrary.MATH_FUNCTIONS,
+    **FunctionLibrary.STATISTICAL_FUNCTIONS,
+    **FunctionLibrary.TRANSFORM_FUNCTIONS,
+    **FunctionLibrary.FILTER_FUNCTIONS
+})
+FunctionLibrary._ALL_NAMES = frozenset(FunctionLibrary._ALL_FUNCTIONS)
+FunctionLibrary._CATEGORIES = {
+    '数学函数': list(FunctionLibrary.MATH_FUNCTIONS),
+    '统计函数': list(FunctionLibrary.STATISTICAL_FUNCTIONS),
+    '数据变换': list(FunctionLibrary.TRANSFORM_FUNCTIONS),
+    '滤波函数': list(FunctionLibrary.FILTER_FUNCTIONS)
+}
+FunctionLibrary._NAME_TO_CATEGORY = {
+    name: category
+    for category, names in FunctionLibrary._CATEGORIES.items()
+    for name in names
+}
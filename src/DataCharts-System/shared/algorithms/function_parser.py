@@ -7,7 +7,8 @@
 import re
 import ast
 import sympy as sp
-from typing import List, Dict, Any, Set
+from functools import lru_cache
+from typing import List, Dict, Any, Set, FrozenSet, Tuple
 import sys
 import os
 
@@ -18,24 +19,85 @@ from data_types import FunctionExpression, FunctionParseError
 from .function_library import FunctionLibrary
 
 
+# 解析结果缓存的表达式数量（界面逐键校验时输入过程中的每个中间表达式都会缓存一次）
+PARSE_CACHE_SIZE = 1024
+
+_IDENTIFIER_PATTERN = re.compile(r'\b[a-zA-Z_][a-zA-Z0-9_]*\b')
+# 数值常数，由分组区分浮点数与整数
+_NUMBER_PATTERN = re.compile(r'\b(?:(?P<float>\d+\.\d*)|(?P<int>\d+))\b')
+_FUNCTION_CALL_PATTERN = re.compile(r'[a-zA-Z_][a-zA-Z0-9_]*\s*\(')
+_OPERATOR_PATTERN = re.compile(r'[+\-*/^%]')
+_SAFE_FUNCTION_PATTERN = re.compile(r'^[a-zA-Z_][a-zA-Z0-9_]*$')
+
+# 危险操作模式
+DANGEROUS_PATTERNS = (
+    r'__\w+__',  # 双下划线方法
+    r'import\s+',  # import语句
+    r'exec\s*\(',  # exec函数
+    r'eval\s*\(',  # eval函数
+    r'open\s*\(',  # open函数
+    r'file\s*\(',  # file函数
+    r'input\s*\(',  # input函数
+    r'raw_input\s*\(',  # raw_input函数
+)
+# 合并为单个正则，一次扫描完成全部检查
+_DANGEROUS_PATTERN = re.compile('|'.join(DANGEROUS_PATTERNS), re.IGNORECASE)
+# 每个危险模式都必然包含其中某个子串（小写），用于在正则之前快速排除常见的安全表达式
+_DANGEROUS_KEYWORDS = ('__', 'import', 'exec', 'eval', 'open', 'file', 'input')
+
+
+@lru_cache(maxsize=PARSE_CACHE_SIZE)
+def extract_identifiers(expression: str) -> FrozenSet[str]:
+    """
+    提取表达式中出现的全部标识符，供解析与执行分派共用
+
+    Args:
+        expression: 数学表达式字符串
+
+    Returns:
+        FrozenSet[str]: 标识符集合
+    """
+    return frozenset(_IDENTIFIER_PATTERN.findall(expression))
+
+
+@lru_cache(maxsize=PARSE_CACHE_SIZE)
+def nesting_depth(expression: str) -> int:
+    """
+    计算表达式的括号嵌套深度
+
+    逐字符扫描；界面输入的表达式通常不足百个字符，此时比NumPy前缀和快数倍。
+    安全检查与复杂度分析对同一表达式的重复查询命中缓存
+
+    Args:
+        expression: 表达式字符串
+
+    Returns:
+        int: 嵌套深度
+    """
+    if '(' not in expression:
+        return 0
+    depth = 0
+    max_depth = 0
+    for char in expression:
+        if char == '(':
+            depth += 1
+            if depth > max_depth:
+                max_depth = depth
+        elif char == ')':
+            depth -= 1
+    return max_depth
+
+
 class ExpressionParser:
     """表达式解析器类"""
     
     def __init__(self):
         self.function_library = FunctionLibrary()
-        # 安全的函数名模式
-        self.safe_function_pattern = re.compile(r'^[a-zA-Z_][a-zA-Z0-9_]*$')
-        # 危险操作模式
-        self.dangerous_patterns = [
-            r'__\w+__',  # 双下划线方法
-            r'import\s+',  # import语句
-            r'exec\s*\(',  # exec函数
-            r'eval\s*\(',  # eval函数
-            r'open\s*\(',  # open函数
-            r'file\s*\(',  # file函数
-            r'input\s*\(',  # input函数
-            r'raw_input\s*\(',  # raw_input函数
-        ]
+        # 支持的函数名集合，遍历表达式树时逐节点查询
+        self._all_names = FunctionLibrary._ALL_NAMES
+        # 安全的函数名模式与危险操作模式，在模块导入时编译一次
+        self.safe_function_pattern = _SAFE_FUNCTION_PATTERN
+        self.dangerous_patterns = list(DANGEROUS_PATTERNS)
     
     def parse_expression(self, expression: str) -> FunctionExpression:
         """
@@ -47,6 +109,23 @@ class ExpressionParser:
         Returns:
             FunctionExpression: 解析后的表达式对象
             
+        Raises:
+            FunctionParseError: 解析失败时抛出
+        """
+        parsed, result = _parse_cached(expression)
+        if not parsed:
+            raise FunctionParseError(result)
+        variables, parameters = result
+        return FunctionExpression(
+            expression=expression,
+            variables=list(variables),
+            parameters=dict(parameters)
+        )
+    
+    def _parse_uncached(self, expression: str) -> Tuple[Tuple[str, ...], Tuple[Tuple[str, Any], ...]]:
+        """
+        解析表达式并以不可变元组返回 (变量, 参数)，供缓存使用
+        
         Raises:
             FunctionParseError: 解析失败时抛出
         """
@@ -73,11 +152,7 @@ class ExpressionParser:
             # 创建参数字典
             parameters = self._extract_parameters(expression)
             
-            return FunctionExpression(
-                expression=expression,
-                variables=variables,
-                parameters=parameters
-            )
+            return tuple(variables), tuple(parameters.items())
             
         except FunctionParseError:
             raise
@@ -110,15 +185,17 @@ class ExpressionParser:
         Returns:
             bool: 是否安全
         """
-        # 检查危险模式
-        for pattern in self.dangerous_patterns:
-            if re.search(pattern, expression, re.IGNORECASE):
-                return False
-        
         # 检查字符长度限制
         if len(expression) > 1000:
             return False
         
+        # 检查危险模式：ASCII表达式先做子串预筛，不含任何关键字时正则不可能匹配；
+        # 非ASCII字符（如ı、İ）在忽略大小写时可与i匹配，直接交给正则
+        lowered = expression.lower()
+        if not expression.isascii() or any(keyword in lowered for keyword in _DANGEROUS_KEYWORDS):
+            if _DANGEROUS_PATTERN.search(expression) is not None:
+                return False
+        
         # 检查嵌套层次
         if self._get_nesting_depth(expression) > 10:
             return False
@@ -135,17 +212,7 @@ class ExpressionParser:
         Returns:
             int: 嵌套深度
         """
-        depth = 0
-        max_depth = 0
-        
-        for char in expression:
-            if char == '(':
-                depth += 1
-                max_depth = max(max_depth, depth)
-            elif char == ')':
-                depth -= 1
-        
-        return max_depth
+        return nesting_depth(expression)
     
     def _extract_variables(self, parsed_expr) -> List[str]:
         """
@@ -162,7 +229,7 @@ class ExpressionParser:
             # 过滤掉常数和函数名
             filtered_variables = []
             for var in variables:
-                if var not in ['pi', 'e', 'I'] and not self.function_library.is_function_supported(var):
+                if var not in ['pi', 'e', 'I'] and var not in self._all_names:
                     filtered_variables.append(var)
             return sorted(filtered_variables)
         except Exception:
@@ -179,23 +246,13 @@ class ExpressionParser:
             Set[str]: 使用的函数名集合
         """
         try:
+            # atoms只返回函数调用节点，不遍历符号、数字和运算节点
             functions = set()
-            
-            # 遍历表达式树
-            for node in sp.preorder_traversal(parsed_expr):
-                if hasattr(node, 'func') and hasattr(node.func, '__name__'):
-                    func_name = str(node.func.__name__)
-                    # 映射SymPy函数名到我们的函数名
-                    if func_name in ['sin', 'cos', 'tan', 'log', 'exp', 'sqrt', 'Abs']:
-                        if func_name == 'Abs':
-                            functions.add('abs')
-                        else:
-                            functions.add(func_name)
-                elif isinstance(node, sp.Function):
-                    func_name = str(type(node).__name__).lower()
-                    if func_name in self.function_library.get_supported_function_names():
-                        functions.add(func_name)
-            
+            for node in parsed_expr.atoms(sp.Function):
+                # SymPy的绝对值类名为Abs，其余函数类名小写后与函数库名称一致
+                func_name = type(node).__name__.lower()
+                if func_name in self._all_names:
+                    functions.add(func_name)
             return functions
         except Exception:
             return set()
@@ -232,20 +289,11 @@ class ExpressionParser:
         Returns:
             Dict[str, Any]: 参数字典
         """
-        parameters = {}
-        
         # 提取数值常数
-        numbers = re.findall(r'\b\d+\.?\d*\b', expression)
-        for i, num in enumerate(numbers):
-            try:
-                if '.' in num:
-                    parameters[f'const_{i}'] = float(num)
-                else:
-                    parameters[f'const_{i}'] = int(num)
-            except ValueError:
-                continue
-        
-        return parameters
+        return {
+            f'const_{i}': float(match['float']) if match['float'] else int(match['int'])
+            for i, match in enumerate(_NUMBER_PATTERN.finditer(expression))
+        }
     
     def get_expression_info(self, expression: str) -> Dict[str, Any]:
         """
@@ -291,13 +339,7 @@ class ExpressionParser:
         Returns:
             Dict[str, Any]: 复杂度信息
         """
-        return {
-            'length': len(expression),
-            'function_count': len(re.findall(r'[a-zA-Z_][a-zA-Z0-9_]*\s*\(', expression)),
-            'operator_count': len(re.findall(r'[+\-*/^%]', expression)),
-            'nesting_depth': self._get_nesting_depth(expression),
-            'variable_count': len(set(re.findall(r'\b[a-zA-Z_][a-zA-Z0-9_]*\b', expression)))
-        }
+        return dict(_complexity_cached(expression))
     
     def _estimate_execution_time(self, complexity: Dict[str, Any]) -> str:
         """
@@ -343,3 +385,34 @@ class ExpressionParser:
             return "中等内存使用"
         else:
             return "高内存使用"
+
+
+_DEFAULT_PARSER = ExpressionParser()
+
+
+@lru_cache(maxsize=PARSE_CACHE_SIZE)
+def _parse_cached(expression: str) -> Tuple[bool, Any]:
+    """
+    按表达式字符串缓存解析结果，解析结果只取决于表达式本身，无需失效
+
+    输入过程中的不完整表达式同样会被反复校验，解析失败时缓存错误信息
+
+    Returns:
+        Tuple[bool, Any]: 成功时为 (True, (变量, 参数))，失败时为 (False, 错误信息)
+    """
+    try:
+        return True, _DEFAULT_PARSER._parse_uncached(expression)
+    except FunctionParseError as e:
+        return False, str(e)
+
+
+@lru_cache(maxsize=PARSE_CACHE_SIZE)
+def _complexity_cached(expression: str) -> Tuple[Tuple[str, int], ...]:
+    """按表达式字符串缓存复杂度统计"""
+    return (
+        ('length', len(expression)),
+        ('function_count', len(_FUNCTION_CALL_PATTERN.findall(expression))),
+        ('operator_count', len(_OPERATOR_PATTERN.findall(expression))),
+        ('nesting_depth', nesting_depth(expression)),
+        ('variable_count', len(extract_identifiers(expression)))
+    )
@@ -0,0 +1,457 @@
+"""
+数值计算内核
+
+为函数库中的热点数值运算提供Numba JIT加速实现，Numba不可用时回退到NumPy向量化实现
+"""
+
+import ast
+import re
+from functools import lru_cache, partial
+from typing import Callable, Optional, Tuple
+
+import numpy as np
+import pandas as pd
+
+try:
+    import numba
+    NUMBA_AVAILABLE = True
+except ImportError:
+    NUMBA_AVAILABLE = False
+
+
+# 数据量超过该阈值时才使用并行JIT内核，小数组下线程调度开销大于收益
+PARALLEL_THRESHOLD = 100_000
+
+# 不启用nnan/ninf，保证数据中含NaN/Inf时结果与NumPy一致
+_FASTMATH_FLAGS = {'reassoc', 'contract', 'nsz'}
+
+# 所有内核均以nogil=True编译：参数只有数组和标量，执行期间释放GIL，桌面端界面线程不会被长时间计算阻塞
+
+
+if NUMBA_AVAILABLE:
+
+    # 均值由np.mean的成对求和得到，内核只并行累加离差平方：数据偏移量很大时
+    # 并行分块直接求和的舍入误差会被放大到结果中，而离差已消去偏移量
+    @numba.njit(cache=True, nogil=True, parallel=True, fastmath=_FASTMATH_FLAGS)
+    def _centered_std_kernel(x, mean):
+        sq_total = 0.0
+        for i in numba.prange(x.shape[0]):
+            diff = x[i] - mean
+            sq_total += diff * diff
+        return np.sqrt(sq_total / x.shape[0])
+
+    # 每个输出位置直接对窗口内元素求和，复杂度O(N·W)而非前缀和的O(N)：
+    # NaN/Inf只影响包含它的窗口；前缀和相减的误差随位置累积，
+    # 1e12偏移、1e6点时相对误差达1e-11，足以淹没小数部分的信号。
+    # 模板窗口通常只有几到几十个点，按位置并行后仍快于np.convolve
+    @numba.njit(cache=True, nogil=True, parallel=True)
+    def _box_filter_kernel(x, window):
+        n = x.shape[0]
+        offset = (window - 1) // 2
+        out = np.empty(n)
+        for i in numba.prange(n):
+            hi = min(i + offset + 1, n)
+            lo = max(i + offset + 1 - window, 0)
+            total = 0.0
+            for j in range(lo, hi):
+                total += x[j]
+            out[i] = total / window
+        return out
+
+    @numba.njit(cache=True, nogil=True, parallel=True, fastmath=_FASTMATH_FLAGS)
+    def _sqrt_kernel(x):
+        out = np.empty_like(x)
+        for i in numba.prange(x.shape[0]):
+            out[i] = np.sqrt(x[i])
+        return out
+
+    @numba.njit(cache=True, nogil=True, parallel=True, fastmath=_FASTMATH_FLAGS)
+    def _abs_kernel(x):
+        out = np.empty_like(x)
+        for i in numba.prange(x.shape[0]):
+            out[i] = abs(x[i])
+        return out
+
+    @numba.njit(cache=True, nogil=True, parallel=True)
+    def _min_max_kernel(x):
+        lo = np.inf
+        hi = -np.inf
+        nan_count = 0
+        for i in numba.prange(x.shape[0]):
+            v = x[i]
+            if v != v:
+                nan_count += 1
+            else:
+                lo = min(lo, v)
+                hi = max(hi, v)
+        return lo, hi, nan_count
+
+    @numba.njit(cache=True, nogil=True, parallel=True)
+    def _shift_scale_kernel(x, shift, scale):
+        out = np.empty_like(x)
+        for i in numba.prange(x.shape[0]):
+            out[i] = (x[i] - shift) / scale
+        return out
+
+    # 三角函数内核不启用fastmath，保证 b*x+c 的运算顺序与NumPy逐步计算一致
+    @numba.njit(cache=True, nogil=True, parallel=True)
+    def _sin_abc_kernel(x, a, b, c):
+        out = np.empty_like(x)
+        for i in numba.prange(x.shape[0]):
+            out[i] = a * np.sin(b * x[i] + c)
+        return out
+
+    @numba.njit(cache=True, nogil=True, parallel=True)
+    def _cos_abc_kernel(x, a, b, c):
+        out = np.empty_like(x)
+        for i in numba.prange(x.shape[0]):
+            out[i] = a * np.cos(b * x[i] + c)
+        return out
+
+
+def _as_float_vector(x) -> np.ndarray:
+    """将输入转换为连续的一维float64数组，无法转换时返回None"""
+    try:
+        arr = np.ascontiguousarray(x, dtype=np.float64)
+    except (TypeError, ValueError):
+        return None
+    return arr if arr.ndim == 1 else None
+
+
+def standardize(x):
+    """
+    Z-score标准化，等价于 (x - np.mean(x)) / np.std(x)
+
+    Args:
+        x: 输入数据
+
+    Returns:
+        标准化后的数组；标准差为0时原样返回输入
+    """
+    arr = _as_float_vector(x)
+    if NUMBA_AVAILABLE and arr is not None and arr.size >= PARALLEL_THRESHOLD:
+        mean = np.mean(arr)
+        std = _centered_std_kernel(arr, mean)
+        return _shift_scale_kernel(arr, mean, std) if std != 0 else x
+
+    std = np.std(x)
+    return (x - np.mean(x)) / std if std != 0 else x
+
+
+def normalize(x):
+    """
+    最小-最大归一化，等价于 (x - np.min(x)) / (np.max(x) - np.min(x))
+
+    最小值、最大值只计算一次；大数组时一次并行遍历同时求出两者，再并行写出结果
+
+    Args:
+        x: 输入数据
+
+    Returns:
+        归一化后的数组；取值全部相同时原样返回输入
+    """
+    arr = _as_float_vector(x)
+    if NUMBA_AVAILABLE and arr is not None and arr.size >= PARALLEL_THRESHOLD:
+        lo, hi, nan_count = _min_max_kernel(arr)
+        if nan_count == 0:
+            return _shift_scale_kernel(arr, lo, hi - lo) if hi != lo else x
+
+    lo = np.min(x)
+    span = np.max(x) - lo
+    return (x - lo) / span if span != 0 else x
+
+
+def box_filter(x, window: int = 5):
+    """
+    滑动窗口均值，等价于 np.convolve(x, np.ones(window)/window, mode='same')（允许浮点舍入误差）
+
+    可用Numba时按输出位置并行求窗口和并释放GIL，否则直接调用np.convolve
+
+    Args:
+        x: 输入数据
+        window: 窗口大小
+
+    Returns:
+        np.ndarray: 与输入等长的平滑结果
+    """
+    window = int(window)
+    arr = _as_float_vector(x)
+    if not NUMBA_AVAILABLE or arr is None or window < 1 or window > arr.size:
+        # 多维或窗口大于数据长度时保持np.convolve的原有语义
+        return np.convolve(x, np.ones(window) / window, mode='same')
+    return _box_filter_kernel(arr, window)
+
+
+def moving_average(x, window: int = 5):
+    """
+    居中移动平均，等价于 pd.Series(x).rolling(window, center=True).mean() 后向、前向填充边缘
+
+    用np.convolve一次求出所有完整窗口的和，不构造Series/Rolling对象
+
+    Args:
+        x: 输入数据
+        window: 窗口大小
+
+    Returns:
+        np.ndarray: 平滑后的数组
+    """
+    arr = _as_float_vector(x)
+    # pandas的滚动窗口把NaN和Inf都当作缺失值，含非有限值时交给pandas处理窗口和边缘填充；
+    # 不能只看np.sum是否为NaN，单个Inf的和仍是Inf
+    if arr is None or window > arr.size or not np.isfinite(arr).all():
+        return pd.Series(x).rolling(window=window, center=True).mean().bfill().ffill().to_numpy()
+
+    means = np.convolve(arr, np.ones(window), mode='valid') / window
+    # 与pandas的居中窗口对齐：第一个完整窗口的结果位于下标 window // 2
+    head = window // 2
+    out = np.empty(arr.size)
+    out[:head] = means[0]
+    out[head:head + means.size] = means
+    out[head + means.size:] = means[-1]
+    return out
+
+
+def rolling_sum(x, window: int = 5):
+    """
+    滚动求和，等价于 pd.Series(x).rolling(window).sum().fillna(0)
+
+    Args:
+        x: 输入数据
+        window: 窗口大小
+
+    Returns:
+        np.ndarray: 每个位置及其前 window-1 个元素之和，窗口不完整或含NaN/Inf时为0
+    """
+    arr = _as_float_vector(x)
+    # pandas把Inf也当作缺失值，含Inf的窗口结果为0，含非有限值时交给pandas处理
+    if arr is None or not np.isfinite(arr).all():
+        return pd.Series(x).rolling(window=window).sum().fillna(0).to_numpy()
+
+    out = np.zeros(arr.size)
+    if window <= arr.size:
+        out[window - 1:] = np.convolve(arr, np.ones(window), mode='valid')
+    return out
+
+
+def _parallel_float_vector(x) -> Optional[np.ndarray]:
+    """返回可交给并行逐元素内核的一维float64连续数组，不满足条件时返回None"""
+    if (NUMBA_AVAILABLE and isinstance(x, np.ndarray) and x.dtype == np.float64
+            and x.ndim == 1 and x.size >= PARALLEL_THRESHOLD):
+        return np.ascontiguousarray(x)
+    return None
+
+
+def parallel_sqrt(x):
+    """
+    逐元素平方根，等价于 np.sqrt(x)，大数组时多线程计算
+
+    Args:
+        x: 输入数据
+
+    Returns:
+        np.ndarray: 计算结果
+    """
+    arr = _parallel_float_vector(x)
+    return np.sqrt(x) if arr is None else _sqrt_kernel(arr)
+
+
+def parallel_abs(x):
+    """
+    逐元素绝对值，等价于 np.abs(x)，大数组时多线程计算
+
+    Args:
+        x: 输入数据
+
+    Returns:
+        np.ndarray: 计算结果
+    """
+    arr = _parallel_float_vector(x)
+    return np.abs(x) if arr is None else _abs_kernel(arr)
+
+
+def parallel_trig(x, func: str, a: float = 1.0, b: float = 1.0, c: float = 0.0):
+    """
+    计算 a * np.sin(b * x + c) 或 a * np.cos(b * x + c)，大数组时多线程计算
+
+    Args:
+        x: 输入数据
+        func: 'sin' 或 'cos'
+        a: 振幅
+        b: 频率
+        c: 相位
+
+    Returns:
+        np.ndarray: 计算结果
+    """
+    arr = _parallel_float_vector(x)
+    if arr is None:
+        return a * getattr(np, func)(b * x + c)
+    kernel = _sin_abc_kernel if func == 'sin' else _cos_abc_kernel
+    return kernel(arr, float(a), float(b), float(c))
+
+
+def zscore(x):
+    """
+    Z-score标准化，与直接求值 (x - np.mean(x)) / np.std(x) 的语义一致（标准差为0时同样得到NaN/Inf）
+
+    大数组时均值用np.mean成对求和，标准差并行归约离差平方，再并行写出结果
+
+    Args:
+        x: 输入数据
+
+    Returns:
+        np.ndarray: 计算结果
+    """
+    arr = _parallel_float_vector(x)
+    if arr is not None:
+        mean = np.mean(arr)
+        std = _centered_std_kernel(arr, mean)
+        if std != 0:
+            return _shift_scale_kernel(arr, mean, std)
+    return (x - np.mean(x)) / np.std(x)
+
+
+def min_max_normalize(x):
+    """
+    最小-最大归一化，与直接求值 (x - np.min(x)) / (np.max(x) - np.min(x)) 的语义一致
+
+    大数组时并行归约最小值和最大值，再并行写出结果；含NaN或取值全部相同时交给NumPy处理
+
+    Args:
+        x: 输入数据
+
+    Returns:
+        np.ndarray: 计算结果
+    """
+    arr = _parallel_float_vector(x)
+    if arr is not None:
+        lo, hi, nan_count = _min_max_kernel(arr)
+        if nan_count == 0 and hi != lo:
+            return _shift_scale_kernel(arr, lo, hi - lo)
+    return (x - np.min(x)) / (np.max(x) - np.min(x))
+
+
+# 函数模板表达式（去除空白后）到加速实现的映射，实现需与直接求值表达式的结果一致（允许浮点舍入误差）
+TEMPLATE_KERNELS = {
+    'np.sqrt(x)': parallel_sqrt,
+    'np.abs(x)': parallel_abs,
+    '(x-np.mean(x))/np.std(x)': zscore,
+    '(x-np.min(x))/(np.max(x)-np.min(x))': min_max_normalize,
+}
+
+_WHITESPACE_PATTERN = re.compile(r'\s+')
+
+
+def _literal(node: ast.AST) -> Optional[float]:
+    """返回数值字面量（含正负号）的值，不是数值字面量时返回None"""
+    if isinstance(node, ast.UnaryOp) and isinstance(node.op, (ast.USub, ast.UAdd)):
+        value = _literal(node.operand)
+        if value is None:
+            return None
+        return -value if isinstance(node.op, ast.USub) else value
+    if isinstance(node, ast.Constant) and type(node.value) in (int, float):
+        return float(node.value)
+    return None
+
+
+def _scaled(node: ast.AST, is_term: Callable[[ast.AST], bool]) -> Optional[Tuple[float, ast.AST]]:
+    """匹配 [k *] term 或 term * k，返回 (系数, term)"""
+    if is_term(node):
+        return 1.0, node
+    if isinstance(node, ast.BinOp) and isinstance(node.op, ast.Mult):
+        for factor, term in ((node.left, node.right), (node.right, node.left)):
+            k = _literal(factor)
+            if k is not None and is_term(term):
+                return k, term
+    return None
+
+
+def _is_x(node: ast.AST) -> bool:
+    return isinstance(node, ast.Name) and node.id == 'x'
+
+
+def _is_np_call(node: ast.AST, name: str) -> bool:
+    return (isinstance(node, ast.Call) and isinstance(node.func, ast.Attribute)
+            and isinstance(node.func.value, ast.Name) and node.func.value.id == 'np'
+            and node.func.attr == name)
+
+
+def _is_trig_call(node: ast.AST) -> bool:
+    return ((_is_np_call(node, 'sin') or _is_np_call(node, 'cos'))
+            and len(node.args) == 1 and not node.keywords)
+
+
+def _match_trig_template(expression: str) -> Optional[Callable]:
+    """匹配参数已填为数值的正弦/余弦模板，如 2 * np.sin(3 * x + 1)"""
+    try:
+        body = ast.parse(expression.strip(), mode='eval').body
+    except SyntaxError:
+        return None
+
+    outer = _scaled(body, _is_trig_call)
+    if outer is None:
+        return None
+    a, call = outer
+
+    inner = call.args[0]
+    c = 0.0
+    if isinstance(inner, ast.BinOp) and isinstance(inner.op, (ast.Add, ast.Sub)):
+        c = _literal(inner.right)
+        if c is None:
+            return None
+        if isinstance(inner.op, ast.Sub):
+            c = -c
+        inner = inner.left
+    scaled_x = _scaled(inner, _is_x)
+    if scaled_x is None:
+        return None
+    return partial(parallel_trig, func=call.func.attr, a=a, b=scaled_x[0], c=c)
+
+
+def _match_box_template(expression: str) -> Optional[Callable]:
+    """匹配滑动平均模板 np.convolve(x, np.ones(N)/N, mode='same')"""
+    try:
+        call = ast.parse(expression.strip(), mode='eval').body
+    except SyntaxError:
+        return None
+    if not _is_np_call(call, 'convolve') or len(call.args) not in (2, 3):
+        return None
+
+    modes = [kw.value for kw in call.keywords if kw.arg == 'mode']
+    if len(call.args) == 3:
+        modes.append(call.args[2])
+    if len(modes) != 1 or len(call.keywords) != len(modes) - (len(call.args) == 3):
+        return None
+    mode = modes[0]
+    if not (isinstance(mode, ast.Constant) and mode.value == 'same') or not _is_x(call.args[0]):
+        return None
+
+    kernel = call.args[1]
+    if not (isinstance(kernel, ast.BinOp) and isinstance(kernel.op, ast.Div)
+            and _is_np_call(kernel.left, 'ones') and len(kernel.left.args) == 1
+            and not kernel.left.keywords):
+        return None
+    size = kernel.left.args[0]
+    divisor = kernel.right
+    if not (isinstance(size, ast.Constant) and type(size.value) is int and size.value >= 1
+            and isinstance(divisor, ast.Constant) and type(divisor.value) in (int, float)
+            and divisor.value == size.value):
+        return None
+    return partial(box_filter, window=size.value)
+
+
+@lru_cache(maxsize=256)
+def match_template_kernel(expression: str) -> Optional[Callable]:
+    """
+    查找与表达式对应的模板加速实现
+
+    Args:
+        expression: 函数表达式
+
+    Returns:
+        Optional[Callable]: 以x为唯一参数的实现；表达式不是已注册的模板时返回None
+    """
+    kernel = TEMPLATE_KERNELS.get(_WHITESPACE_PATTERN.sub('', expression))
+    if kernel is None:
+        kernel = _match_trig_template(expression) or _match_box_template(expression)
+    return kernel
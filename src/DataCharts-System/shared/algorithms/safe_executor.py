@@ -4,14 +4,19 @@
 提供沙箱环境来安全地执行数学表达式计算
 """
 
+import ast
+import math
 import numpy as np
 import pandas as pd
 import time
 import signal
-from typing import Dict, Any, List, Optional
+import threading
+from typing import Dict, Any, List, Optional, Tuple
 import sys
 import os
 from contextlib import contextmanager
+from functools import lru_cache
+from types import CodeType
 
 # 添加数据类型路径
 sys.path.append(os.path.join(os.path.dirname(__file__), '..'))
@@ -19,15 +24,140 @@ from data_types import ProcessingResult, DataSource, FunctionParseError
 
 from .function_library import FunctionLibrary
 
+try:
+    import numexpr as ne
+    NUMEXPR_AVAILABLE = True
+except ImportError:
+    NUMEXPR_AVAILABLE = False
+
 
 class ExecutionTimeoutError(Exception):
     """执行超时异常"""
     pass
 
 
+# 安装本模块处理器之前的SIGALRM处理器，不是由本模块定时器触发的信号转交给它
+_previous_alarm_handler = None
+# 本模块设置的定时器是否正在计时，只在主线程中读写
+_alarm_armed = False
+
+
+def _alarm_callback(signum, frame):
+    """本模块定时器到期时抛出超时异常，其他代码设置的定时器到期时调用原处理器"""
+    if _alarm_armed:
+        raise ExecutionTimeoutError()
+    if callable(_previous_alarm_handler):
+        _previous_alarm_handler(signum, frame)
+
+
+def _ensure_alarm_handler():
+    """
+    安装SIGALRM处理器，只在首次使用或被其他代码替换后调用signal.signal
+
+    处理器是进程级的，安装后不再恢复；原处理器被保存下来并由_alarm_callback转调，
+    原处理器为SIG_DFL/SIG_IGN时，非本模块触发的SIGALRM被忽略
+    """
+    global _previous_alarm_handler
+    current = signal.getsignal(signal.SIGALRM)
+    if current is not _alarm_callback:
+        _previous_alarm_handler = current
+        signal.signal(signal.SIGALRM, _alarm_callback)
+
+
+# 编译结果缓存的表达式数量
+CODE_CACHE_SIZE = 512
+
+
+# 数组元素数不少于该值时才交给numexpr，小数组下numexpr的编译与线程调度开销大于收益
+NUMEXPR_THRESHOLD = 10_000
+
+# numexpr支持且与NumPy同名的逐元素函数，表达式中可写作 sin(x) 或 np.sin(x)
+NUMEXPR_FUNCTIONS = frozenset([
+    'sin', 'cos', 'tan', 'arcsin', 'arccos', 'arctan', 'sinh', 'cosh', 'tanh',
+    'log', 'log10', 'log1p', 'exp', 'expm1', 'sqrt', 'abs'
+])
+
+# numexpr与NumPy语义一致的运算符；取模（numexpr按C语言fmod处理负数）不在其中
+_NUMEXPR_BINARY_OPS = (ast.Add, ast.Sub, ast.Mult, ast.Div, ast.Pow)
+_NUMEXPR_UNARY_OPS = (ast.UAdd, ast.USub)
+
+
+def _numexpr_function(node: ast.AST) -> Optional[str]:
+    """返回调用节点对应的numexpr函数名（sin(x) 或 np.sin(x)），不支持时返回None"""
+    if not isinstance(node, ast.Call) or len(node.args) != 1 or node.keywords:
+        return None
+    func = node.func
+    if isinstance(func, ast.Name) and func.id in NUMEXPR_FUNCTIONS:
+        return func.id
+    if (isinstance(func, ast.Attribute) and isinstance(func.value, ast.Name)
+            and func.value.id == 'np' and func.attr in NUMEXPR_FUNCTIONS):
+        return func.attr
+    return None
+
+
+@lru_cache(maxsize=CODE_CACHE_SIZE)
+def numexpr_form(expression: str) -> Optional[Tuple[str, Tuple[str, ...], Tuple[str, ...]]]:
+    """
+    判断表达式是否只包含numexpr支持的算术运算与逐元素函数，并转换为numexpr语法
+
+    Args:
+        expression: 要执行的表达式
+
+    Returns:
+        Optional[Tuple]: (numexpr表达式, 引用的变量名, 以裸名调用的函数名)；无法交给numexpr时返回None
+    """
+    try:
+        tree = ast.parse(expression, mode='eval')
+    except SyntaxError:
+        return None
+
+    variables = set()
+    bare_functions = set()
+
+    def visit(node: ast.AST) -> bool:
+        if isinstance(node, ast.BinOp):
+            return isinstance(node.op, _NUMEXPR_BINARY_OPS) and visit(node.left) and visit(node.right)
+        if isinstance(node, ast.UnaryOp):
+            return isinstance(node.op, _NUMEXPR_UNARY_OPS) and visit(node.operand)
+        if isinstance(node, ast.Constant):
+            return type(node.value) in (int, float)
+        if isinstance(node, ast.Name):
+            variables.add(node.id)
+            return True
+        name = _numexpr_function(node)
+        if name is None:
+            return False
+        if isinstance(node.func, ast.Name):
+            bare_functions.add(name)
+        # 去掉np.前缀
+        node.func = ast.Name(id=name, ctx=ast.Load())
+        return visit(node.args[0])
+
+    if not visit(tree.body):
+        return None
+    return ast.unparse(tree), tuple(sorted(variables)), tuple(sorted(bare_functions))
+
+
+@lru_cache(maxsize=CODE_CACHE_SIZE)
+def compile_expression(expression: str) -> CodeType:
+    """
+    编译表达式并按表达式字符串缓存代码对象，重复执行同一表达式时不再重新编译
+
+    Args:
+        expression: 要编译的表达式
+
+    Returns:
+        CodeType: eval模式的代码对象
+    """
+    return compile(expression, '<expr>', 'eval')
+
+
 class SafeExecutionEnvironment:
     """安全执行环境类"""
     
+    # 执行表达式使用的全局命名空间，不提供任何内置函数；表达式为eval模式，无法修改该字典，所有调用共用
+    _RESTRICTED_GLOBALS = {"__builtins__": {}}
+    
     def __init__(self, max_execution_time: int = 30, max_memory_mb: int = 256):
         """
         初始化安全执行环境
@@ -108,29 +238,35 @@ class SafeExecutionEnvironment:
         """
         超时处理上下文管理器
         
+        Unix主线程中用SIGALRM中断执行，处理器只安装一次，每次调用只设置和取消定时器，
+        其他代码已设置的定时器在结束后按剩余时间恢复；
+        信号只能在主线程中处理，其他线程（桌面端工作线程、后端线程池）及Windows下
+        改为执行结束后按单调时钟检查是否超过截止时间
+        
         Args:
             seconds: 超时秒数
         """
-        def timeout_callback(signum, frame):
-            raise ExecutionTimeoutError(f"执行超时 ({seconds}秒)")
-        
-        # 设置信号处理器（仅在Unix系统上）
-        if hasattr(signal, 'SIGALRM'):
-            old_handler = signal.signal(signal.SIGALRM, timeout_callback)
-            signal.alarm(seconds)
+        global _alarm_armed
+        if hasattr(signal, 'SIGALRM') and threading.current_thread() is threading.main_thread():
+            _ensure_alarm_handler()
+            # 进程只有一个alarm定时器，记下其他代码设置的剩余时间，结束后重新设置
+            start = time.monotonic()
+            previous_remaining = signal.alarm(seconds)
+            _alarm_armed = True
             try:
                 yield
+            except ExecutionTimeoutError:
+                raise ExecutionTimeoutError(f"执行超时 ({seconds}秒)") from None
             finally:
+                _alarm_armed = False
                 signal.alarm(0)
-                signal.signal(signal.SIGALRM, old_handler)
+                if previous_remaining:
+                    signal.alarm(max(1, math.ceil(previous_remaining - (time.monotonic() - start))))
         else:
-            # Windows系统使用简单的时间检查
-            start_time = time.time()
-            try:
-                yield
-            finally:
-                if time.time() - start_time > seconds:
-                    raise ExecutionTimeoutError(f"执行超时 ({seconds}秒)")
+            deadline = time.monotonic() + seconds
+            yield
+            if time.monotonic() > deadline:
+                raise ExecutionTimeoutError(f"执行超时 ({seconds}秒)")
     
     def execute_expression(self, expression: str, namespace: Dict[str, Any]) -> Any:
         """
@@ -149,8 +285,11 @@ class SafeExecutionEnvironment:
         """
         try:
             with self.timeout_handler(self.max_execution_time):
-                # 使用eval在受限环境中执行表达式
-                result = eval(expression, {"__builtins__": {}}, namespace)
+                # 纯算术表达式交给numexpr分块融合计算，不产生中间数组
+                result = self._evaluate_numexpr(expression, namespace)
+                if result is None:
+                    # 使用eval在受限环境中执行表达式
+                    result = eval(compile_expression(expression), self._RESTRICTED_GLOBALS, namespace)
                 return result
                 
         except ExecutionTimeoutError:
@@ -158,6 +297,46 @@ class SafeExecutionEnvironment:
         except Exception as e:
             raise FunctionParseError(f"表达式执行失败: {str(e)}")
     
+    def _evaluate_numexpr(self, expression: str, namespace: Dict[str, Any]) -> Optional[np.ndarray]:
+        """
+        用numexpr执行表达式
+
+        仅当表达式可转换为numexpr语法、引用的变量均为float64数组或浮点标量（至少一个数组且不小于
+        NUMEXPR_THRESHOLD）、以裸名调用的函数确为NumPy同名函数时执行，保证结果与eval一致（允许浮点舍入误差）
+
+        Returns:
+            Optional[np.ndarray]: 计算结果；不满足条件或numexpr执行失败时返回None，由调用方回退到eval
+        """
+        if not NUMEXPR_AVAILABLE:
+            return None
+        form = numexpr_form(expression)
+        if form is None:
+            return None
+        translated, variables, bare_functions = form
+
+        # 数据变量可能与函数同名，裸名调用的函数必须仍指向NumPy函数
+        if any(namespace.get(name) is not getattr(np, name) for name in bare_functions):
+            return None
+
+        local_dict = {}
+        has_array = False
+        for name in variables:
+            value = namespace.get(name)
+            if isinstance(value, np.ndarray):
+                if value.dtype != np.float64:
+                    return None
+                has_array = has_array or value.size >= NUMEXPR_THRESHOLD
+            elif type(value) is not float:
+                return None
+            local_dict[name] = value
+        if not has_array:
+            return None
+
+        try:
+            return ne.evaluate(translated, local_dict=local_dict, global_dict={})
+        except (KeyError, NotImplementedError, TypeError, ValueError):
+            return None
+    
     def apply_function_to_data(self, data: DataSource, expression: str, 
                              variables: List[str]) -> ProcessingResult:
         """
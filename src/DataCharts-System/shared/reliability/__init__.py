@@ -0,0 +1,16 @@
+"""
+可靠性模块
+
+包含网络调用的重试、熔断等容错机制
+"""
+
+from .retry import backoff_delay, call_with_retry, retry
+from .circuit import CircuitBreaker, CircuitOpenError
+
+__all__ = [
+    'backoff_delay',
+    'call_with_retry',
+    'retry',
+    'CircuitBreaker',
+    'CircuitOpenError'
+]
@@ -0,0 +1,116 @@
+"""
+熔断器
+
+连续失败达到阈值后在冷却时间内直接拒绝调用，冷却结束后放行一次探测调用，
+探测成功则恢复，失败则重新熔断，避免后端不可用时每次调用都等待完整超时
+"""
+
+import threading
+import time
+from typing import Callable, List
+
+
+# 默认连续失败阈值
+DEFAULT_FAILURE_THRESHOLD = 5
+
+# 默认熔断冷却时间（秒）
+DEFAULT_RECOVERY_TIMEOUT = 30.0
+
+# 熔断器状态
+CLOSED = "closed"
+OPEN = "open"
+HALF_OPEN = "half_open"
+
+
+class CircuitOpenError(Exception):
+    """熔断期间调用被拒绝"""
+
+    def __init__(self, message: str = "后端服务暂不可用，请稍后重试"):
+        super().__init__(message)
+
+
+class CircuitBreaker:
+    """
+    熔断器
+
+    CLOSED：正常放行，记录连续失败次数；
+    OPEN：冷却时间内拒绝所有调用；
+    HALF_OPEN：冷却结束后只放行一次探测调用，其余调用继续拒绝，
+               探测超过冷却时间仍无结果时重新放行一次探测
+    """
+
+    def __init__(self, failure_threshold: int = DEFAULT_FAILURE_THRESHOLD,
+                 recovery_timeout: float = DEFAULT_RECOVERY_TIMEOUT,
+                 clock: Callable[[], float] = time.monotonic):
+        self.failure_threshold = failure_threshold
+        self.recovery_timeout = recovery_timeout
+        self.state = CLOSED
+        self.fail_count = 0
+        self.opened_at = 0.0
+        self._clock = clock
+        self._lock = threading.Lock()
+        self._listeners: List[Callable[[str], None]] = []
+
+    def add_listener(self, callback: Callable[[str], None]):
+        """注册状态变化回调，回调在触发状态变化的线程中调用"""
+        self._listeners.append(callback)
+
+    def allow_request(self) -> bool:
+        """
+        判断当前是否放行调用，冷却结束时转为HALF_OPEN并放行本次探测；
+        探测在冷却时间内未回报结果时视为丢失，再放行一次探测，避免卡在HALF_OPEN
+        """
+        with self._lock:
+            if self.state == CLOSED:
+                return True
+            now = self._clock()
+            if now - self.opened_at < self.recovery_timeout:
+                return False
+            self.opened_at = now
+            if self.state == HALF_OPEN:
+                return True
+            self.state = HALF_OPEN
+        self._notify(HALF_OPEN)
+        return True
+
+    def record_success(self):
+        """调用成功，清零失败次数并关闭熔断器"""
+        with self._lock:
+            self.fail_count = 0
+            if self.state == CLOSED:
+                return
+            self.state = CLOSED
+        self._notify(CLOSED)
+
+    def record_failure(self):
+        """调用失败，探测失败或连续失败达到阈值时熔断"""
+        with self._lock:
+            self.fail_count += 1
+            if self.state == OPEN:
+                return
+            if self.state == CLOSED and self.fail_count < self.failure_threshold:
+                return
+            self.state = OPEN
+            self.opened_at = self._clock()
+        self._notify(OPEN)
+
+    def call(self, fn: Callable, *args, **kwargs):
+        """
+        经熔断器调用fn，fn抛出异常计为失败
+
+        Raises:
+            CircuitOpenError: 熔断期间调用被拒绝
+        """
+        if not self.allow_request():
+            raise CircuitOpenError()
+        try:
+            result = fn(*args, **kwargs)
+        except Exception:
+            self.record_failure()
+            raise
+        self.record_success()
+        return result
+
+    def _notify(self, state: str):
+        for callback in self._listeners:
+            callback(state)
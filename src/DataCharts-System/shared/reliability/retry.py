@@ -0,0 +1,90 @@
+"""
+重试机制
+
+提供带全抖动（full jitter）指数退避的有限次数重试，多个调用方同时失败时重试时间相互错开，
+避免同步重试冲击刚恢复的服务
+"""
+
+import random
+import time
+from functools import wraps
+from typing import Any, Callable, Optional, Tuple, Type
+
+
+# 默认最大尝试次数（含首次调用）
+DEFAULT_MAX_ATTEMPTS = 5
+
+# 退避基准时间与单次等待上限（秒）
+DEFAULT_BASE_DELAY = 0.1
+DEFAULT_MAX_DELAY = 10.0
+
+
+def backoff_delay(attempt: int, base: float = DEFAULT_BASE_DELAY, cap: float = DEFAULT_MAX_DELAY) -> float:
+    """
+    计算第attempt次失败后的等待时间：在 [0, min(cap, base * 2^attempt)] 内均匀取值
+
+    Args:
+        attempt: 已失败的次数减1（首次失败为0）
+        base: 退避基准时间（秒）
+        cap: 等待上限（秒）
+
+    Returns:
+        float: 等待秒数
+    """
+    return random.uniform(0, min(cap, base * (2 ** attempt)))
+
+
+def call_with_retry(fn: Callable[[], Any],
+                    max_attempts: int = DEFAULT_MAX_ATTEMPTS,
+                    base: float = DEFAULT_BASE_DELAY,
+                    cap: float = DEFAULT_MAX_DELAY,
+                    retry_on: Tuple[Type[BaseException], ...] = (),
+                    retry_if: Optional[Callable[[Any], bool]] = None,
+                    delay_hint: Optional[Callable[[Any], Optional[float]]] = None,
+                    sleep: Callable[[float], None] = time.sleep) -> Any:
+    """
+    调用fn，失败时按全抖动指数退避重试
+
+    Args:
+        fn: 无参数的调用
+        max_attempts: 最大尝试次数（含首次调用）
+        base: 退避基准时间（秒）
+        cap: 单次等待上限（秒）
+        retry_on: 需要重试的异常类型，其他异常直接抛出
+        retry_if: 根据返回值判断是否需要重试（如5xx响应）
+        delay_hint: 根据需要重试的返回值给出服务端建议的等待时间（如Retry-After），返回None时使用退避时间
+        sleep: 等待函数
+
+    Returns:
+        Any: 最后一次调用的返回值；重试次数用尽时返回最后一次的结果或抛出最后一次的异常
+    """
+    for attempt in range(max_attempts):
+        last = attempt == max_attempts - 1
+        hint = None
+        try:
+            result = fn()
+        except retry_on:
+            if last:
+                raise
+        else:
+            if last or retry_if is None or not retry_if(result):
+                return result
+            if delay_hint is not None:
+                hint = delay_hint(result)
+        sleep(min(cap, hint) if hint is not None else backoff_delay(attempt, base, cap))
+
+
+def retry(max_attempts: int = DEFAULT_MAX_ATTEMPTS,
+          base: float = DEFAULT_BASE_DELAY,
+          cap: float = DEFAULT_MAX_DELAY,
+          retry_on: Tuple[Type[BaseException], ...] = (),
+          retry_if: Optional[Callable[[Any], bool]] = None,
+          delay_hint: Optional[Callable[[Any], Optional[float]]] = None) -> Callable:
+    """重试装饰器，参数含义同call_with_retry"""
+    def decorator(fn: Callable) -> Callable:
+        @wraps(fn)
+        def wrapper(*args, **kwargs):
+            return call_with_retry(lambda: fn(*args, **kwargs), max_attempts=max_attempts, base=base,
+                                   cap=cap, retry_on=retry_on, retry_if=retry_if, delay_hint=delay_hint)
+        return wrapper
+    return decorator
@@ -0,0 +1,108 @@
+# -*- coding: utf-8 -*-
+"""
+API客户端测试
+
+解析与函数应用结果缓存的LRU淘汰，请求异常时熔断器的状态回报
+"""
+
+import os
+import sys
+
+import pytest
+import requests
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'desktop', 'src'))
+
+from utils.api_client import RELIABILITY_AVAILABLE, APIClient, _ResultCache
+
+
+class TestResultCache:
+    """_ResultCache 按条目数和字节数淘汰最久未使用的结果"""
+
+    def test_returns_copy(self):
+        cache = _ResultCache(max_entries=2)
+        cache.put('a', {'status': 'success'})
+        cache.get('a')['extra'] = 1
+        assert cache.get('a') == {'status': 'success'}
+
+    def test_evicts_least_recently_used_entry(self):
+        cache = _ResultCache(max_entries=2)
+        cache.put('a', {'v': 1})
+        cache.put('b', {'v': 2})
+        cache.get('a')
+        cache.put('c', {'v': 3})
+        assert cache.get('b') is None
+        assert cache.get('a') == {'v': 1} and cache.get('c') == {'v': 3}
+
+    def test_evicts_by_total_bytes(self):
+        cache = _ResultCache(max_entries=10, max_bytes=100)
+        cache.put('a', {'v': 1}, size=60)
+        cache.put('b', {'v': 2}, size=30)
+        cache.put('c', {'v': 3}, size=30)
+        assert cache.get('a') is None
+        assert cache.get('b') == {'v': 2} and cache.get('c') == {'v': 3}
+
+    def test_oversized_result_not_cached(self):
+        cache = _ResultCache(max_entries=10, max_bytes=100)
+        cache.put('a', {'v': 1}, size=50)
+        cache.put('big', {'v': 2}, size=101)
+        assert cache.get('big') is None
+        assert cache.get('a') == {'v': 1}
+
+    def test_replacing_key_updates_size(self):
+        cache = _ResultCache(max_entries=10, max_bytes=100)
+        cache.put('a', {'v': 1}, size=80)
+        cache.put('a', {'v': 2}, size=10)
+        cache.put('b', {'v': 3}, size=80)
+        assert cache.get('a') == {'v': 2} and cache.get('b') == {'v': 3}
+
+    def test_clear(self):
+        cache = _ResultCache(max_entries=2)
+        cache.put('a', {'v': 1})
+        cache.clear()
+        assert cache.get('a') is None
+
+
+@pytest.mark.skipif(not RELIABILITY_AVAILABLE, reason="reliability 模块不可用")
+class TestRequestBreaker:
+    """_request 抛出任何异常都回报熔断器，HALF_OPEN 探测不会悬空"""
+
+    def _half_open_client(self, monkeypatch, error):
+        from reliability import CircuitBreaker
+
+        client = APIClient()
+        client.breaker = CircuitBreaker(failure_threshold=1, recovery_timeout=0.0)
+        client.breaker.record_failure()
+
+        def fail(*args, **kwargs):
+            raise error
+
+        monkeypatch.setattr(client.session, 'request', fail)
+        return client
+
+    def test_non_retryable_error_reopens_breaker(self, monkeypatch):
+        client = self._half_open_client(
+            monkeypatch, requests.exceptions.ChunkedEncodingError("truncated"))
+        with pytest.raises(requests.exceptions.ChunkedEncodingError):
+            client._request("GET", "/health")
+        assert client.breaker.state == "open"
+        # 冷却结束后仍可再次探测，而不是一直拒绝
+        assert client.breaker.allow_request()
+
+    def test_body_factory_error_reopens_breaker(self, monkeypatch):
+        client = self._half_open_client(monkeypatch, AssertionError("unreachable"))
+
+        def broken_body():
+            raise TypeError("not serializable")
+
+        with pytest.raises(TypeError):
+            client._request("POST", "/api/data/parse", body_factory=broken_body)
+        assert client.breaker.state == "open"
+
+    def test_probe_success_closes_breaker(self, monkeypatch):
+        client = self._half_open_client(monkeypatch, AssertionError("unreachable"))
+        response = requests.Response()
+        response.status_code = 200
+        monkeypatch.setattr(client.session, 'request', lambda *a, **k: response)
+        assert client._request("GET", "/health") is response
+        assert client.breaker.state == "closed"
@@ -0,0 +1,118 @@
+# -*- coding: utf-8 -*-
+"""
+熔断器测试
+
+CLOSED -> OPEN -> HALF_OPEN -> CLOSED/OPEN 的状态转换，时钟由测试手动推进
+"""
+
+import os
+import sys
+
+import pytest
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'shared'))
+
+from reliability import CircuitBreaker, CircuitOpenError
+from reliability.circuit import CLOSED, HALF_OPEN, OPEN
+
+
+class FakeClock:
+    """可手动推进的单调时钟"""
+
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self):
+        return self.now
+
+
+@pytest.fixture
+def breaker():
+    clock = FakeClock()
+    cb = CircuitBreaker(failure_threshold=3, recovery_timeout=10.0, clock=clock)
+    cb.clock = clock
+    cb.events = []
+    cb.add_listener(cb.events.append)
+    return cb
+
+
+class TestCircuitBreaker:
+    """CLOSED -> OPEN -> HALF_OPEN -> CLOSED/OPEN 状态转换"""
+
+    def test_opens_after_threshold(self, breaker):
+        for _ in range(2):
+            breaker.record_failure()
+        assert breaker.state == CLOSED and breaker.allow_request()
+        breaker.record_failure()
+        assert breaker.state == OPEN
+        assert not breaker.allow_request()
+        assert breaker.events == [OPEN]
+
+    def test_success_resets_failure_count(self, breaker):
+        breaker.record_failure()
+        breaker.record_failure()
+        breaker.record_success()
+        breaker.record_failure()
+        breaker.record_failure()
+        assert breaker.state == CLOSED
+        assert breaker.events == []
+
+    def test_half_open_after_recovery_timeout(self, breaker):
+        for _ in range(3):
+            breaker.record_failure()
+        breaker.clock.now = 9.9
+        assert not breaker.allow_request()
+        breaker.clock.now = 10.0
+        assert breaker.allow_request()
+        assert breaker.state == HALF_OPEN
+        # 探测期间只放行一次
+        assert not breaker.allow_request()
+        assert breaker.events == [OPEN, HALF_OPEN]
+
+    def test_lost_probe_expires_after_recovery_timeout(self, breaker):
+        for _ in range(3):
+            breaker.record_failure()
+        breaker.clock.now = 10.0
+        assert breaker.allow_request()
+        # 探测结果未回报，冷却时间后重新放行一次探测
+        breaker.clock.now = 19.9
+        assert not breaker.allow_request()
+        breaker.clock.now = 20.0
+        assert breaker.allow_request()
+        assert not breaker.allow_request()
+        assert breaker.state == HALF_OPEN
+        assert breaker.events == [OPEN, HALF_OPEN]
+
+    def test_probe_success_closes(self, breaker):
+        for _ in range(3):
+            breaker.record_failure()
+        breaker.clock.now = 10.0
+        assert breaker.allow_request()
+        breaker.record_success()
+        assert breaker.state == CLOSED and breaker.fail_count == 0
+        assert breaker.allow_request()
+        assert breaker.events == [OPEN, HALF_OPEN, CLOSED]
+
+    def test_probe_failure_reopens(self, breaker):
+        for _ in range(3):
+            breaker.record_failure()
+        breaker.clock.now = 10.0
+        assert breaker.allow_request()
+        breaker.record_failure()
+        assert breaker.state == OPEN and breaker.opened_at == 10.0
+        breaker.clock.now = 19.9
+        assert not breaker.allow_request()
+        assert breaker.events == [OPEN, HALF_OPEN, OPEN]
+
+    def test_call_rejects_while_open(self, breaker):
+        def fail():
+            raise ValueError("boom")
+
+        for _ in range(3):
+            with pytest.raises(ValueError):
+                breaker.call(fail)
+        with pytest.raises(CircuitOpenError):
+            breaker.call(lambda: 1)
+        breaker.clock.now = 10.0
+        assert breaker.call(lambda: 42) == 42
+        assert breaker.state == CLOSED
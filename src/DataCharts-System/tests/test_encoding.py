@@ -0,0 +1,48 @@
+# -*- coding: utf-8 -*-
+"""
+文件编码检测测试
+
+BOM、UTF-8、GB18030的检测与按修改时间和大小失效的检测缓存
+"""
+
+import codecs
+import os
+import sys
+
+import pytest
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'desktop', 'src'))
+
+from utils import encoding
+
+
+class TestSniffEncoding:
+    """sniff_encoding 的BOM、UTF-8与回退检测"""
+
+    @pytest.mark.parametrize('bom, name', [
+        (codecs.BOM_UTF32_LE, 'utf-32'),
+        (codecs.BOM_UTF32_BE, 'utf-32'),
+        (codecs.BOM_UTF8, 'utf-8-sig'),
+        (codecs.BOM_UTF16_LE, 'utf-16'),
+        (codecs.BOM_UTF16_BE, 'utf-16'),
+    ])
+    def test_bom(self, bom, name):
+        assert encoding.sniff_encoding(bom + b'1,2\n') == name
+
+    def test_utf8_with_truncated_tail(self):
+        raw = "数值,标签\n1,二\n".encode('utf-8')
+        assert encoding.sniff_encoding(raw) == 'utf-8'
+        # 采样在多字节字符中间截断时仍判断为UTF-8
+        assert encoding.sniff_encoding(raw[:-2]) == 'utf-8'
+
+    def test_gbk_text_decodes(self):
+        text = "时间,温度,湿度\n" + "2024年1月1日,12.5,百分之六十\n" * 20
+        raw = text.encode('gb18030')
+        assert raw.decode(encoding.sniff_encoding(raw)) == text
+
+    def test_detect_encoding_cached_by_mtime_and_size(self, tmp_path):
+        path = tmp_path / 'data.csv'
+        path.write_bytes("a\n1\n".encode('utf-8'))
+        assert encoding.detect_encoding(str(path)) == 'utf-8'
+        path.write_bytes(codecs.BOM_UTF8 + "a\n1\n".encode('utf-8'))
+        assert encoding.detect_encoding(str(path)) == 'utf-8-sig'
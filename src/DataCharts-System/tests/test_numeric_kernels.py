@@ -0,0 +1,224 @@
+# -*- coding: utf-8 -*-
+"""
+数值计算内核测试
+
+各加速实现与其替换的NumPy/pandas表达式逐元素比较，覆盖NaN、Inf和大偏移量输入
+"""
+
+import os
+import sys
+
+import numpy as np
+import pandas as pd
+import pytest
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'shared'))
+
+from algorithms import numeric_kernels
+
+
+def _sample(n, kind, seed=0):
+    """生成测试数据：plain为[0,1)随机数，nan/inf在中间插入一个非有限值，big叠加1e12偏移"""
+    x = np.random.default_rng(seed).random(n)
+    if kind == 'nan':
+        x[n // 2] = np.nan
+    elif kind == 'inf':
+        x[n // 3] = np.inf
+    elif kind == 'big':
+        x += 1e12
+    return x
+
+
+KINDS = ['plain', 'nan', 'inf', 'big']
+
+
+def assert_same(actual, expected):
+    actual = np.asarray(actual, dtype=float)
+    expected = np.asarray(expected, dtype=float)
+    assert actual.shape == expected.shape
+    np.testing.assert_allclose(actual, expected, rtol=1e-12, atol=0, equal_nan=True)
+
+
+class TestBoxFilter:
+    """box_filter 与 np.convolve(x, np.ones(N)/N, mode='same') 一致"""
+
+    @pytest.mark.parametrize('kind', KINDS)
+    @pytest.mark.parametrize('window', [1, 2, 3, 5, 8])
+    def test_matches_convolve(self, kind, window):
+        x = _sample(20, kind)
+        assert_same(numeric_kernels.box_filter(x, window),
+                    np.convolve(x, np.ones(window) / window, mode='same'))
+
+    def test_nan_stays_local(self):
+        x = _sample(20, 'nan')
+        result = numeric_kernels.box_filter(x, 5)
+        expected = np.convolve(x, np.ones(5) / 5, mode='same')
+        assert np.isnan(result).sum() == np.isnan(expected).sum()
+
+    def test_window_longer_than_data(self):
+        x = _sample(3, 'plain')
+        assert_same(numeric_kernels.box_filter(x, 5), np.convolve(x, np.ones(5) / 5, mode='same'))
+
+
+# 超过 PARALLEL_THRESHOLD，覆盖并行内核路径
+LARGE = numeric_kernels.PARALLEL_THRESHOLD * 2
+
+
+class TestStandardize:
+    """standardize 与 (x - np.mean(x)) / np.std(x) 一致"""
+
+    @pytest.mark.parametrize('kind', KINDS)
+    @pytest.mark.parametrize('n', [50, LARGE])
+    def test_matches_numpy(self, kind, n):
+        x = _sample(n, kind)
+        with np.errstate(invalid='ignore'):
+            expected = (x - np.mean(x)) / np.std(x)
+            assert_same(numeric_kernels.standardize(x), expected)
+
+    @pytest.mark.parametrize('n', [50, LARGE])
+    def test_constant_returns_input(self, n):
+        x = np.full(n, 3.0)
+        assert_same(numeric_kernels.standardize(x), x)
+
+
+class TestNormalize:
+    """normalize 与 (x - np.min(x)) / (np.max(x) - np.min(x)) 一致"""
+
+    @pytest.mark.parametrize('kind', KINDS)
+    @pytest.mark.parametrize('n', [50, LARGE])
+    def test_matches_numpy(self, kind, n):
+        x = _sample(n, kind)
+        with np.errstate(invalid='ignore'):
+            expected = (x - np.min(x)) / (np.max(x) - np.min(x))
+            assert_same(numeric_kernels.normalize(x), expected)
+
+
+class TestZscore:
+    """zscore 与直接求值 (x - np.mean(x)) / np.std(x) 一致，标准差为0时同样得到NaN"""
+
+    @pytest.mark.parametrize('kind', KINDS)
+    @pytest.mark.parametrize('n', [50, LARGE])
+    def test_matches_numpy(self, kind, n):
+        x = _sample(n, kind)
+        with np.errstate(invalid='ignore'):
+            expected = (x - np.mean(x)) / np.std(x)
+            assert_same(numeric_kernels.zscore(x), expected)
+
+    def test_constant_gives_nan(self):
+        x = np.full(LARGE, 3.0)
+        with np.errstate(invalid='ignore'):
+            assert np.isnan(numeric_kernels.zscore(x)).all()
+
+
+class TestMinMaxNormalize:
+    """min_max_normalize 与直接求值 (x - np.min(x)) / (np.max(x) - np.min(x)) 一致"""
+
+    @pytest.mark.parametrize('kind', KINDS)
+    @pytest.mark.parametrize('n', [50, LARGE])
+    def test_matches_numpy(self, kind, n):
+        x = _sample(n, kind)
+        with np.errstate(invalid='ignore'):
+            expected = (x - np.min(x)) / (np.max(x) - np.min(x))
+            assert_same(numeric_kernels.min_max_normalize(x), expected)
+
+
+# 函数模板（参数已填为数值）及不应被匹配的表达式
+TEMPLATE_EXPRESSIONS = [
+    'np.sqrt(x)',
+    'np.abs(x)',
+    '(x - np.mean(x)) / np.std(x)',
+    '(x - np.min(x)) / (np.max(x) - np.min(x))',
+    '2 * np.sin(3 * x + 1)',
+    'np.cos(x - 0.5) * -1.5',
+    "np.convolve(x, np.ones(5)/5, mode='same')",
+    "np.convolve(x, np.ones(3)/3, mode='same')",
+]
+
+NON_TEMPLATE_EXPRESSIONS = [
+    'np.diff(x)',
+    'np.sin(x) + 1',
+    "np.convolve(x, np.ones(5)/4, mode='same')",
+    "np.convolve(x, np.ones(5)/5, mode='valid')",
+]
+
+
+class TestTemplateKernels:
+    """模板加速实现与直接求值表达式的结果一致"""
+
+    @pytest.mark.parametrize('kind', KINDS)
+    @pytest.mark.parametrize('n', [50, LARGE])
+    @pytest.mark.parametrize('expression', TEMPLATE_EXPRESSIONS)
+    def test_matches_eval(self, expression, n, kind):
+        kernel = numeric_kernels.match_template_kernel(expression)
+        assert kernel is not None
+        x = _sample(n, kind)
+        with np.errstate(invalid='ignore'):
+            expected = eval(expression, {'np': np}, {'x': x})
+            assert_same(kernel(x), expected)
+
+    @pytest.mark.parametrize('expression', NON_TEMPLATE_EXPRESSIONS)
+    def test_other_expressions_not_matched(self, expression):
+        assert numeric_kernels.match_template_kernel(expression) is None
+
+
+class TestMovingAverage:
+    """moving_average 与 pd.Series(x).rolling(window, center=True).mean().bfill().ffill() 一致"""
+
+    @pytest.mark.parametrize('kind', KINDS)
+    @pytest.mark.parametrize('window', [1, 2, 3, 5, 8])
+    def test_matches_pandas(self, kind, window):
+        x = _sample(20, kind)
+        expected = pd.Series(x).rolling(window, center=True).mean().bfill().ffill().to_numpy()
+        assert_same(numeric_kernels.moving_average(x, window), expected)
+
+    def test_window_longer_than_data(self):
+        x = _sample(3, 'plain')
+        expected = pd.Series(x).rolling(5, center=True).mean().bfill().ffill().to_numpy()
+        assert_same(numeric_kernels.moving_average(x, 5), expected)
+
+
+class TestRollingSum:
+    """rolling_sum 与 pd.Series(x).rolling(window).sum().fillna(0) 一致"""
+
+    @pytest.mark.parametrize('kind', KINDS)
+    @pytest.mark.parametrize('window', [1, 2, 3, 5, 8])
+    def test_matches_pandas(self, kind, window):
+        x = _sample(20, kind)
+        expected = pd.Series(x).rolling(window).sum().fillna(0).to_numpy()
+        assert_same(numeric_kernels.rolling_sum(x, window), expected)
+
+    def test_inf_window_is_zero(self):
+        x = np.arange(10.0)
+        x[3] = np.inf
+        expected = pd.Series(x).rolling(5).sum().fillna(0).to_numpy()
+        assert_same(numeric_kernels.rolling_sum(x, 5), expected)
+        assert not np.isinf(numeric_kernels.rolling_sum(x, 5)).any()
+
+    def test_window_longer_than_data(self):
+        x = _sample(3, 'plain')
+        assert_same(numeric_kernels.rolling_sum(x, 5), np.zeros(3))
+
+
+class TestParallelSqrtAbs:
+    """parallel_sqrt / parallel_abs 与 np.sqrt / np.abs 一致"""
+
+    @pytest.mark.parametrize('kind', KINDS)
+    @pytest.mark.parametrize('n', [50, LARGE])
+    def test_matches_numpy(self, kind, n):
+        x = _sample(n, kind) - 0.5
+        with np.errstate(invalid='ignore'):
+            assert_same(numeric_kernels.parallel_sqrt(x), np.sqrt(x))
+        assert_same(numeric_kernels.parallel_abs(x), np.abs(x))
+
+
+class TestParallelTrig:
+    """parallel_trig 与 a * np.sin/np.cos(b * x + c) 一致"""
+
+    @pytest.mark.parametrize('func', ['sin', 'cos'])
+    @pytest.mark.parametrize('kind', KINDS)
+    @pytest.mark.parametrize('n', [50, LARGE])
+    def test_matches_numpy(self, func, kind, n):
+        x = _sample(n, kind)
+        with np.errstate(invalid='ignore'):
+            expected = 2.0 * getattr(np, func)(3.0 * x + 1.0)
+            assert_same(numeric_kernels.parallel_trig(x, func, 2.0, 3.0, 1.0), expected)
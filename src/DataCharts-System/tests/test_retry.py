@@ -0,0 +1,96 @@
+# -*- coding: utf-8 -*-
+"""
+重试机制测试
+
+call_with_retry 的尝试次数、等待时间与异常传播，等待函数由测试注入
+"""
+
+import os
+import random
+import sys
+
+import pytest
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'shared'))
+
+from reliability import backoff_delay, call_with_retry, retry
+
+
+class TestCallWithRetry:
+    """call_with_retry 的重试次数、等待时间与结果传播"""
+
+    def test_success_does_not_sleep(self):
+        sleeps = []
+        assert call_with_retry(lambda: 'ok', sleep=sleeps.append) == 'ok'
+        assert sleeps == []
+
+    def test_retries_listed_exceptions_then_succeeds(self):
+        attempts = []
+        sleeps = []
+
+        def flaky():
+            attempts.append(1)
+            if len(attempts) < 3:
+                raise ConnectionError()
+            return 'ok'
+
+        assert call_with_retry(flaky, max_attempts=5, retry_on=(ConnectionError,), sleep=sleeps.append) == 'ok'
+        assert len(attempts) == 3
+        assert len(sleeps) == 2
+
+    def test_raises_last_exception_when_exhausted(self):
+        attempts = []
+        sleeps = []
+
+        def down():
+            attempts.append(1)
+            raise ConnectionError(len(attempts))
+
+        with pytest.raises(ConnectionError) as info:
+            call_with_retry(down, max_attempts=3, retry_on=(ConnectionError,), sleep=sleeps.append)
+        assert info.value.args == (3,)
+        assert len(sleeps) == 2
+
+    def test_other_exceptions_propagate_immediately(self):
+        attempts = []
+
+        def broken():
+            attempts.append(1)
+            raise KeyError()
+
+        with pytest.raises(KeyError):
+            call_with_retry(broken, retry_on=(ConnectionError,), sleep=lambda s: None)
+        assert len(attempts) == 1
+
+    def test_retry_if_returns_last_result_when_exhausted(self):
+        results = iter([503, 503, 503])
+        sleeps = []
+        assert call_with_retry(lambda: next(results), max_attempts=3,
+                               retry_if=lambda r: r >= 500, sleep=sleeps.append) == 503
+        assert len(sleeps) == 2
+
+    def test_delay_hint_overrides_backoff_and_is_capped(self):
+        results = iter([429, 429, 200])
+        sleeps = []
+        call_with_retry(lambda: next(results), cap=5.0, retry_if=lambda r: r != 200,
+                        delay_hint=lambda r: 30.0, sleep=sleeps.append)
+        assert sleeps == [5.0, 5.0]
+
+    def test_backoff_delay_bounds(self):
+        random.seed(0)
+        for attempt in range(8):
+            for _ in range(50):
+                assert 0 <= backoff_delay(attempt, base=0.1, cap=2.0) <= min(2.0, 0.1 * 2 ** attempt)
+
+    def test_decorator(self):
+        attempts = []
+
+        @retry(max_attempts=2, base=0.0, retry_on=(ConnectionError,))
+        def flaky(value):
+            attempts.append(value)
+            if len(attempts) == 1:
+                raise ConnectionError()
+            return value * 2
+
+        assert flaky(21) == 42
+        assert attempts == [21, 21]
@@ -0,0 +1,59 @@
+# -*- coding: utf-8 -*-
+"""
+安全执行环境超时处理测试
+
+SIGALRM处理器为进程级资源，检查原处理器的转调与其他代码定时器的恢复
+"""
+
+import os
+import signal
+import sys
+
+import pytest
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'shared'))
+
+from algorithms import safe_executor
+from algorithms.safe_executor import ExecutionTimeoutError, SafeExecutionEnvironment
+
+pytestmark = pytest.mark.skipif(not hasattr(signal, 'SIGALRM'), reason="需要SIGALRM")
+
+
+@pytest.fixture
+def recorded_handler():
+    """安装一个记录调用的SIGALRM处理器，测试结束后恢复原处理器与定时器"""
+    calls = []
+    original = signal.signal(signal.SIGALRM, lambda signum, frame: calls.append(signum))
+    try:
+        yield calls
+    finally:
+        signal.alarm(0)
+        signal.signal(signal.SIGALRM, original)
+        safe_executor._previous_alarm_handler = None
+
+
+class TestTimeoutHandler:
+    """timeout_handler 的信号处理"""
+
+    def test_own_alarm_raises_timeout(self, recorded_handler):
+        env = SafeExecutionEnvironment()
+        with pytest.raises(ExecutionTimeoutError):
+            with env.timeout_handler(5):
+                signal.raise_signal(signal.SIGALRM)
+        assert recorded_handler == []
+
+    def test_foreign_alarm_chains_to_previous_handler(self, recorded_handler):
+        env = SafeExecutionEnvironment()
+        with env.timeout_handler(5):
+            pass
+        assert signal.getsignal(signal.SIGALRM) is safe_executor._alarm_callback
+
+        signal.raise_signal(signal.SIGALRM)
+        assert recorded_handler == [signal.SIGALRM]
+
+    def test_foreign_timer_is_restored(self, recorded_handler):
+        env = SafeExecutionEnvironment()
+        signal.alarm(100)
+        with env.timeout_handler(5):
+            pass
+        assert 95 <= signal.alarm(0) <= 100
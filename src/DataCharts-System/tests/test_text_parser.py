@@ -0,0 +1,66 @@
+# -*- coding: utf-8 -*-
+"""
+文本数值解析测试
+
+parse_float_lines 与逐行float()逐位一致，无法精确解析时返回None
+"""
+
+import os
+import sys
+
+import numpy as np
+import pytest
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'desktop', 'src'))
+
+from utils import text_parser
+
+
+def _float_lines(text):
+    """text_parser替换的逐行转换"""
+    return np.array([float(line) for line in text.splitlines() if line.strip()], dtype=np.float64)
+
+
+@pytest.mark.skipif(not text_parser.NUMBA_AVAILABLE, reason="需要Numba")
+class TestParseFloatLines:
+    """parse_float_lines 与逐行float()逐位一致，无法精确解析时返回None"""
+
+    @pytest.mark.parametrize('text', [
+        "1\n2\n3\n",
+        "1.5\n-2.25\n+3\n",
+        "  4.0  \n\n\t5e3\r\n6E-2\n",
+        "0.1\n0.2\n0.3",
+        ".5\n5.\n-0.0\n",
+        "123456789012345\n1e22\n1e-22\n",
+    ])
+    def test_matches_float(self, text):
+        result = text_parser.parse_float_lines(text.encode('ascii'))
+        expected = _float_lines(text)
+        assert result is not None
+        assert result.tobytes() == expected.tobytes()
+
+    @pytest.mark.parametrize('fmt', ['%.6f', '%.10g', '%.15g', '%.3e'])
+    def test_random_values_bit_identical(self, fmt):
+        values = np.random.default_rng(1).normal(scale=1e4, size=2000)
+        text = "\n".join(fmt % v for v in values)
+        result = text_parser.parse_float_lines(text.encode('ascii'))
+        assert result is not None
+        assert result.tobytes() == _float_lines(text).tobytes()
+
+    @pytest.mark.parametrize('text', [
+        "abc\n",
+        "1.2.3\n",
+        "1e\n",
+        "-\n",
+        "nan\n",
+        "1 2\n",
+        "12345678901234567890\n",
+        "1e23\n",
+        "1e-400\n",
+    ])
+    def test_unparseable_returns_none(self, text):
+        assert text_parser.parse_float_lines(text.encode('ascii')) is None
+
+    def test_empty(self):
+        assert text_parser.parse_float_lines(b"").size == 0
+        assert text_parser.parse_float_lines(b"\n \n").size == 0